@@ -1,13 +1,33 @@
-﻿import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import random
-import json
-from typing import Dict, List, Optional
+﻿import sys
 import time
 
+# Cold-start timing covers everything from here: this script's imports, then its first run
+rerun_started = time.perf_counter()
+cold_start = 'tasksphere.store' not in sys.modules
+
+import streamlit as st
+import os
+from typing import Dict, List, Optional
+
+from tasksphere.backup import DEFAULT_BACKUP_INTERVAL, BackupJob, default_backup_dir
+from tasksphere.cards import CardCache, join_cards
+from tasksphere.events import EventBus, SocketFanout
+from tasksphere.exporter import EXPORT_KINDS, MIME_TYPES, available_formats, export_bytes, export_file_name
+from tasksphere.figure_cache import FigureCache
+from tasksphere.filters import TASK_SORT_KEYS, TaskFilter
+from tasksphere.importer import IMPORT_KINDS, detect_format, import_stream
+from tasksphere.pagination import DEFAULT_PAGE_SIZE, PAGE_SIZE_OPTIONS, Page, paginate
+from tasksphere.profiling import PeriodicExporter, export_stats, lazy_import, profiler, prometheus_text, span, timed
+from tasksphere.scheduler import OVERDUE, DueDateScheduler
+from tasksphere.schemas import TASK_PRIORITIES, TASK_STATUSES
+from tasksphere.settings import SESSION_TIMEOUTS, SETTING_CHOICES, Settings, SettingsStore, default_settings_path
+from tasksphere.store import DEFAULT_DB_PATH, DuplicateNameError, StaleRecordError, WorkspaceStore
+from tasksphere.theme import publish_theme_assets, theme_asset
+
+# pandas, plotly and the chart builders are imported by the sections that use them
+if cold_start:
+    profiler.record("startup.imports", time.perf_counter() - rerun_started)
+
 # Page Configuration
 st.set_page_config(
     page_title="TaskSphere - Project Management Platform",
@@ -16,524 +36,186 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for Modern Professional Design
-st.markdown("""
-<style>
-    /* Modern Professional Theme - Blue & White */
-    .stApp {
-        background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-        color: #1e293b;
-    }
-    
-    /* Main Header */
-    .main-header {
-        font-size: 3.5rem;
-        font-weight: 800;
-        text-align: center;
-        background: linear-gradient(135deg, #2563eb 0%, #1d4ed8 50%, #3b82f6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-        letter-spacing: -0.02em;
-        text-shadow: 0 0 30px rgba(37, 99, 235, 0.3);
-    }
-    
-    .sub-header {
-        font-size: 1.3rem;
-        font-weight: 400;
-        text-align: center;
-        color: #64748b;
-        margin-bottom: 2rem;
-        line-height: 1.6;
-    }
-    
-    .section-header {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #1e293b;
-        margin-top: 2rem;
-        margin-bottom: 1.5rem;
-        text-align: center;
-        background: linear-gradient(90deg, #2563eb, #3b82f6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    
-    /* Professional Cards */
-    .metric-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 2rem;
-        border-radius: 20px;
-        box-shadow: 0 10px 30px rgba(37, 99, 235, 0.1);
-        text-align: center;
-        margin: 1rem;
-        border: 2px solid #e2e8f0;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 40px rgba(37, 99, 235, 0.2);
-        border-color: #2563eb;
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #2563eb, #3b82f6, #1d4ed8);
-    }
-    
-    .metric-number {
-        font-size: 3rem;
-        font-weight: 800;
-        background: linear-gradient(135deg, #2563eb 0%, #3b82f6 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-label {
-        font-size: 1.1rem;
-        color: #64748b;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .metric-subtitle {
-        font-size: 0.9rem;
-        color: #94a3b8;
-        margin-top: 0.5rem;
-    }
-    
-    /* Project Cards */
-    .project-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 8px 25px rgba(37, 99, 235, 0.1);
-        margin: 1rem 0;
-        border: 2px solid #e2e8f0;
-        transition: all 0.3s ease;
-        position: relative;
-    }
-    
-    .project-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 15px 35px rgba(37, 99, 235, 0.2);
-        border-color: #2563eb;
-    }
-    
-    .project-title {
-        font-size: 1.3rem;
-        font-weight: 700;
-        color: #1e293b;
-        margin-bottom: 0.5rem;
-    }
-    
-    .project-description {
-        color: #64748b;
-        margin-bottom: 1rem;
-        line-height: 1.5;
-    }
-    
-    .project-status {
-        display: inline-block;
-        padding: 0.3rem 0.8rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .status-active {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-    }
-    
-    .status-completed {
-        background: linear-gradient(135deg, #3b82f6, #2563eb);
-        color: white;
-    }
-    
-    .status-pending {
-        background: linear-gradient(135deg, #f59e0b, #d97706);
-        color: white;
-    }
-    
-    /* Task Cards */
-    .task-card {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 1.2rem;
-        border-radius: 12px;
-        box-shadow: 0 6px 20px rgba(37, 99, 235, 0.08);
-        margin: 0.8rem 0;
-        border: 1px solid #e2e8f0;
-        transition: all 0.3s ease;
-    }
-    
-    .task-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 10px 25px rgba(37, 99, 235, 0.15);
-        border-color: #2563eb;
-    }
-    
-    .task-title {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #1e293b;
-        margin-bottom: 0.5rem;
-    }
-    
-    .task-priority {
-        display: inline-block;
-        padding: 0.2rem 0.6rem;
-        border-radius: 15px;
-        font-size: 0.7rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-right: 0.5rem;
-    }
-    
-    .priority-high {
-        background: linear-gradient(135deg, #ef4444, #dc2626);
-        color: white;
-    }
-    
-    .priority-medium {
-        background: linear-gradient(135deg, #f59e0b, #d97706);
-        color: white;
-    }
-    
-    .priority-low {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-    }
-    
-    /* Progress Bars */
-    .progress-container {
-        background: #e2e8f0;
-        border-radius: 10px;
-        height: 8px;
-        margin: 1rem 0;
-        overflow: hidden;
-    }
-    
-    .progress-bar {
-        background: linear-gradient(90deg, #2563eb, #3b82f6);
-        height: 100%;
-        border-radius: 10px;
-        transition: width 0.5s ease;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #2563eb 0%, #3b82f6 100%);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        box-shadow: 0 4px 15px rgba(37, 99, 235, 0.3);
-        font-weight: 600;
-        padding: 0.5rem 1rem;
-        font-size: 1rem;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        box-shadow: 0 6px 20px rgba(37, 99, 235, 0.4);
-        transform: translateY(-2px);
-    }
-    
-    /* Sidebar */
-    .stSidebar {
-        background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
-    }
-    
-    .stSidebar .stSelectbox > div > div {
-        background-color: #ffffff;
-        color: #1e293b;
-        border: 2px solid #2563eb;
-        border-radius: 8px;
-    }
-    
-    .stSidebar .stSelectbox label {
-        color: #ffffff;
-        font-weight: 600;
-    }
-    
-    /* Form Elements */
-    .stTextInput > div > div > input {
-        background-color: #ffffff;
-        color: #1e293b;
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 8px;
-    }
-    
-    .stTextInput label {
-        color: #1e293b;
-        font-weight: 600;
-    }
-    
-    .stTextArea > div > div > textarea {
-        background-color: #ffffff;
-        color: #1e293b;
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 8px;
-    }
-    
-    .stTextArea label {
-        color: #1e293b;
-        font-weight: 600;
-    }
-    
-    .stDateInput > div > div > input {
-        background-color: #ffffff;
-        color: #1e293b;
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 8px;
-    }
-    
-    .stDateInput label {
-        color: #1e293b;
-        font-weight: 600;
-    }
-    
-    /* Success/Error Messages */
-    .stSuccess {
-        background-color: #f0fdf4;
-        color: #166534;
-        border: 1px solid #10b981;
-        border-radius: 8px;
-    }
-    
-    .stError {
-        background-color: #fef2f2;
-        color: #dc2626;
-        border: 1px solid #ef4444;
-        border-radius: 8px;
-    }
-    
-    .stWarning {
-        background-color: #fffbeb;
-        color: #d97706;
-        border: 1px solid #f59e0b;
-        border-radius: 8px;
-    }
-    
-    .stInfo {
-        background-color: #eff6ff;
-        color: #2563eb;
-        border: 1px solid #3b82f6;
-        border-radius: 8px;
-    }
-    
-    /* Charts */
-    .chart-container {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 8px 25px rgba(37, 99, 235, 0.1);
-        border: 2px solid #e2e8f0;
-        margin: 1rem 0;
-    }
-    
-    /* Team Section */
-    .team-member {
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        padding: 1rem;
-        border-radius: 12px;
-        box-shadow: 0 6px 20px rgba(37, 99, 235, 0.08);
-        margin: 0.5rem;
-        border: 1px solid #e2e8f0;
-        text-align: center;
-        transition: all 0.3s ease;
-    }
-    
-    .team-member:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 25px rgba(37, 99, 235, 0.15);
-    }
-    
-    .member-avatar {
-        width: 60px;
-        height: 60px;
-        border-radius: 50%;
-        background: linear-gradient(135deg, #2563eb, #3b82f6);
-        color: white;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.5rem;
-        font-weight: 700;
-        margin: 0 auto 0.5rem;
-    }
-    
-    .member-name {
-        font-weight: 600;
-        color: #1e293b;
-        margin-bottom: 0.2rem;
-    }
-    
-    .member-role {
-        font-size: 0.8rem;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Workspace settings, read once per process and shared by every session
+SETTINGS_FILE = os.environ.get("TASKSPHERE_SETTINGS") or default_settings_path(DEFAULT_DB_PATH)
 
-# Initialize session state
-if 'projects' not in st.session_state:
-    st.session_state.projects = []
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
-if 'team_members' not in st.session_state:
-    st.session_state.team_members = []
-
-# Sample data for demonstration
-def initialize_sample_data():
-    if not st.session_state.projects:
-        st.session_state.projects = [
-            {
-                'id': 1,
-                'name': 'E-Commerce Platform',
-                'description': 'Build a modern e-commerce platform with React and Node.js',
-                'status': 'Active',
-                'progress': 75,
-                'start_date': '2024-01-15',
-                'end_date': '2024-03-15',
-                'team_size': 5,
-                'budget': 50000
-            },
-            {
-                'id': 2,
-                'name': 'Mobile App Development',
-                'description': 'Create a cross-platform mobile app using React Native',
-                'status': 'Active',
-                'progress': 45,
-                'start_date': '2024-02-01',
-                'end_date': '2024-04-30',
-                'team_size': 3,
-                'budget': 35000
-            },
-            {
-                'id': 3,
-                'name': 'Data Analytics Dashboard',
-                'description': 'Develop a comprehensive analytics dashboard with real-time data',
-                'status': 'Completed',
-                'progress': 100,
-                'start_date': '2023-11-01',
-                'end_date': '2024-01-31',
-                'team_size': 4,
-                'budget': 25000
-            }
-        ]
-    
-    if not st.session_state.tasks:
-        st.session_state.tasks = [
-            {
-                'id': 1,
-                'title': 'Design User Interface',
-                'project': 'E-Commerce Platform',
-                'assignee': 'John Doe',
-                'priority': 'High',
-                'status': 'In Progress',
-                'due_date': '2024-02-15',
-                'description': 'Create wireframes and mockups for the e-commerce platform'
-            },
-            {
-                'id': 2,
-                'title': 'Setup Database Schema',
-                'project': 'E-Commerce Platform',
-                'assignee': 'Jane Smith',
-                'priority': 'High',
-                'status': 'Completed',
-                'due_date': '2024-01-30',
-                'description': 'Design and implement the database structure'
-            },
-            {
-                'id': 3,
-                'title': 'Implement Authentication',
-                'project': 'Mobile App Development',
-                'assignee': 'Mike Johnson',
-                'priority': 'Medium',
-                'status': 'Pending',
-                'due_date': '2024-02-20',
-                'description': 'Add user authentication and authorization'
-            },
-            {
-                'id': 4,
-                'title': 'API Integration',
-                'project': 'Data Analytics Dashboard',
-                'assignee': 'Sarah Wilson',
-                'priority': 'Low',
-                'status': 'Completed',
-                'due_date': '2024-01-15',
-                'description': 'Connect dashboard to various data sources'
-            }
-        ]
-    
-    if not st.session_state.team_members:
-        st.session_state.team_members = [
-            {'name': 'John Doe', 'role': 'Frontend Developer', 'avatar': 'JD'},
-            {'name': 'Jane Smith', 'role': 'Backend Developer', 'avatar': 'JS'},
-            {'name': 'Mike Johnson', 'role': 'Mobile Developer', 'avatar': 'MJ'},
-            {'name': 'Sarah Wilson', 'role': 'Data Analyst', 'avatar': 'SW'},
-            {'name': 'David Brown', 'role': 'Project Manager', 'avatar': 'DB'}
-        ]
-
-# Initialize sample data
-initialize_sample_data()
+@st.cache_resource
+def get_settings_store() -> SettingsStore:
+    return SettingsStore(SETTINGS_FILE)
 
-# Sidebar Navigation
-st.sidebar.markdown("## ðŸš€ TaskSphere")
-st.sidebar.markdown("---")
+settings_store = get_settings_store()
+settings = settings_store.current
 
-page = st.sidebar.selectbox(
-    "Navigate",
-    ["ðŸ“Š Dashboard", "ðŸ“ Projects", "âœ… Tasks", "ðŸ‘¥ Team", "ðŸ“ˆ Analytics", "âš™ï¸ Settings"]
-)
+# Theme stylesheets are minified and hashed once per process. With static serving on (see
+# .streamlit/config.toml) a rerun sends only a <link> to the browser-cached file; otherwise
+# the minified stylesheet is inlined
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
-# Dashboard Page
-if page == "ðŸ“Š Dashboard":
-    st.markdown('<h1 class="main-header">TaskSphere</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">Professional Project Management Platform</p>', unsafe_allow_html=True)
-    
-    # Key Metrics
+@st.cache_resource
+def get_static_themes() -> bool:
+    return bool(st.get_option("server.enableStaticServing")) and publish_theme_assets(STATIC_DIR)
+
+theme = theme_asset(settings.theme)
+st.markdown(theme.link() if get_static_themes() else theme.inline(), unsafe_allow_html=True)
+
+# Shared workspace store (one per server process, reused by every session)
+@st.cache_resource
+def get_store() -> WorkspaceStore:
+    with span("store.open"):
+        store = WorkspaceStore(DEFAULT_DB_PATH)
+        store.seed_sample_data()
+    return store
+
+store = get_store()
+
+# Optional columnar copy of the tasks for vectorised analytics (TASKSPHERE_ANALYTICS_BACKEND=columnar)
+ANALYTICS_BACKEND = os.environ.get("TASKSPHERE_ANALYTICS_BACKEND", "store")
+
+@st.cache_resource
+def get_analytics_tasks():
+    if ANALYTICS_BACKEND != "columnar":
+        return None
+    from tasksphere.columnar import ColumnarTasks
+    return ColumnarTasks.from_store(store)
+
+# Built figures are shared by all sessions and rebuilt only after the data they show changes
+@st.cache_resource
+def get_figure_cache() -> FigureCache:
+    return FigureCache()
+
+figure_cache = get_figure_cache()
+
+# Rendered card HTML, shared by all sessions and re-rendered only for records that changed
+@st.cache_resource
+def get_card_cache() -> CardCache:
+    return CardCache()
+
+card_cache = get_card_cache()
+
+# One st.markdown call per run of cards instead of one element per card
+def show_cards(cards: List[str]):
+    if cards:
+        st.markdown(join_cards(cards), unsafe_allow_html=True)
+
+# Span timings are written to TASKSPHERE_METRICS_FILE (.prom for Prometheus text, else JSON lines)
+METRICS_FILE = os.environ.get("TASKSPHERE_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("TASKSPHERE_METRICS_INTERVAL", "60"))
+
+@st.cache_resource
+def get_metrics_exporter() -> Optional[PeriodicExporter]:
+    if not METRICS_FILE:
+        return None
+    return PeriodicExporter(profiler, METRICS_FILE, METRICS_INTERVAL).start()
+
+get_metrics_exporter()
+
+# Change feed of every write in this process; TASKSPHERE_EVENTS_PORT also streams it to local sockets
+LIVE_REFRESH_SECONDS = float(os.environ.get("TASKSPHERE_LIVE_REFRESH", "5")) or None
+EVENTS_PORT = os.environ.get("TASKSPHERE_EVENTS_PORT")
+
+@st.cache_resource
+def get_event_bus() -> EventBus:
+    bus = EventBus()
+    store.add_listener(bus)
+    if EVENTS_PORT:
+        SocketFanout(bus, int(EVENTS_PORT))
+    return bus
+
+event_bus = get_event_bus()
+
+# Reminder and overdue engine; its worker thread sleeps until the next deadline
+@st.cache_resource
+def get_scheduler() -> DueDateScheduler:
+    return DueDateScheduler.from_store(store).start()
+
+scheduler = get_scheduler()
+
+# Incremental workspace snapshots, taken and pruned on a background thread
+BACKUP_DIR = os.environ.get("TASKSPHERE_BACKUP_DIR") or default_backup_dir(DEFAULT_DB_PATH)
+BACKUP_INTERVAL = float(os.environ.get("TASKSPHERE_BACKUP_INTERVAL", DEFAULT_BACKUP_INTERVAL))
+
+@st.cache_resource
+def get_backup_job() -> Optional[BackupJob]:
+    if DEFAULT_DB_PATH == ":memory:":
+        return None
+    return BackupJob(DEFAULT_DB_PATH, BACKUP_DIR, BACKUP_INTERVAL,
+                     settings.auto_backup, settings.retention_days, store=store).start()
+
+backup_job = get_backup_job()
+
+def analytics_task_counts(field: str) -> Dict[str, int]:
+    analytics_tasks = get_analytics_tasks()
+    if analytics_tasks is not None:
+        return analytics_tasks.counts(field)
+    return store.stats.task_counts(field)
+
+# Plotly serialisation is a large share of a chart's cost, so it is timed on its own
+def show_chart(figure):
+    if figure is not None:
+        with span("chart.render"):
+            st.plotly_chart(figure, use_container_width=True)
+
+# Page size and page number controls for the long lists; only the selected slice is fetched and rendered
+def pagination_controls(key: str, total: int) -> Page:
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        size = st.selectbox("Per page", PAGE_SIZE_OPTIONS, index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE), key=f"{key}_page_size")
+    page_key = f"{key}_page"
+    page_count = paginate(total, 1, size).page_count
+    st.session_state[page_key] = min(st.session_state.get(page_key, 1), page_count)
+    with col2:
+        number = st.number_input("Page", min_value=1, max_value=page_count, step=1, key=page_key)
+    page = paginate(total, number, size)
+    with col3:
+        st.caption(f"Showing {page.first_item}-{page.last_item} of {page.total} (page {page.number} of {page.page_count})")
+    return page
+
+# Filter and sort controls for the task list; the store answers them from its indexes
+def task_filter_controls() -> TaskFilter:
+    search = st.text_input("Search tasks", placeholder="Title, description, project or assignee", key="task_search")
+    with st.expander("Filter & Sort", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            projects = st.multiselect("Project", store.project_names(), key="filter_projects")
+            assignees = st.multiselect("Assignee", store.team_member_names(), key="filter_assignees")
+        with col2:
+            statuses = st.multiselect("Status", ["Pending", "In Progress", "Completed"], key="filter_statuses")
+            priorities = st.multiselect("Priority", ["High", "Medium", "Low"], key="filter_priorities")
+        with col3:
+            due_range = st.date_input("Due Date Range", value=(), key="filter_due_range")
+            sort_by = st.selectbox("Sort By", list(TASK_SORT_KEYS), key="filter_sort_by")
+    due_from = str(due_range[0]) if len(due_range) > 0 else None
+    due_to = str(due_range[1]) if len(due_range) > 1 else None
+    return TaskFilter(projects, assignees, statuses, priorities, due_from, due_to, sort_by, search)
+
+# Dashboard sections rerun on their own every LIVE_REFRESH_SECONDS, so other sessions' writes
+# show up without re-executing the whole script
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed("section.dashboard_metrics")
+def dashboard_metrics():
+    stats = store.stats
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">{len(st.session_state.projects)}</div>
+            <div class="metric-number">{stats.project_total}</div>
             <div class="metric-label">Total Projects</div>
-            <div class="metric-subtitle">{len([p for p in st.session_state.projects if p['status'] == 'Active'])} Active</div>
+            <div class="metric-subtitle">{stats.project_count('status', 'Active')} Active</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
         st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">{len(st.session_state.tasks)}</div>
+            <div class="metric-number">{stats.task_total}</div>
             <div class="metric-label">Total Tasks</div>
-            <div class="metric-subtitle">{len([t for t in st.session_state.tasks if t['status'] == 'Completed'])} Completed</div>
+            <div class="metric-subtitle">{stats.task_count('status', 'Completed')} Completed</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        completion_rate = (len([t for t in st.session_state.tasks if t['status'] == 'Completed']) / len(st.session_state.tasks) * 100) if st.session_state.tasks else 0
+        completion_rate = stats.completion_rate()
         st.markdown(f"""
         <div class="metric-card">
             <div class="metric-number">{completion_rate:.0f}%</div>
@@ -545,96 +227,78 @@ if page == "ðŸ“Š Dashboard":
     with col4:
         st.markdown(f"""
         <div class="metric-card">
-            <div class="metric-number">{len(st.session_state.team_members)}</div>
+            <div class="metric-number">{stats.member_total}</div>
             <div class="metric-label">Team Members</div>
             <div class="metric-subtitle">Active Contributors</div>
         </div>
         """, unsafe_allow_html=True)
-    
-    # Charts Section
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed("section.dashboard_charts")
+def dashboard_charts():
+    charts = lazy_import("tasksphere.charts")
     st.markdown('<h2 class="section-header">Project Overview</h2>', unsafe_allow_html=True)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Project Status Chart
-        status_counts = {}
-        for project in st.session_state.projects:
-            status = project['status']
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        if status_counts:
-            fig_status = px.pie(
-                values=list(status_counts.values()),
-                names=list(status_counts.keys()),
-                title="Project Status Distribution",
-                color_discrete_map={
-                    'Active': '#2563eb',
-                    'Completed': '#10b981',
-                    'Pending': '#f59e0b'
-                }
-            )
-            fig_status.update_layout(
-                title_font_size=16,
-                font=dict(size=12),
-                showlegend=True,
-                height=400
-            )
-            st.plotly_chart(fig_status, use_container_width=True)
+        fig_status = figure_cache.get_or_build(
+            'project_status', store.stats.project_version,
+            lambda: charts.project_status_pie(store.stats.project_counts('status'))
+        )
+        show_chart(fig_status)
     
     with col2:
         # Task Priority Chart
-        priority_counts = {}
-        for task in st.session_state.tasks:
-            priority = task['priority']
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-        
-        if priority_counts:
-            fig_priority = px.bar(
-                x=list(priority_counts.keys()),
-                y=list(priority_counts.values()),
-                title="Task Priority Distribution",
-                color=list(priority_counts.keys()),
-                color_discrete_map={
-                    'High': '#ef4444',
-                    'Medium': '#f59e0b',
-                    'Low': '#10b981'
-                }
-            )
-            fig_priority.update_layout(
-                title_font_size=16,
-                font=dict(size=12),
-                showlegend=False,
-                height=400,
-                xaxis_title="Priority Level",
-                yaxis_title="Number of Tasks"
-            )
-            st.plotly_chart(fig_priority, use_container_width=True)
-    
-    # Recent Projects
+        fig_priority = figure_cache.get_or_build(
+            'task_priority', store.stats.task_version,
+            lambda: charts.task_priority_bar(store.stats.task_counts('priority'))
+        )
+        show_chart(fig_priority)
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed("section.dashboard_recent_projects")
+def dashboard_recent_projects():
     st.markdown('<h2 class="section-header">Recent Projects</h2>', unsafe_allow_html=True)
     
-    for project in st.session_state.projects[:3]:
-        status_class = f"status-{project['status'].lower()}"
-        st.markdown(f"""
-        <div class="project-card">
-            <div class="project-title">{project['name']}</div>
-            <div class="project-description">{project['description']}</div>
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <span class="project-status {status_class}">{project['status']}</span>
-                <span style="color: #64748b; font-size: 0.9rem;">{project['progress']}% Complete</span>
-            </div>
-            <div class="progress-container">
-                <div class="progress-bar" style="width: {project['progress']}%"></div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Re-query only after a project write; other live refreshes reuse this session's rows
+    project_version = event_bus.version('project')
+    cached = st.session_state.get("recent_projects")
+    if cached is None or cached[0] != project_version:
+        cached = (project_version, store.list_projects(limit=3))
+        st.session_state["recent_projects"] = cached
+    weighted = st.session_state.get("weighted_progress", False)
+    show_cards([
+        card_cache.render('project', project, store.project_progress(project, weighted), False)
+        for project in cached[1]
+    ])
 
-# Projects Page
-elif page == "ðŸ“ Projects":
-    st.markdown('<h1 class="section-header">Project Management</h1>', unsafe_allow_html=True)
-    
-    # Add New Project
+def time_ago(timestamp: float) -> str:
+    seconds = int(time.time() - timestamp)
+    if seconds < 60:
+        return f"{seconds}s ago"
+    if seconds < 3600:
+        return f"{seconds // 60}m ago"
+    return f"{seconds // 3600}h ago"
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed("section.dashboard_activity")
+def dashboard_activity():
+    st.markdown('<h2 class="section-header">Recent Activity</h2>', unsafe_allow_html=True)
+    events = event_bus.recent(8)
+    if not events:
+        st.caption("No changes since the server started.")
+    for event in events:
+        fields = f" ({', '.join(event.fields)})" if event.fields else ""
+        st.markdown(f"**{event.kind.title()}** {event.label} {event.action}{fields} - {time_ago(event.timestamp)}")
+
+# Page sections are fragments: a widget inside one reruns only that section, not the whole
+# script. Forms still finish a successful write with a full st.rerun() so every section sees it.
+# Add New Project
+@st.fragment
+@timed("section.project_form")
+def project_form():
     with st.expander("âž• Add New Project", expanded=False):
         with st.form("add_project"):
             col1, col2 = st.columns(2)
@@ -652,7 +316,6 @@ elif page == "ðŸ“ Projects":
             
             if st.form_submit_button("Add Project"):
                 new_project = {
-                    'id': len(st.session_state.projects) + 1,
                     'name': project_name,
                     'description': project_description,
                     'status': project_status,
@@ -662,47 +325,77 @@ elif page == "ðŸ“ Projects":
                     'team_size': team_size,
                     'budget': budget
                 }
-                st.session_state.projects.append(new_project)
-                st.success("Project added successfully!")
-                st.rerun()
-    
-    # Display Projects
+                # Tasks pick their project by name; the store rejects a name another session already took
+                try:
+                    store.add_project(new_project)
+                except DuplicateNameError:
+                    st.error(f"A project named '{project_name}' already exists.")
+                else:
+                    st.success("Project added successfully!")
+                    st.rerun()
+
+# Display Projects
+@st.fragment
+@timed("section.project_list")
+def project_list():
     st.markdown('<h2 class="section-header">All Projects</h2>', unsafe_allow_html=True)
     
-    for project in st.session_state.projects:
-        status_class = f"status-{project['status'].lower()}"
-        st.markdown(f"""
-        <div class="project-card">
-            <div class="project-title">{project['name']}</div>
-            <div class="project-description">{project['description']}</div>
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                <span class="project-status {status_class}">{project['status']}</span>
-                <span style="color: #64748b; font-size: 0.9rem;">{project['progress']}% Complete</span>
-            </div>
-            <div class="progress-container">
-                <div class="progress-bar" style="width: {project['progress']}%"></div>
-            </div>
-            <div style="display: flex; justify-content: space-between; margin-top: 1rem; font-size: 0.9rem; color: #64748b;">
-                <span>ðŸ‘¥ {project['team_size']} members</span>
-                <span>ðŸ’° </span>
-                <span>ðŸ“… {project['start_date']} - {project['end_date']}</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    project_search = st.text_input("Search projects", placeholder="Name or description", key="project_search")
+    page = pagination_controls("projects", store.count_projects(search=project_search))
+    # Kept outside widget state so the Dashboard and Analytics pages see it after navigating away
+    weighted = st.toggle("Weight progress by task priority", value=st.session_state.get("weighted_progress", False),
+                         help="Progress is the share of a project's tasks that are completed; weighted, High counts 3x and Medium 2x a Low task.")
+    st.session_state["weighted_progress"] = weighted
+    show_cards([
+        card_cache.render('project', project, store.project_progress(project, weighted))
+        for project in store.list_projects(limit=page.size, offset=page.offset, search=project_search)
+    ])
 
-# Tasks Page
-elif page == "âœ… Tasks":
-    st.markdown('<h1 class="section-header">Task Management</h1>', unsafe_allow_html=True)
-    
-    # Add New Task
+# Project Timeline
+@st.fragment
+@timed("section.project_timeline")
+def project_timeline():
+    st.markdown('<h2 class="section-header">Project Timeline</h2>', unsafe_allow_html=True)
+
+    project_name = st.selectbox("Project", store.project_names(), key="timeline_project")
+    if project_name is None:
+        return
+    schedule = store.dependencies.schedule(store.keys.project_id(project_name))
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Tasks", len(schedule.order))
+    col2.metric("Critical Path Length", schedule.length)
+    col3.metric("Blocked Tasks", len(schedule.blocked))
+    if schedule.critical_path:
+        path = [store.get_task(task_id) for task_id in schedule.critical_path]
+        st.markdown("**Critical path:** " + " &rarr; ".join(f"{task['title']} (#{task['id']})" for task in path))
+    # Tasks in the order they can be worked on; only the first page is looked up
+    rows = []
+    for task_id in schedule.order[:DEFAULT_PAGE_SIZE]:
+        task = store.get_task(task_id)
+        rows.append({'ID': task_id, 'Task': task['title'], 'Status': task['status'],
+                     'Earliest Step': schedule.earliest_start[task_id] + 1,
+                     'Blocked': store.dependencies.is_blocked(task_id)})
+    if rows:
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+# Add New Task
+@st.fragment
+@timed("section.task_form")
+def task_form():
     with st.expander("âž• Add New Task", expanded=False):
         with st.form("add_task"):
             col1, col2 = st.columns(2)
             
             with col1:
                 task_title = st.text_input("Task Title")
-                task_project = st.selectbox("Project", [p['name'] for p in st.session_state.projects])
-                task_assignee = st.selectbox("Assignee", [m['name'] for m in st.session_state.team_members])
+                task_project = st.selectbox("Project", store.project_names())
+                member_names = store.team_member_names()
+                least_loaded = store.get_team_member(store.workload.least_loaded())
+                task_assignee = st.selectbox(
+                    "Assignee", member_names,
+                    index=member_names.index(least_loaded['name']) if least_loaded else 0,
+                    help="Defaults to the team member with the most spare capacity."
+                )
                 task_priority = st.selectbox("Priority", ["High", "Medium", "Low"])
             
             with col2:
@@ -712,7 +405,6 @@ elif page == "âœ… Tasks":
             
             if st.form_submit_button("Add Task"):
                 new_task = {
-                    'id': len(st.session_state.tasks) + 1,
                     'title': task_title,
                     'project': task_project,
                     'assignee': task_assignee,
@@ -721,37 +413,100 @@ elif page == "âœ… Tasks":
                     'due_date': str(task_due_date),
                     'description': task_description
                 }
-                st.session_state.tasks.append(new_task)
+                store.add_task(new_task)
                 st.success("Task added successfully!")
                 st.rerun()
-    
-    # Display Tasks
+
+# Update Task
+@st.fragment
+@timed("section.task_update_form")
+def task_update_form():
+    with st.expander("Update Task", expanded=False):
+        # The versions below must be those the form was rendered from, so they start over when
+        # another task is picked or the input comes back after leaving the page
+        if "edit_task_id" not in st.session_state:
+            st.session_state.pop("seen_task_versions", None)
+        edit_task_id = st.number_input("Task ID", min_value=1, step=1, key="edit_task_id",
+                                       on_change=lambda: st.session_state.pop("seen_task_versions", None))
+        edit_task = store.get_task(int(edit_task_id))
+        if edit_task is None:
+            st.info("No task with that ID.")
+        else:
+            # Saves are checked against the version the previous render showed, so a teammate's
+            # change in between is reported instead of silently overwritten; this render's
+            # version is what the next save is checked against
+            seen_versions = st.session_state.setdefault("seen_task_versions", {})
+            seen_version = seen_versions.get(edit_task['id'], edit_task['version'])
+            seen_versions[edit_task['id']] = edit_task['version']
+            with st.form(f"edit_task_{edit_task['id']}"):
+                st.markdown(f"**{edit_task['title']}**")
+                col1, col2 = st.columns(2)
+                with col1:
+                    edit_status = st.selectbox("Status", TASK_STATUSES,
+                                               index=TASK_STATUSES.index(edit_task['status']))
+                with col2:
+                    edit_priority = st.selectbox("Priority", TASK_PRIORITIES,
+                                                 index=TASK_PRIORITIES.index(edit_task['priority']))
+                if st.form_submit_button("Save Changes"):
+                    try:
+                        store.update_task(edit_task['id'], {'status': edit_status, 'priority': edit_priority},
+                                          expected_version=seen_version)
+                    except StaleRecordError as error:
+                        # Saving again after reviewing the latest values overwrites them
+                        seen_versions[edit_task['id']] = error.current_version
+                        st.error(f"{edit_task['title']} was changed by someone else "
+                                 f"(now {edit_task['status']}, {edit_task['priority']}). Save again to overwrite.")
+                    else:
+                        seen_versions.pop(edit_task['id'], None)
+                        st.success("Task updated successfully!")
+                        st.rerun()
+
+# Task Dependencies
+@st.fragment
+@timed("section.task_dependency_form")
+def task_dependency_form():
+    with st.expander("Task Dependencies", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            dependency_task_id = int(st.number_input("Task ID", min_value=1, step=1, key="dependency_task_id"))
+        with col2:
+            blocker_id = int(st.number_input("Waits on task ID", min_value=1, step=1, key="dependency_blocker_id"))
+        add_col, remove_col = st.columns(2)
+        if add_col.button("Add Dependency", use_container_width=True):
+            try:
+                if store.add_task_dependency(dependency_task_id, blocker_id):
+                    st.success(f"Task #{dependency_task_id} now waits on task #{blocker_id}.")
+                else:
+                    st.info("That dependency already exists.")
+            except ValueError as error:
+                # Unknown task IDs and cycles (DependencyCycleError) both explain themselves
+                st.error(str(error))
+        if remove_col.button("Remove Dependency", use_container_width=True):
+            if store.remove_task_dependency(dependency_task_id, blocker_id):
+                st.success(f"Task #{dependency_task_id} no longer waits on task #{blocker_id}.")
+            else:
+                st.info("No such dependency.")
+        blockers = sorted(store.dependencies.blockers(dependency_task_id))
+        if blockers:
+            st.caption(f"Task #{dependency_task_id} waits on " + ", ".join(f"#{task_id}" for task_id in blockers))
+
+# Display Tasks
+@st.fragment
+@timed("section.task_list")
+def task_list():
     st.markdown('<h2 class="section-header">All Tasks</h2>', unsafe_allow_html=True)
     
-    for task in st.session_state.tasks:
-        priority_class = f"priority-{task['priority'].lower()}"
-        st.markdown(f"""
-        <div class="task-card">
-            <div class="task-title">{task['title']}</div>
-            <div style="color: #64748b; margin-bottom: 0.5rem;">{task['description']}</div>
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <span class="task-priority {priority_class}">{task['priority']}</span>
-                    <span style="background: #e2e8f0; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.7rem; font-weight: 600; color: #64748b;">{task['status']}</span>
-                </div>
-                <span style="color: #64748b; font-size: 0.9rem;">ðŸ“… {task['due_date']}</span>
-            </div>
-            <div style="margin-top: 0.5rem; font-size: 0.9rem; color: #64748b;">
-                <span>ðŸ“ {task['project']}</span> â€¢ <span>ðŸ‘¤ {task['assignee']}</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    task_filter = task_filter_controls()
+    page = pagination_controls("tasks", store.count_tasks(task_filter))
+    show_cards([
+        card_cache.render('task', task, scheduler.is_overdue(task['id']), store.dependencies.is_blocked(task['id']))
+        for task in store.list_tasks(limit=page.size, offset=page.offset, task_filter=task_filter)
+    ])
 
-# Team Page
-elif page == "ðŸ‘¥ Team":
-    st.markdown('<h1 class="section-header">Team Management</h1>', unsafe_allow_html=True)
-    
-    # Add New Team Member
+# Add New Team Member
+@st.fragment
+@timed("section.member_form")
+def member_form():
     with st.expander("âž• Add Team Member", expanded=False):
         with st.form("add_member"):
             col1, col2 = st.columns(2)
@@ -772,61 +527,80 @@ elif page == "ðŸ‘¥ Team":
                     'phone': member_phone,
                     'avatar': ''.join([word[0] for word in member_name.split()])
                 }
-                st.session_state.team_members.append(new_member)
-                st.success("Team member added successfully!")
-                st.rerun()
-    
-    # Display Team Members
+                try:
+                    store.add_team_member(new_member)
+                except DuplicateNameError:
+                    st.error(f"A team member named '{member_name}' already exists.")
+                else:
+                    st.success("Team member added successfully!")
+                    st.rerun()
+
+# Display Team Members
+@st.fragment
+@timed("section.team_grid")
+def team_grid():
     st.markdown('<h2 class="section-header">Team Members</h2>', unsafe_allow_html=True)
     
-    cols = st.columns(3)
-    for i, member in enumerate(st.session_state.team_members):
-        with cols[i % 3]:
-            st.markdown(f"""
-            <div class="team-member">
-                <div class="member-avatar">{member['avatar']}</div>
-                <div class="member-name">{member['name']}</div>
-                <div class="member-role">{member['role']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    members = store.list_team_members()
+    page = pagination_controls("team", len(members))
+    column_cards = [[], [], []]
+    for i, member in enumerate(members[page.offset:page.offset + page.size]):
+        load = store.workload.member_load(member['id'])
+        workload = f"{load.open_tasks} open · {load.utilization:.0f}% of capacity" if load else ""
+        if load and load.overdue:
+            workload += f" · {load.overdue} overdue"
+        column_cards[i % 3].append(card_cache.render('member', member, workload))
+    for col, cards in zip(st.columns(3), column_cards):
+        with col:
+            show_cards(cards)
 
-# Analytics Page
-elif page == "ðŸ“ˆ Analytics":
-    st.markdown('<h1 class="section-header">Analytics & Reports</h1>', unsafe_allow_html=True)
-    
-    # Project Progress Chart
+# Capacity Planning
+@st.fragment
+@timed("section.capacity_planning")
+def capacity_planning():
+    st.markdown('<h2 class="section-header">Capacity Planning</h2>', unsafe_allow_html=True)
+    
+    loads = store.workload.member_loads()
+    roles = sorted({load.role for load in loads})
+    role = st.selectbox("Role", ["All Roles", *roles], key="capacity_role")
+    role = None if role == "All Roles" else role
+    least_loaded = store.get_team_member(store.workload.least_loaded(role))
+    if least_loaded is not None:
+        st.caption(f"Most spare capacity: {least_loaded['name']} ({least_loaded['role']})")
+    if role is not None:
+        loads = [load for load in loads if load.role == role]
+    loads.sort(key=lambda load: load.utilization, reverse=True)
+    pd = lazy_import("pandas")
+    st.dataframe(pd.DataFrame({
+        'Member': [load.name for load in loads],
+        'Role': [load.role for load in loads],
+        'Open': [load.open_tasks for load in loads],
+        'In Progress': [load.by_status.get('In Progress', 0) for load in loads],
+        'High': [load.by_priority.get('High', 0) for load in loads],
+        'Due in 7 Days': [load.due_soon for load in loads],
+        'Overdue': [load.overdue for load in loads],
+        'Next Due': [load.next_due for load in loads],
+        'Utilization': [load.utilization for load in loads],
+    }), hide_index=True, use_container_width=True, column_config={
+        'Utilization': st.column_config.ProgressColumn(
+            "Utilization", format="%.0f%%", min_value=0, max_value=max([100.0, *(load.utilization for load in loads)])
+        )
+    })
+
+# Project Progress Chart
+@st.fragment
+@timed("section.analytics_charts")
+def analytics_charts():
+    charts = lazy_import("tasksphere.charts")
     st.markdown('<h3 style="color: #1e293b; margin: 2rem 0 1rem;">Project Progress Overview</h3>', unsafe_allow_html=True)
     
-    project_data = []
-    for project in st.session_state.projects:
-        project_data.append({
-            'Project': project['name'],
-            'Progress': project['progress'],
-            'Status': project['status']
-        })
-    
-    if project_data:
-        df_projects = pd.DataFrame(project_data)
-        fig_progress = px.bar(
-            df_projects,
-            x='Project',
-            y='Progress',
-            color='Status',
-            title="Project Progress by Status",
-            color_discrete_map={
-                'Active': '#2563eb',
-                'Completed': '#10b981',
-                'Pending': '#f59e0b'
-            }
-        )
-        fig_progress.update_layout(
-            title_font_size=16,
-            font=dict(size=12),
-            height=400,
-            xaxis_title="Project Name",
-            yaxis_title="Progress (%)"
-        )
-        st.plotly_chart(fig_progress, use_container_width=True)
+    weighted = st.session_state.get("weighted_progress", False)
+    fig_progress = figure_cache.get_or_build(
+        'project_progress_weighted' if weighted else 'project_progress',
+        (store.stats.project_version, store.rollup.version),
+        lambda: charts.project_progress_bar(store.project_progress_rows(weighted))
+    )
+    show_chart(fig_progress)
     
     # Task Distribution
     col1, col2 = st.columns(2)
@@ -834,83 +608,151 @@ elif page == "ðŸ“ˆ Analytics":
     with col1:
         st.markdown('<h3 style="color: #1e293b; margin: 2rem 0 1rem;">Task Status Distribution</h3>', unsafe_allow_html=True)
         
-        task_status_counts = {}
-        for task in st.session_state.tasks:
-            status = task['status']
-            task_status_counts[status] = task_status_counts.get(status, 0) + 1
-        
-        if task_status_counts:
-            fig_task_status = px.pie(
-                values=list(task_status_counts.values()),
-                names=list(task_status_counts.keys()),
-                title="Task Status Distribution",
-                color_discrete_map={
-                    'Completed': '#10b981',
-                    'In Progress': '#2563eb',
-                    'Pending': '#f59e0b'
-                }
-            )
-            fig_task_status.update_layout(
-                title_font_size=14,
-                font=dict(size=11),
-                height=350
-            )
-            st.plotly_chart(fig_task_status, use_container_width=True)
+        fig_task_status = figure_cache.get_or_build(
+            'task_status', store.stats.task_version,
+            lambda: charts.task_status_pie(analytics_task_counts('status'))
+        )
+        show_chart(fig_task_status)
     
     with col2:
         st.markdown('<h3 style="color: #1e293b; margin: 2rem 0 1rem;">Team Workload</h3>', unsafe_allow_html=True)
         
-        assignee_counts = {}
-        for task in st.session_state.tasks:
-            assignee = task['assignee']
-            assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
-        
-        if assignee_counts:
-            fig_workload = px.bar(
-                x=list(assignee_counts.keys()),
-                y=list(assignee_counts.values()),
-                title="Tasks per Team Member",
-                color=list(assignee_counts.values()),
-                color_continuous_scale="Blues"
-            )
-            fig_workload.update_layout(
-                title_font_size=14,
-                font=dict(size=11),
-                height=350,
-                xaxis_title="Team Member",
-                yaxis_title="Number of Tasks",
-                showlegend=False
-            )
-            st.plotly_chart(fig_workload, use_container_width=True)
+        fig_workload = figure_cache.get_or_build(
+            'workload', store.workload.version,
+            lambda: charts.workload_bar(store.workload.member_loads())
+        )
+        show_chart(fig_workload)
 
-# Settings Page
-elif page == "âš™ï¸ Settings":
-    st.markdown('<h1 class="section-header">Settings & Configuration</h1>', unsafe_allow_html=True)
+# Status History
+@st.fragment
+@timed("section.analytics_history")
+def analytics_history():
+    charts = lazy_import("tasksphere.charts")
+    history = lazy_import("tasksphere.history")
+    st.markdown('<h3 style="color: #1e293b; margin: 2rem 0 1rem;">Status History</h3>', unsafe_allow_html=True)
+    
+    history_range = st.selectbox("Range", list(history.HISTORY_RANGES), key="history_range")
+    days = history.HISTORY_RANGES[history_range]
+    # Built from the daily rollup, so cost depends on the range, not on how many changes it holds
+    version = (store.stats.task_version, str(history.utc_today()))
+    
+    fig_flow = figure_cache.get_or_build(
+        f'cumulative_flow_{days}', version,
+        lambda: charts.cumulative_flow_area(history.cumulative_flow(store, days))
+    )
+    show_chart(fig_flow)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig_burndown = figure_cache.get_or_build(
+            f'burndown_{days}', version,
+            lambda: charts.burndown_line(history.burndown(history.cumulative_flow(store, days)))
+        )
+        show_chart(fig_burndown)
+    
+    with col2:
+        fig_velocity = figure_cache.get_or_build(
+            f'velocity_{days}', version,
+            lambda: charts.velocity_bar(history.velocity(store, days))
+        )
+        show_chart(fig_velocity)
+
+@st.fragment
+@timed("section.settings_panel")
+def settings_panel():
+    if st.session_state.pop("settings_saved", False):
+        st.success("Settings saved successfully!")
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("### ðŸŽ¨ Theme Settings")
-        theme_option = st.selectbox("Choose Theme", ["Professional Blue", "Dark Mode", "Light Mode"])
-        st.info(f"Current theme: {theme_option}")
+        themes = SETTING_CHOICES['theme']
+        theme_option = st.selectbox("Choose Theme", themes, index=themes.index(settings.theme))
+        st.info(f"Current theme: {settings.theme}")
         
         st.markdown("### ðŸ“§ Notification Settings")
-        email_notifications = st.checkbox("Email Notifications", value=True)
-        push_notifications = st.checkbox("Push Notifications", value=True)
-        task_reminders = st.checkbox("Task Reminders", value=True)
+        email_notifications = st.checkbox("Email Notifications", value=settings.email_notifications)
+        push_notifications = st.checkbox("Push Notifications", value=settings.push_notifications)
+        task_reminders = st.checkbox("Task Reminders", value=settings.task_reminders)
     
     with col2:
-        st.markdown("### ðŸ” Security Settings")
-        two_factor_auth = st.checkbox("Two-Factor Authentication", value=False)
-        session_timeout = st.selectbox("Session Timeout", ["15 minutes", "30 minutes", "1 hour", "2 hours"])
+        st.markdown("### ðŸ” Security Settings")
+        two_factor_auth = st.checkbox("Two-Factor Authentication", value=settings.two_factor_auth)
+        session_timeout = st.selectbox("Session Timeout", SESSION_TIMEOUTS, index=SESSION_TIMEOUTS.index(settings.session_timeout))
         
         st.markdown("### ðŸ“Š Data Management")
-        auto_backup = st.checkbox("Automatic Backup", value=True)
-        data_retention = st.selectbox("Data Retention Period", ["30 days", "90 days", "1 year", "Forever"])
+        auto_backup = st.checkbox("Automatic Backup", value=settings.auto_backup)
+        retention_periods = SETTING_CHOICES['data_retention']
+        data_retention = st.selectbox("Data Retention Period", retention_periods,
+                                      index=retention_periods.index(settings.data_retention),
+                                      help="Snapshots older than this are deleted; the newest one is always kept.")
+        if backup_job is not None:
+            backup_status()
+        else:
+            st.caption("Backups are not available for an in-memory workspace.")
     
     if st.button("Save Settings"):
-        st.success("Settings saved successfully!")
-    
+        saved = settings_store.save(Settings(
+            theme_option, email_notifications, push_notifications, task_reminders,
+            two_factor_auth, session_timeout, auto_backup, data_retention,
+        ))
+        if backup_job is not None:
+            backup_job.configure(saved.auto_backup, saved.retention_days)
+        # A full rerun applies the new theme to the whole page
+        st.session_state["settings_saved"] = True
+        st.rerun()
+
+# Last snapshot and a manual trigger; the backup itself runs on the job's thread
+@st.fragment
+def backup_status():
+    snapshot = backup_job.last_snapshot
+    if backup_job.running:
+        st.caption("Backup in progress...")
+    elif snapshot is not None:
+        st.caption(f"Last backup {time_ago(snapshot.created_at)}: {snapshot.rows} rows in {BACKUP_DIR}")
+    else:
+        st.caption("No backups yet.")
+    if backup_job.last_error:
+        st.error(f"Last backup failed: {backup_job.last_error}")
+    if st.button("Back Up Now", disabled=backup_job.running):
+        backup_job.request()
+        st.caption("Backup started.")
+
+@st.fragment
+@timed("section.bulk_import_panel")
+def bulk_import_panel():
+    st.markdown("---")
+    st.markdown("### Bulk Import")
+    
+    with st.form("bulk_import"):
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            import_kind = st.selectbox("Import", IMPORT_KINDS, format_func=lambda kind: kind.replace('_', ' ').title())
+        with col2:
+            uploaded_file = st.file_uploader("CSV, JSON Lines or JSON array file", type=["csv", "jsonl", "ndjson", "json"])
+        submitted = st.form_submit_button("Import")
+    
+    if submitted and uploaded_file is not None:
+        progress = st.progress(0.0, text="Importing...")
+        result = import_stream(
+            store, import_kind, uploaded_file, detect_format(uploaded_file.name),
+            total_bytes=uploaded_file.size,
+            on_progress=lambda current: progress.progress(current.fraction or 0.0, text=f"{current.inserted} imported, {current.rejected} rejected")
+        )
+        progress.progress(1.0, text="Import finished")
+        if result.failure:
+            st.error(f"Import stopped early: {result.failure}. {result.inserted} records before that point were imported.")
+        else:
+            st.success(f"Imported {result.inserted} records.")
+        if result.rejected:
+            st.warning(f"Skipped {result.rejected} invalid records.")
+            st.code("\n".join(result.errors))
+
+@st.fragment
+@timed("section.data_panel")
+def data_panel():
     st.markdown("---")
     st.markdown("### ðŸ—‘ï¸ Danger Zone")
     
@@ -921,8 +763,146 @@ elif page == "âš™ï¸ Settings":
             st.warning("This will permanently delete all projects, tasks, and team data. Are you sure?")
     
     with col2:
-        if st.button("Export Data", type="secondary"):
-            st.info("Data export feature coming soon!")
+        export_kind = st.selectbox("Export", EXPORT_KINDS, format_func=lambda kind: kind.replace('_', ' ').title(), key="export_kind")
+        export_format = st.selectbox("Format", available_formats(), key="export_format")
+        # Built only when the button is clicked, and held in memory until downloaded; the CLI
+        # export writes straight to disk for tables too large for that
+        st.download_button(
+            "Export Data",
+            data=lambda: export_bytes(store, export_kind, export_format),
+            file_name=export_file_name(export_kind, export_format),
+            mime=MIME_TYPES[export_format],
+            type="secondary"
+        )
+
+# Span timings for every section and store call since the server started (or the last reset)
+@st.fragment
+def admin_panel():
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Figure Cache Hits", figure_cache.hits, f"{figure_cache.misses} misses", delta_color="off")
+    col2.metric("Card Cache Hits", card_cache.hits, f"{card_cache.misses} misses", delta_color="off")
+    col3.metric("Change Events", event_bus.last_seq)
+    analytics_tasks = get_analytics_tasks()
+    if analytics_tasks is not None:
+        col4.metric("Columnar Tasks", f"{analytics_tasks.memory_bytes() / 1e6:.1f} MB")
+    
+    stats = profiler.snapshot()
+    if stats:
+        pd = lazy_import("pandas")
+        st.dataframe(pd.DataFrame({
+            'Span': [entry.name for entry in stats],
+            'Calls': [entry.count for entry in stats],
+            'p50 (ms)': [entry.p50 * 1000 for entry in stats],
+            'p95 (ms)': [entry.p95 * 1000 for entry in stats],
+            'p99 (ms)': [entry.p99 * 1000 for entry in stats],
+            'Max (ms)': [entry.max * 1000 for entry in stats],
+            'Total (s)': [entry.total for entry in stats],
+        }), hide_index=True, use_container_width=True)
+    else:
+        st.caption("No spans recorded yet.")
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    # Only the server's configured file is written; a path typed in the browser could be anywhere
+    with col1:
+        if METRICS_FILE:
+            st.caption(f"Metrics file: {METRICS_FILE}")
+        else:
+            st.caption("Set TASKSPHERE_METRICS_FILE on the server to write timings to a file.")
+    with col2:
+        if st.button("Write Metrics File", disabled=not METRICS_FILE):
+            try:
+                export_stats(stats, METRICS_FILE)
+            except OSError as error:
+                st.error(f"Could not write {METRICS_FILE}: {error.strerror or error}")
+            else:
+                st.success(f"Wrote {METRICS_FILE}")
+    with col3:
+        if st.button("Reset Timings"):
+            profiler.reset()
+            st.rerun(scope="fragment")
+    st.download_button("Download Prometheus Text", data=prometheus_text(stats),
+                       file_name="tasksphere-metrics.prom", mime="text/plain")
+
+# Due-date reminders in the sidebar, refreshed with the live dashboard sections
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+@timed("section.reminders")
+def reminders():
+    if not settings_store.current.task_reminders:
+        return
+    overdue = scheduler.overdue_count()
+    if overdue:
+        st.warning(f"{overdue} overdue tasks")
+    for notice in scheduler.notices(5):
+        label = "Overdue" if notice.kind == OVERDUE else "Due soon"
+        st.caption(f"{label}: {notice.title} ({notice.assignee}), due {notice.due_date}")
+
+# Sidebar Navigation
+st.sidebar.markdown("## ðŸš€ TaskSphere")
+st.sidebar.markdown("---")
+
+page = st.sidebar.selectbox(
+    "Navigate",
+    ["ðŸ“Š Dashboard", "ðŸ“ Projects", "âœ… Tasks", "ðŸ‘¥ Team", "ðŸ“ˆ Analytics", "âš™ï¸ Settings", "Admin"]
+)
+
+with st.sidebar:
+    reminders()
+
+# Dashboard Page
+if page == "ðŸ“Š Dashboard":
+    st.markdown('<h1 class="main-header">TaskSphere</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">Professional Project Management Platform</p>', unsafe_allow_html=True)
+    
+    dashboard_metrics()
+    dashboard_charts()
+    dashboard_recent_projects()
+    dashboard_activity()
+
+# Projects Page
+elif page == "ðŸ“ Projects":
+    st.markdown('<h1 class="section-header">Project Management</h1>', unsafe_allow_html=True)
+    
+    project_form()
+    project_list()
+    project_timeline()
+
+# Tasks Page
+elif page == "âœ… Tasks":
+    st.markdown('<h1 class="section-header">Task Management</h1>', unsafe_allow_html=True)
+    
+    task_form()
+    task_update_form()
+    task_dependency_form()
+    task_list()
+
+# Team Page
+elif page == "ðŸ‘¥ Team":
+    st.markdown('<h1 class="section-header">Team Management</h1>', unsafe_allow_html=True)
+    
+    member_form()
+    team_grid()
+    capacity_planning()
+
+# Analytics Page
+elif page == "ðŸ“ˆ Analytics":
+    st.markdown('<h1 class="section-header">Analytics & Reports</h1>', unsafe_allow_html=True)
+    
+    analytics_charts()
+    analytics_history()
+
+# Settings Page
+elif page == "âš™ï¸ Settings":
+    st.markdown('<h1 class="section-header">Settings & Configuration</h1>', unsafe_allow_html=True)
+    
+    settings_panel()
+    bulk_import_panel()
+    data_panel()
+
+# Admin Page
+elif page == "Admin":
+    st.markdown('<h1 class="section-header">Performance</h1>', unsafe_allow_html=True)
+    
+    admin_panel()
 
 # Footer
 st.markdown("---")
@@ -932,3 +912,12 @@ st.markdown("""
     <p>Built with â¤ï¸ using Streamlit | Â© 2024 Saurabh Parthe</p>
 </div>
 """, unsafe_allow_html=True)
+
+rerun_seconds = time.perf_counter() - rerun_started
+profiler.record("app.rerun", rerun_seconds)
+# First run in this process (a server or container start) and first run of each browser session
+if cold_start:
+    profiler.record("startup.first_run", rerun_seconds)
+if "session_started" not in st.session_state:
+    st.session_state["session_started"] = time.time()
+    profiler.record("startup.session", rerun_seconds)
@@ -0,0 +1 @@
+"""TaskSphere data layer used by the Streamlit app."""
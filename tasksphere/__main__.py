@@ -0,0 +1,5 @@
+import sys
+
+from tasksphere.cli import main
+
+sys.exit(main())
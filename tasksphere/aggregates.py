@@ -0,0 +1,112 @@
+"""Running counts behind the Dashboard and Analytics pages."""
+
+import threading
+from collections import Counter
+from typing import Dict
+
+from tasksphere.listeners import StoreListener
+
+TASK_GROUP_FIELDS = ['status', 'priority', 'assignee', 'project']
+PROJECT_GROUP_FIELDS = ['status']
+
+
+class WorkspaceStats(StoreListener):
+    """Counts by field that are adjusted on every write instead of recounted on every rerun."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.project_total = 0
+        self.task_total = 0
+        self.member_total = 0
+        # Bumped on every write so caches can tell whether their inputs moved
+        self.project_version = 0
+        self.task_version = 0
+        self.member_version = 0
+        self._project_counts = {field: Counter() for field in PROJECT_GROUP_FIELDS}
+        self._task_counts = {field: Counter() for field in TASK_GROUP_FIELDS}
+
+    def load(self, project_counts: Dict[str, Dict], task_counts: Dict[str, Dict], member_total: int):
+        with self._lock:
+            for field in PROJECT_GROUP_FIELDS:
+                self._project_counts[field] = Counter(project_counts[field])
+            for field in TASK_GROUP_FIELDS:
+                self._task_counts[field] = Counter(task_counts[field])
+            self.project_total = sum(self._project_counts['status'].values())
+            self.task_total = sum(self._task_counts['status'].values())
+            self.member_total = member_total
+            self.project_version += 1
+            self.task_version += 1
+            self.member_version += 1
+
+    # Reads
+
+    def project_counts(self, field: str) -> Dict[str, int]:
+        with self._lock:
+            return {value: count for value, count in self._project_counts[field].items() if count}
+
+    def task_counts(self, field: str) -> Dict[str, int]:
+        with self._lock:
+            return {value: count for value, count in self._task_counts[field].items() if count}
+
+    def project_count(self, field: str, value: str) -> int:
+        return self._project_counts[field][value]
+
+    def task_count(self, field: str, value: str) -> int:
+        return self._task_counts[field][value]
+
+    def completion_rate(self) -> float:
+        total = self.task_total
+        return (self.task_count('status', 'Completed') / total * 100) if total else 0
+
+    # Write hooks, called by the store after each committed change
+
+    def project_added(self, project: Dict):
+        with self._lock:
+            self.project_version += 1
+            self.project_total += 1
+            self._adjust(self._project_counts, project, 1)
+
+    def project_removed(self, project: Dict):
+        with self._lock:
+            self.project_version += 1
+            self.project_total -= 1
+            self._adjust(self._project_counts, project, -1)
+
+    def project_updated(self, old: Dict, new: Dict):
+        with self._lock:
+            self.project_version += 1
+            self._adjust(self._project_counts, old, -1)
+            self._adjust(self._project_counts, new, 1)
+
+    def task_added(self, task: Dict):
+        with self._lock:
+            self.task_version += 1
+            self.task_total += 1
+            self._adjust(self._task_counts, task, 1)
+
+    def task_removed(self, task: Dict):
+        with self._lock:
+            self.task_version += 1
+            self.task_total -= 1
+            self._adjust(self._task_counts, task, -1)
+
+    def task_updated(self, old: Dict, new: Dict):
+        with self._lock:
+            self.task_version += 1
+            self._adjust(self._task_counts, old, -1)
+            self._adjust(self._task_counts, new, 1)
+
+    def member_added(self, member: Dict):
+        with self._lock:
+            self.member_version += 1
+            self.member_total += 1
+
+    def member_removed(self, member: Dict):
+        with self._lock:
+            self.member_version += 1
+            self.member_total -= 1
+
+    @staticmethod
+    def _adjust(counters: Dict[str, Counter], record: Dict, delta: int):
+        for field, counter in counters.items():
+            counter[record.get(field)] += delta
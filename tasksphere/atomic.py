@@ -0,0 +1,28 @@
+"""Replace files atomically, so readers see the old or the new file and never part of one."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+
+@contextmanager
+def atomic_writer(path: str) -> Iterator[BinaryIO]:
+    """A binary file that takes ``path``'s place, synced to disk, only if the block completes."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.partial')
+    try:
+        with os.fdopen(fd, 'wb') as target:
+            yield target
+            target.flush()
+            os.fsync(target.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def write_atomic(path: str, data: bytes):
+    with atomic_writer(path) as target:
+        target.write(data)
@@ -0,0 +1,337 @@
+"""Incremental, content-hashed workspace backups with retention pruning and streaming restore."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from tasksphere.atomic import write_atomic
+from tasksphere.profiling import span
+from tasksphere.store import WorkspaceStore
+
+# Table -> (ordering columns, key span per chunk). Chunks cover fixed ranges of the first
+# column, so an edit changes only the chunk its row falls in and every other chunk is
+# reused from earlier snapshots. Tables are restored in this order.
+BACKUP_TABLES: Dict[str, Tuple[Tuple[str, ...], int]] = {
+    'projects': (('id',), 1000),
+    'team_members': (('id',), 1000),
+    'task_status_codes': (('code',), 1000),
+    'tasks': (('id',), 5000),
+    'task_dependencies': (('task_id', 'depends_on'), 5000),
+    'task_events': (('id',), 20000),
+    'task_daily_flow': (('day', 'code'), 30),
+}
+RETENTION_PERIODS: Dict[str, Optional[int]] = {'30 days': 30, '90 days': 90, '1 year': 365, 'Forever': None}
+DEFAULT_BACKUP_INTERVAL = 24 * 60 * 60.0
+DEFAULT_RESTORE_BATCH = 5000
+# Unreferenced chunks younger than this may belong to a backup that has not written its manifest yet
+CHUNK_GRACE_SECONDS = 60 * 60
+COMPRESS_LEVEL = 6
+
+logger = logging.getLogger(__name__)
+_encode_row = json.JSONEncoder(separators=(',', ':')).encode
+
+
+class BackupError(Exception):
+    pass
+
+
+@dataclass
+class Snapshot:
+    snapshot_id: str
+    created_at: float
+    schema_version: int
+    # table -> {'columns': [...], 'chunks': [sha256, ...], 'rows': n}
+    tables: Dict[str, Dict] = field(default_factory=dict)
+    new_chunks: int = 0
+    reused_chunks: int = 0
+    bytes_written: int = 0
+
+    @property
+    def rows(self) -> int:
+        return sum(table['rows'] for table in self.tables.values())
+
+
+def default_backup_dir(db_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), 'tasksphere-backups')
+
+
+def _chunk_path(backup_dir: str, digest: str) -> str:
+    return os.path.join(backup_dir, 'chunks', digest[:2], f"{digest}.jsonl.gz")
+
+
+def _manifest_dir(backup_dir: str) -> str:
+    return os.path.join(backup_dir, 'snapshots')
+
+
+def _store_chunk(backup_dir: str, content: bytes, snapshot: Snapshot) -> str:
+    digest = hashlib.sha256(content).hexdigest()
+    path = _chunk_path(backup_dir, digest)
+    if os.path.exists(path):
+        # Touched so pruning running alongside this backup sees the chunk as in use
+        os.utime(path)
+        snapshot.reused_chunks += 1
+    else:
+        compressed = gzip.compress(content, COMPRESS_LEVEL, mtime=0)
+        write_atomic(path, compressed)
+        snapshot.new_chunks += 1
+        snapshot.bytes_written += len(compressed)
+    return digest
+
+
+def _iter_chunks(cursor: sqlite3.Cursor, span: int, fetch_size: int = 1000) -> Iterator[bytes]:
+    """JSON Lines content of each key range, built from rows already sorted by key."""
+    bucket, lines = None, []
+    while True:
+        rows = cursor.fetchmany(fetch_size)
+        if not rows:
+            break
+        for row in rows:
+            row_bucket = row[0] // span
+            if row_bucket != bucket and lines:
+                yield "".join(lines).encode('utf-8')
+                lines = []
+            bucket = row_bucket
+            lines.append(_encode_row(list(row)) + "\n")
+    if lines:
+        yield "".join(lines).encode('utf-8')
+
+
+def create_snapshot(db_path: str, backup_dir: str) -> Snapshot:
+    """Write the chunks that changed since earlier snapshots, then the manifest that lists them all.
+
+    Reads go through a private connection inside one read transaction, so the snapshot is
+    consistent and the app's connection pool is never held for its duration.
+    """
+    created_at = time.time()
+    snapshot_id = datetime.fromtimestamp(created_at, timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        conn.execute("BEGIN")
+        snapshot = Snapshot(snapshot_id, created_at, conn.execute("PRAGMA user_version").fetchone()[0])
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for table, (key_columns, key_span) in BACKUP_TABLES.items():
+            if table not in existing:
+                continue
+            # The key range comes from the first key column, so it leads every row
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            columns.remove(key_columns[0])
+            columns.insert(0, key_columns[0])
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY {', '.join(key_columns)}")
+            chunks, rows = [], 0
+            for content in _iter_chunks(cursor, key_span):
+                chunks.append(_store_chunk(backup_dir, content, snapshot))
+                rows += content.count(b"\n")
+            snapshot.tables[table] = {'columns': columns, 'chunks': chunks, 'rows': rows}
+        conn.rollback()
+    finally:
+        conn.close()
+    manifest = {key: value for key, value in asdict(snapshot).items()
+                if key not in ('new_chunks', 'reused_chunks', 'bytes_written')}
+    write_atomic(os.path.join(_manifest_dir(backup_dir), f"{snapshot_id}.json"),
+                  json.dumps(manifest, indent=1).encode('utf-8'))
+    return snapshot
+
+
+def list_snapshots(backup_dir: str) -> List[Snapshot]:
+    """Every complete snapshot, oldest first."""
+    directory = _manifest_dir(backup_dir)
+    if not os.path.isdir(directory):
+        return []
+    snapshots = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.json'):
+            continue
+        with open(os.path.join(directory, name), encoding='utf-8') as manifest:
+            snapshots.append(Snapshot(**json.load(manifest)))
+    return snapshots
+
+
+def load_snapshot(backup_dir: str, snapshot_id: str) -> Snapshot:
+    """``snapshot_id`` may be ``latest``."""
+    snapshots = list_snapshots(backup_dir)
+    if snapshot_id == 'latest' and snapshots:
+        return snapshots[-1]
+    for snapshot in snapshots:
+        if snapshot.snapshot_id == snapshot_id:
+            return snapshot
+    raise BackupError(f"No snapshot {snapshot_id!r} in {backup_dir}")
+
+
+def prune_snapshots(backup_dir: str, retention_days: Optional[int], now: Optional[float] = None) -> int:
+    """Delete snapshots older than ``retention_days`` (never the newest) and chunks no snapshot uses.
+
+    Returns the number of snapshots deleted.
+    """
+    now = time.time() if now is None else now
+    snapshots = list_snapshots(backup_dir)
+    removed = 0
+    if retention_days is not None:
+        cutoff = now - retention_days * 24 * 60 * 60
+        for snapshot in snapshots[:-1]:
+            if snapshot.created_at < cutoff:
+                os.remove(os.path.join(_manifest_dir(backup_dir), f"{snapshot.snapshot_id}.json"))
+                removed += 1
+        snapshots = snapshots[removed:]
+    referenced = {digest for snapshot in snapshots for table in snapshot.tables.values() for digest in table['chunks']}
+    chunk_root = os.path.join(backup_dir, 'chunks')
+    if os.path.isdir(chunk_root):
+        for directory, _, names in os.walk(chunk_root):
+            for name in names:
+                path = os.path.join(directory, name)
+                if name.split('.')[0] not in referenced and os.path.getmtime(path) < now - CHUNK_GRACE_SECONDS:
+                    os.remove(path)
+    return removed
+
+
+def _iter_rows(backup_dir: str, digest: str) -> Iterator[list]:
+    # One chunk is decompressed line by line and checked against its name as it is read
+    checksum = hashlib.sha256()
+    with gzip.open(_chunk_path(backup_dir, digest), 'rb') as chunk:
+        for line in chunk:
+            checksum.update(line)
+            yield json.loads(line)
+    if checksum.hexdigest() != digest:
+        raise BackupError(f"Chunk {digest} is corrupt")
+
+
+def restore_snapshot(backup_dir: str, snapshot_id: str, target_path: str,
+                     batch_size: int = DEFAULT_RESTORE_BATCH) -> Snapshot:
+    """Rebuild a snapshot into a new database at ``target_path``, ``batch_size`` rows at a time."""
+    if os.path.exists(target_path):
+        raise BackupError(f"{target_path} already exists; restore into a new file")
+    snapshot = load_snapshot(backup_dir, snapshot_id)
+    # Creating a store gives the target the current schema, triggers and indexes
+    WorkspaceStore(target_path, pool_size=1).close()
+    conn = sqlite3.connect(target_path)
+    try:
+        schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if snapshot.schema_version > schema_version:
+            raise BackupError(f"Snapshot {snapshot.snapshot_id} has schema version {snapshot.schema_version}, "
+                              f"newer than this version of TaskSphere ({schema_version})")
+        conn.execute("BEGIN")
+        for table in BACKUP_TABLES:
+            saved = snapshot.tables.get(table)
+            if saved is None:
+                continue
+            # History triggers fire while tasks are restored; the saved history replaces what they add
+            conn.execute(f"DELETE FROM {table}")
+            insert = (f"INSERT INTO {table} ({', '.join(saved['columns'])}) "
+                      f"VALUES ({', '.join('?' for _ in saved['columns'])})")
+            batch = []
+            for digest in saved['chunks']:
+                for row in _iter_rows(backup_dir, digest):
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        conn.executemany(insert, batch)
+                        batch = []
+            if batch:
+                conn.executemany(insert, batch)
+        conn.commit()
+    except BaseException:
+        conn.close()
+        _remove_database(target_path)
+        raise
+    conn.close()
+    return snapshot
+
+
+def _remove_database(path: str):
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+class BackupJob:
+    """Snapshots the workspace every ``interval`` seconds and prunes old snapshots on a daemon thread.
+
+    Given the live ``store``, raw status events older than the retention period are pruned
+    from it too. Settings changes and "back up now" requests only wake the thread, so no rerun ever waits
+    on a backup.
+    """
+
+    def __init__(self, db_path: str, backup_dir: str, interval: float = DEFAULT_BACKUP_INTERVAL,
+                 enabled: bool = True, retention_days: Optional[int] = 30,
+                 store: Optional[WorkspaceStore] = None):
+        self.db_path = db_path
+        self.store = store
+        self.backup_dir = backup_dir
+        self.interval = interval
+        self.enabled = enabled
+        self.retention_days = retention_days
+        self.running = False
+        self.last_error: Optional[str] = None
+        snapshots = list_snapshots(backup_dir)
+        self.last_snapshot: Optional[Snapshot] = snapshots[-1] if snapshots else None
+        # A restart picks up the schedule from the newest snapshot on disk
+        self._last_attempt = self.last_snapshot.created_at if self.last_snapshot is not None else None
+        self._changed = threading.Condition()
+        self._requested = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def configure(self, enabled: bool, retention_days: Optional[int]):
+        with self._changed:
+            self.enabled = enabled
+            self.retention_days = retention_days
+            self._changed.notify_all()
+
+    def request(self):
+        """Take a snapshot as soon as possible, whether or not automatic backups are on."""
+        with self._changed:
+            self._requested = True
+            self._changed.notify_all()
+
+    def next_run(self) -> Optional[float]:
+        if not self.enabled:
+            return None
+        return self._last_attempt + self.interval if self._last_attempt is not None else time.time()
+
+    def start(self) -> "BackupJob":
+        self._thread = threading.Thread(target=self._run, name="tasksphere-backup", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            with self._changed:
+                if self._stopped:
+                    return
+                next_run = self.next_run()
+                if not self._requested and (next_run is None or next_run > time.time()):
+                    self._changed.wait(None if next_run is None else next_run - time.time())
+                    continue
+                self._requested = False
+                self._last_attempt = time.time()
+                self.running = True
+                retention_days = self.retention_days
+            self.run_once(retention_days)
+
+    def run_once(self, retention_days: Optional[int]) -> Optional[Snapshot]:
+        snapshot = None
+        try:
+            with span("backup.snapshot"):
+                snapshot = create_snapshot(self.db_path, self.backup_dir)
+            with span("backup.prune"):
+                prune_snapshots(self.backup_dir, retention_days)
+                if self.store is not None and retention_days is not None:
+                    self.store.prune_task_events(retention_days)
+            self.last_snapshot, self.last_error = snapshot, None
+        except Exception as error:
+            logger.exception("Backup to %s failed", self.backup_dir)
+            self.last_error = str(error)
+        finally:
+            self.running = False
+        return snapshot
+
+    def stop(self):
+        with self._changed:
+            self._stopped = True
+            self._changed.notify_all()
@@ -0,0 +1,208 @@
+"""Timing and memory benchmarks for each page's data path on synthetic workspaces."""
+
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+from tasksphere.cards import join_cards, task_card
+from tasksphere.filters import TaskFilter
+from tasksphere.store import WorkspaceStore
+from tasksphere.synthetic import WorkspaceSpec, generate_workspace
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 20
+PAGE_SIZE = 25
+
+
+@dataclass
+class CaseResult:
+    case: str
+    tasks: int
+    runs: int
+    median_ms: float
+    p95_ms: float
+    max_ms: float
+    peak_mb: float
+
+
+class _Workload:
+    """The data calls each page makes, bound to one generated store."""
+
+    def __init__(self, store: WorkspaceStore):
+        self.store = store
+        self.projects = store.project_names()
+        self.members = store.team_member_names()
+        self.added = 0
+
+    def dashboard_metrics(self):
+        stats = self.store.stats
+        return (stats.project_total, stats.project_count('status', 'Active'), stats.task_total,
+                stats.task_count('status', 'Completed'), stats.completion_rate(), stats.member_total,
+                self.store.list_projects(limit=3))
+
+    def status_priority_counts(self):
+        return (self.store.stats.task_counts('status'), self.store.stats.task_counts('priority'),
+                self.store.count_tasks(TaskFilter(statuses=['Pending'], priorities=['High'])))
+
+    def chart_building(self):
+        from tasksphere import charts
+        stats = self.store.stats
+        project_rows = self.store.project_progress_rows()
+        return (charts.project_status_pie(stats.project_counts('status')),
+                charts.task_priority_bar(stats.task_counts('priority')),
+                charts.project_progress_bar(project_rows),
+                charts.task_status_pie(stats.task_counts('status')),
+                charts.workload_bar(self.store.workload.member_loads()))
+
+    def analytics_frame(self):
+        from tasksphere.columnar import ColumnarTasks
+        columns = ColumnarTasks.from_store(self.store)
+        # Only measure the load and the frame; later cases should not pay for the extra listener
+        self.store.listeners.remove(columns)
+        return columns.frame(), columns.counts('assignee')
+
+    def least_loaded(self):
+        return self.store.workload.least_loaded(), self.store.workload.least_loaded('Data Analyst')
+
+    def task_list(self):
+        task_filter = TaskFilter(projects=self.projects[:2], sort_by='Priority')
+        return (self.store.count_tasks(task_filter),
+                self.store.list_tasks(limit=PAGE_SIZE, task_filter=task_filter),
+                self.store.list_tasks(limit=PAGE_SIZE, offset=PAGE_SIZE * 10, task_filter=TaskFilter()))
+
+    def task_cards(self):
+        # Rendered without the card cache: the cost of a page whose tasks all just changed
+        today = str(date.today())
+        tasks = self.store.list_tasks(limit=PAGE_SIZE, task_filter=TaskFilter(sort_by='Due Date'))
+        return join_cards(task_card(task, bool(task['due_date']) and task['due_date'] < today
+                                    and task['status'] != 'Completed',
+                                    self.store.dependencies.is_blocked(task['id'])) for task in tasks)
+
+    def task_search(self):
+        task_filter = TaskFilter(search='deploy api', sort_by='Relevance')
+        return self.store.count_tasks(task_filter), self.store.list_tasks(limit=PAGE_SIZE, task_filter=task_filter)
+
+    def add_task(self):
+        self.added += 1
+        return self.store.add_task({
+            'title': f"Benchmark task {self.added}", 'project': self.projects[0], 'assignee': self.members[0],
+            'priority': 'Medium', 'status': 'Pending', 'due_date': '2024-06-01', 'description': '',
+        })
+
+    def cases(self) -> Dict[str, Callable]:
+        cases = {
+            'dashboard_metrics': self.dashboard_metrics,
+            'status_priority_counts': self.status_priority_counts,
+            'chart_building': self.chart_building,
+            'analytics_frame': self.analytics_frame,
+            'least_loaded': self.least_loaded,
+            'task_list': self.task_list,
+            'task_cards': self.task_cards,
+            'task_search': self.task_search,
+            'add_task': self.add_task,
+        }
+        try:
+            import pandas  # noqa: F401
+            import plotly  # noqa: F401
+        except ImportError:
+            del cases['chart_building']
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            del cases['analytics_frame']
+        return cases
+
+
+def _measure(case: str, tasks: int, func: Callable, repeat: int) -> CaseResult:
+    func()  # warm caches and lazy imports
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    # Allocation tracking slows calls down, so peak memory comes from a separate run
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    durations.sort()
+    return CaseResult(
+        case, tasks, repeat,
+        statistics.median(durations) * 1000,
+        durations[min(len(durations) - 1, int(0.95 * len(durations)))] * 1000,
+        durations[-1] * 1000,
+        peak / 1e6,
+    )
+
+
+def max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_size(spec: WorkspaceSpec, repeat: int = DEFAULT_REPEAT, cases: Optional[List[str]] = None,
+             report: Callable[[str], None] = lambda line: None) -> List[CaseResult]:
+    with tempfile.TemporaryDirectory() as directory:
+        store = WorkspaceStore(os.path.join(directory, "bench.db"))
+        try:
+            started = time.perf_counter()
+            generate_workspace(store, spec)
+            report(f"generated {spec.tasks} tasks, {spec.projects} projects, {spec.members} members "
+                   f"in {time.perf_counter() - started:.1f}s")
+            workload = _Workload(store)
+            results = []
+            for case, func in workload.cases().items():
+                if cases and case not in cases:
+                    continue
+                result = _measure(case, spec.tasks, func, repeat)
+                report(format_result(result))
+                results.append(result)
+            return results
+        finally:
+            store.close()
+
+
+def format_result(result: CaseResult) -> str:
+    return (f"{result.case:<24} {result.tasks:>9} tasks  median {result.median_ms:9.2f} ms  "
+            f"p95 {result.p95_ms:9.2f} ms  max {result.max_ms:9.2f} ms  peak {result.peak_mb:8.2f} MB")
+
+
+def load_budgets(path: str) -> Dict[str, Dict[str, float]]:
+    """Budgets map ``case`` or ``case@tasks`` to limits on ``median_ms``, ``p95_ms`` and ``peak_mb``.
+
+    An optional ``process`` entry limits ``max_rss_mb`` for the whole run.
+    """
+    with open(path, encoding='utf-8') as budget_file:
+        return json.load(budget_file)
+
+
+def check_budgets(results: List[CaseResult], budgets: Dict[str, Dict[str, float]],
+                  rss_mb: Optional[float] = None) -> List[str]:
+    violations = []
+    rss_limit = budgets.get('process', {}).get('max_rss_mb')
+    if rss_mb is not None and rss_limit is not None and rss_mb > rss_limit:
+        violations.append(f"process: max_rss_mb {rss_mb:.1f} > {rss_limit}")
+    for result in results:
+        limits = {**budgets.get(result.case, {}), **budgets.get(f"{result.case}@{result.tasks}", {})}
+        measured = asdict(result)
+        for metric, limit in limits.items():
+            if metric not in measured:
+                raise ValueError(f"Unknown budget metric {metric!r} for {result.case}")
+            if measured[metric] > limit:
+                violations.append(f"{result.case} at {result.tasks} tasks: {metric} {measured[metric]:.2f} > {limit}")
+    return violations
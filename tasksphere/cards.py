@@ -0,0 +1,152 @@
+"""Project, task and team-member cards rendered from precompiled HTML templates and cached per record."""
+
+import html
+import threading
+from collections import OrderedDict
+from string import Template
+from typing import Callable, Dict, Hashable, Iterable
+
+DEFAULT_MAX_CARDS = 2048
+MISSING = "—"
+
+
+def compile_template(markup: str) -> Template:
+    # Each card becomes one line: indentation means nothing to HTML, and a blank line inside
+    # a card would end Markdown's HTML block when cards are joined into one st.markdown call
+    return Template(" ".join(line.strip() for line in markup.strip().splitlines()))
+
+
+def _html(value) -> str:
+    # Record text is escaped, and its line breaks become <br> so a blank line in a
+    # description cannot end the HTML block either
+    if value is None:
+        return MISSING
+    return "<br>".join(html.escape(str(value)).splitlines())
+
+
+def _fields(record: Dict) -> Dict[str, str]:
+    return {key: _html(value) for key, value in record.items()}
+
+
+PROJECT_CARD = compile_template("""
+<div class="project-card">
+    <div class="project-title">$name</div>
+    <div class="project-description">$description</div>
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+        <span class="project-status $status_class">$status</span>
+        <span style="color: #64748b; font-size: 0.9rem;">$progress% Complete</span>
+    </div>
+    <div class="progress-container">
+        <div class="progress-bar" style="width: $progress%"></div>
+    </div>
+    $details
+</div>
+""")
+
+PROJECT_DETAILS = compile_template("""
+<div style="display: flex; justify-content: space-between; margin-top: 1rem; font-size: 0.9rem; color: #64748b;">
+    <span>ðŸ‘¥ $team_size members</span>
+    <span>ðŸ’° </span>
+    <span>ðŸ“… $start_date - $end_date</span>
+</div>
+""")
+
+TASK_CARD = compile_template("""
+<div class="task-card">
+    <div class="task-title">$title <span style="color: #94a3b8; font-size: 0.8rem;">#$id</span></div>
+    <div style="color: #64748b; margin-bottom: 0.5rem;">$description</div>
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <span class="task-priority $priority_class">$priority</span>
+            <span style="background: #e2e8f0; padding: 0.2rem 0.6rem; border-radius: 15px; font-size: 0.7rem; font-weight: 600; color: #64748b;">$status</span>
+            $overdue_badge
+            $blocked_badge
+        </div>
+        <span style="color: #64748b; font-size: 0.9rem;">ðŸ“… $due_date</span>
+    </div>
+    <div style="margin-top: 0.5rem; font-size: 0.9rem; color: #64748b;">
+        <span>ðŸ“ $project</span> â€¢ <span>ðŸ‘¤ $assignee</span>
+    </div>
+</div>
+""")
+
+OVERDUE_BADGE = ('<span style="background: #fee2e2; padding: 0.2rem 0.6rem; border-radius: 15px; '
+                 'font-size: 0.7rem; font-weight: 600; color: #dc2626;">Overdue</span>')
+BLOCKED_BADGE = ('<span style="background: #fef3c7; padding: 0.2rem 0.6rem; border-radius: 15px; '
+                 'font-size: 0.7rem; font-weight: 600; color: #d97706;">Blocked</span>')
+
+MEMBER_CARD = compile_template("""
+<div class="team-member">
+    <div class="member-avatar">$avatar</div>
+    <div class="member-name">$name</div>
+    <div class="member-role">$role</div>
+    <div style="margin-top: 0.5rem; font-size: 0.8rem; color: #64748b;">$workload</div>
+</div>
+""")
+
+
+def project_card(project: Dict, progress: int, details: bool = True) -> str:
+    """The Projects page card; the Dashboard leaves out the team, budget and dates row."""
+    fields = _fields(project)
+    return PROJECT_CARD.substitute(
+        fields, status_class=_html(f"status-{project['status'].lower()}"), progress=_html(progress),
+        details=PROJECT_DETAILS.substitute(fields) if details else '',
+    )
+
+
+def task_card(task: Dict, overdue: bool, blocked: bool = False) -> str:
+    return TASK_CARD.substitute(
+        _fields(task), priority_class=_html(f"priority-{task['priority'].lower()}"),
+        overdue_badge=OVERDUE_BADGE if overdue else '', blocked_badge=BLOCKED_BADGE if blocked else '',
+    )
+
+
+def member_card(member: Dict, workload: str) -> str:
+    return MEMBER_CARD.substitute(_fields(member), workload=_html(workload))
+
+
+RENDERERS: Dict[str, Callable[..., str]] = {'project': project_card, 'task': task_card, 'member': member_card}
+
+
+def join_cards(cards: Iterable[str]) -> str:
+    """Consecutive cards as one Markdown HTML block, for a single st.markdown call."""
+    return "\n".join(cards)
+
+
+class CardCache:
+    """Rendered card HTML keyed on the record's id and version plus the other values the card shows.
+
+    A record's card is re-rendered only after the record itself is written or a derived value
+    on it (progress, overdue state, workload) changes; the least recently used cards are dropped.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_CARDS):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, card: str, record: Dict, *args: Hashable) -> str:
+        key = (card, record['id'], record.get('version'), args)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return html
+        html = RENDERERS[card](record, *args)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
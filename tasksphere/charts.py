@@ -0,0 +1,198 @@
+"""Plotly figure builders for the Dashboard and Analytics pages."""
+
+from typing import Dict, List
+
+import pandas as pd
+import plotly.express as px
+
+from tasksphere.workload import MemberLoad
+
+WORKLOAD_CHART_MEMBERS = 20
+
+
+def project_status_pie(status_counts: Dict[str, int]):
+    if not status_counts:
+        return None
+    fig_status = px.pie(
+        values=list(status_counts.values()),
+        names=list(status_counts.keys()),
+        title="Project Status Distribution",
+        color_discrete_map={
+            'Active': '#2563eb',
+            'Completed': '#10b981',
+            'Pending': '#f59e0b'
+        }
+    )
+    fig_status.update_layout(
+        title_font_size=16,
+        font=dict(size=12),
+        showlegend=True,
+        height=400
+    )
+    return fig_status
+
+
+def task_priority_bar(priority_counts: Dict[str, int]):
+    if not priority_counts:
+        return None
+    fig_priority = px.bar(
+        x=list(priority_counts.keys()),
+        y=list(priority_counts.values()),
+        title="Task Priority Distribution",
+        color=list(priority_counts.keys()),
+        color_discrete_map={
+            'High': '#ef4444',
+            'Medium': '#f59e0b',
+            'Low': '#10b981'
+        }
+    )
+    fig_priority.update_layout(
+        title_font_size=16,
+        font=dict(size=12),
+        showlegend=False,
+        height=400,
+        xaxis_title="Priority Level",
+        yaxis_title="Number of Tasks"
+    )
+    return fig_priority
+
+
+def project_progress_bar(project_rows: List[tuple]):
+    if not project_rows:
+        return None
+    df_projects = pd.DataFrame.from_records(project_rows, columns=['Project', 'Progress', 'Status'])
+    df_projects['Status'] = df_projects['Status'].astype('category')
+    fig_progress = px.bar(
+        df_projects,
+        x='Project',
+        y='Progress',
+        color='Status',
+        title="Project Progress by Status",
+        color_discrete_map={
+            'Active': '#2563eb',
+            'Completed': '#10b981',
+            'Pending': '#f59e0b'
+        }
+    )
+    fig_progress.update_layout(
+        title_font_size=16,
+        font=dict(size=12),
+        height=400,
+        xaxis_title="Project Name",
+        yaxis_title="Progress (%)"
+    )
+    return fig_progress
+
+
+def task_status_pie(task_status_counts: Dict[str, int]):
+    if not task_status_counts:
+        return None
+    fig_task_status = px.pie(
+        values=list(task_status_counts.values()),
+        names=list(task_status_counts.keys()),
+        title="Task Status Distribution",
+        color_discrete_map={
+            'Completed': '#10b981',
+            'In Progress': '#2563eb',
+            'Pending': '#f59e0b'
+        }
+    )
+    fig_task_status.update_layout(
+        title_font_size=14,
+        font=dict(size=11),
+        height=350
+    )
+    return fig_task_status
+
+
+def workload_bar(member_loads: List[MemberLoad], limit: int = WORKLOAD_CHART_MEMBERS):
+    """Open tasks per member by priority, for the ``limit`` most utilised members."""
+    busiest = sorted((load for load in member_loads if load.open_tasks),
+                     key=lambda load: load.utilization, reverse=True)[:limit]
+    if not busiest:
+        return None
+    rows = [(load.name, priority, load.by_priority.get(priority, 0))
+            for load in busiest for priority in ('High', 'Medium', 'Low')]
+    df_workload = pd.DataFrame.from_records(rows, columns=['Member', 'Priority', 'Open Tasks'])
+    fig_workload = px.bar(
+        df_workload,
+        x='Member',
+        y='Open Tasks',
+        color='Priority',
+        title="Open Tasks per Team Member",
+        color_discrete_map={
+            'High': '#ef4444',
+            'Medium': '#f59e0b',
+            'Low': '#10b981'
+        }
+    )
+    fig_workload.update_layout(
+        title_font_size=14,
+        font=dict(size=11),
+        height=350,
+        xaxis_title="Team Member",
+        yaxis_title="Open Tasks"
+    )
+    return fig_workload
+
+
+def cumulative_flow_area(flow: pd.DataFrame):
+    if flow.empty or not flow.to_numpy().any():
+        return None
+    df_flow = flow.reset_index().melt(id_vars='Date', var_name='Status', value_name='Tasks')
+    fig_flow = px.area(
+        df_flow,
+        x='Date',
+        y='Tasks',
+        color='Status',
+        title="Cumulative Flow",
+        color_discrete_map={
+            'Completed': '#10b981',
+            'In Progress': '#2563eb',
+            'Pending': '#f59e0b'
+        }
+    )
+    fig_flow.update_layout(
+        title_font_size=14,
+        font=dict(size=11),
+        height=350
+    )
+    return fig_flow
+
+
+def burndown_line(open_tasks: pd.Series):
+    if open_tasks.empty:
+        return None
+    fig_burndown = px.line(
+        x=open_tasks.index,
+        y=open_tasks.values,
+        title="Burndown"
+    )
+    fig_burndown.update_traces(line_color='#2563eb')
+    fig_burndown.update_layout(
+        title_font_size=14,
+        font=dict(size=11),
+        height=350,
+        xaxis_title="Date",
+        yaxis_title="Open Tasks"
+    )
+    return fig_burndown
+
+
+def velocity_bar(completed_per_week: pd.Series):
+    if completed_per_week.empty:
+        return None
+    fig_velocity = px.bar(
+        x=completed_per_week.index,
+        y=completed_per_week.values,
+        title="Velocity"
+    )
+    fig_velocity.update_traces(marker_color='#10b981')
+    fig_velocity.update_layout(
+        title_font_size=14,
+        font=dict(size=11),
+        height=350,
+        xaxis_title="Week Starting",
+        yaxis_title="Tasks Completed"
+    )
+    return fig_velocity
@@ -0,0 +1,165 @@
+"""Headless entry point: ``python -m tasksphere <command> ...``."""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from tasksphere.backup import (BackupError, create_snapshot, default_backup_dir, list_snapshots, prune_snapshots,
+                               restore_snapshot)
+from tasksphere.events import DEFAULT_HOST, read_events
+from tasksphere.exporter import EXPORT_FORMATS, EXPORT_KINDS, export_file, export_file_name
+from tasksphere.importer import DEFAULT_BATCH_SIZE, IMPORT_FORMATS, IMPORT_KINDS, import_file
+from tasksphere.store import DEFAULT_DB_PATH, WorkspaceStore
+
+
+def _import(args) -> int:
+    def report(result):
+        if result.fraction is not None:
+            print(f"\r{result.fraction:6.1%}  {result.inserted} inserted, {result.rejected} rejected",
+                  end='', file=sys.stderr, flush=True)
+
+    store = WorkspaceStore(args.db)
+    try:
+        result = import_file(store, args.kind, args.path, args.format, args.batch_size, on_progress=report)
+    finally:
+        store.close()
+    print(file=sys.stderr)
+    for error in result.errors:
+        print(error, file=sys.stderr)
+    if result.failure:
+        print(f"Import stopped early: {result.failure}", file=sys.stderr)
+    print(f"Imported {result.inserted} {args.kind}, rejected {result.rejected}")
+    return 0 if result.rejected == 0 and not result.failure else 1
+
+
+def _export(args) -> int:
+    unknown = [kind for kind in args.kinds if kind not in EXPORT_KINDS]
+    if unknown:
+        print(f"Unknown kind: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    store = WorkspaceStore(args.db)
+    try:
+        for kind in args.kinds or EXPORT_KINDS:
+            path = os.path.join(args.output_dir, export_file_name(kind, args.format))
+            export_file(store, kind, args.format, path)
+            print(f"Wrote {path}")
+    finally:
+        store.close()
+    return 0
+
+
+def _watch(args) -> int:
+    try:
+        for event in read_events(args.port, args.host):
+            fields = f" ({', '.join(event.fields)})" if event.fields else ""
+            print(f"{event.seq} {event.kind} {event.action} #{event.record_id} {event.label}{fields}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _backup(args) -> int:
+    backup_dir = args.dir or default_backup_dir(args.db)
+    if args.list:
+        for snapshot in list_snapshots(backup_dir):
+            tables = ", ".join(f"{table['rows']} {name}" for name, table in snapshot.tables.items())
+            print(f"{snapshot.snapshot_id}  {tables}")
+        return 0
+    if not os.path.exists(args.db):
+        print(f"No workspace database at {args.db}", file=sys.stderr)
+        return 2
+    snapshot = create_snapshot(args.db, backup_dir)
+    print(f"Snapshot {snapshot.snapshot_id}: {snapshot.rows} rows, {snapshot.new_chunks} new chunks "
+          f"({snapshot.bytes_written / 1e6:.1f} MB), {snapshot.reused_chunks} reused")
+    if args.keep_days is not None:
+        print(f"Pruned {prune_snapshots(backup_dir, args.keep_days)} snapshots older than {args.keep_days} days")
+    return 0
+
+
+def _restore(args) -> int:
+    try:
+        snapshot = restore_snapshot(args.dir or default_backup_dir(args.db), args.snapshot, args.target)
+    except BackupError as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(f"Restored snapshot {snapshot.snapshot_id} ({snapshot.rows} rows) to {args.target}")
+    return 0
+
+
+def _bench(args) -> int:
+    # The chart cases need pandas and plotly, which no other command should have to import
+    from tasksphere.benchmark import DEFAULT_REPEAT, DEFAULT_SIZES, check_budgets, load_budgets, max_rss_mb, run_size
+    from tasksphere.synthetic import WorkspaceSpec
+
+    budgets = load_budgets(args.budgets) if args.budgets else {}
+    results = []
+    for tasks in args.tasks or DEFAULT_SIZES:
+        spec = WorkspaceSpec(tasks, args.projects, args.members, args.skew, args.seed)
+        results.extend(run_size(spec, args.repeat or DEFAULT_REPEAT, args.cases, report=print))
+    rss = max_rss_mb()
+    if rss is not None:
+        print(f"max RSS {rss:.1f} MB")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as output:
+            json.dump({'results': [vars(result) for result in results], 'max_rss_mb': rss}, output, indent=2)
+    violations = check_budgets(results, budgets, rss)
+    for violation in violations:
+        print(f"OVER BUDGET {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m tasksphere", description="TaskSphere workspace tools")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="workspace database (default: %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="bulk-load records from CSV, JSON Lines or a JSON array")
+    import_parser.add_argument("kind", choices=IMPORT_KINDS)
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="default: from the file extension")
+    import_parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    import_parser.set_defaults(handler=_import)
+
+    export_parser = commands.add_parser("export", help="write projects, tasks and team members to files")
+    export_parser.add_argument("kinds", nargs="*", metavar="kind",
+                               help=f"any of {', '.join(EXPORT_KINDS)} (default: all)")
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    export_parser.add_argument("--output-dir", default=".")
+    export_parser.set_defaults(handler=_export)
+
+    watch_parser = commands.add_parser("watch", help="print the running app's change feed")
+    watch_parser.add_argument("--port", type=int, required=True, help="the app's TASKSPHERE_EVENTS_PORT")
+    watch_parser.add_argument("--host", default=DEFAULT_HOST)
+    watch_parser.set_defaults(handler=_watch)
+
+    backup_parser = commands.add_parser("backup", help="take an incremental snapshot of the workspace")
+    backup_parser.add_argument("--dir", help="backup directory (default: tasksphere-backups next to the database)")
+    backup_parser.add_argument("--keep-days", type=int, help="then delete snapshots older than this")
+    backup_parser.add_argument("--list", action="store_true", help="list snapshots instead of taking one")
+    backup_parser.set_defaults(handler=_backup)
+
+    restore_parser = commands.add_parser("restore", help="rebuild a snapshot into a new database file")
+    restore_parser.add_argument("snapshot", help="snapshot id, or latest")
+    restore_parser.add_argument("target", help="path of the database to create")
+    restore_parser.add_argument("--dir", help="backup directory (default: tasksphere-backups next to the database)")
+    restore_parser.set_defaults(handler=_restore)
+
+    bench_parser = commands.add_parser("bench", help="time each page's data path on synthetic workspaces")
+    bench_parser.add_argument("--tasks", type=int, nargs="+", help="workspace sizes (default: 1000 10000 100000)")
+    bench_parser.add_argument("--projects", type=int, default=0, help="default: grows with --tasks")
+    bench_parser.add_argument("--members", type=int, default=0, help="default: grows with --tasks")
+    bench_parser.add_argument("--skew", type=float, default=1.0, help="Zipf exponent for projects and assignees")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--repeat", type=int, help="runs per case (default: 20)")
+    bench_parser.add_argument("--cases", nargs="+", help="run only these cases")
+    bench_parser.add_argument("--budgets", help="JSON file of limits; exits 1 when one is exceeded")
+    bench_parser.add_argument("--json", help="also write the results to this file")
+    bench_parser.set_defaults(handler=_bench)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
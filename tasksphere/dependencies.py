@@ -0,0 +1,302 @@
+"""Task dependency graph: cycle checks, an incrementally kept topological order, critical paths and blocked tasks."""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tasksphere.listeners import StoreListener
+from tasksphere.rollups import COMPLETED_STATUS
+
+
+class DependencyCycleError(ValueError):
+    def __init__(self, cycle: List[int]):
+        super().__init__("Dependency would create a cycle: " + " -> ".join(f"#{task_id}" for task_id in cycle))
+        self.cycle = cycle
+
+
+@dataclass
+class ProjectSchedule:
+    """A project's open work laid out in dependency order, one step per open task.
+
+    ``earliest_start`` is the step a task can start at once everything before it is done, and
+    the critical path is the longest chain of open tasks; completed tasks take no steps.
+    """
+    project_id: Optional[int]
+    order: List[int] = field(default_factory=list)
+    earliest_start: Dict[int, int] = field(default_factory=dict)
+    critical_path: List[int] = field(default_factory=list)
+    length: int = 0
+    blocked: List[int] = field(default_factory=list)
+
+
+class _Node:
+    __slots__ = ('project_id', 'open', 'position')
+
+    def __init__(self, project_id: Optional[int], is_open: bool, position: int):
+        self.project_id = project_id
+        self.open = is_open
+        self.position = position
+
+
+def _is_open(task: Dict) -> bool:
+    return task.get('status') != COMPLETED_STATUS
+
+
+class DependencyGraph(StoreListener):
+    """Edges run from a blocking task to the task that waits on it.
+
+    Every task has a position such that blockers always come first. Adding an edge that
+    already agrees with the positions costs O(1); otherwise only the tasks between the two
+    positions are searched and reordered (Pearce-Kelly). Per-project schedules are cached
+    and dropped only for projects a write touches.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._nodes: Dict[int, _Node] = {}
+        self._blockers: Dict[int, Set[int]] = {}
+        self._dependents: Dict[int, Set[int]] = {}
+        self._open_blockers: Dict[int, int] = {}
+        self._project_tasks: Dict[Optional[int], Set[int]] = {}
+        self._schedules: Dict[Optional[int], ProjectSchedule] = {}
+        self._next_position = 0
+        self.version = 0
+
+    def load(self, tasks: Iterable[Dict], edges: Iterable[Tuple[int, int]]):
+        """``tasks`` need ``id``, ``project_id`` and ``status``; ``edges`` are (task, blocker) pairs."""
+        with self._lock:
+            self.__init__()
+            for task in tasks:
+                self._add_node(task)
+            for task_id, blocker_id in edges:
+                self._link(blocker_id, task_id)
+            # Kahn's algorithm gives the initial positions in O(V + E)
+            waiting = {task_id: len(blockers) for task_id, blockers in self._blockers.items()}
+            ready = deque(task_id for task_id in self._nodes if not waiting.get(task_id))
+            position = 0
+            while ready:
+                task_id = ready.popleft()
+                self._nodes[task_id].position = position
+                position += 1
+                for dependent in self._dependents.get(task_id, ()):
+                    waiting[dependent] -= 1
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+            if position != len(self._nodes):
+                raise ValueError("Stored task dependencies contain a cycle")
+            self._next_position = position
+
+    # Reads
+
+    def blockers(self, task_id: int) -> Set[int]:
+        return set(self._blockers.get(task_id, ()))
+
+    def dependents(self, task_id: int) -> Set[int]:
+        return set(self._dependents.get(task_id, ()))
+
+    def is_blocked(self, task_id: int) -> bool:
+        """An open task with at least one open blocker."""
+        node = self._nodes.get(task_id)
+        return node is not None and node.open and self._open_blockers.get(task_id, 0) > 0
+
+    def schedule(self, project_id: Optional[int]) -> ProjectSchedule:
+        with self._lock:
+            schedule = self._schedules.get(project_id)
+            if schedule is None:
+                schedule = self._schedules[project_id] = self._build_schedule(project_id)
+            return schedule
+
+    def _build_schedule(self, project_id: Optional[int]) -> ProjectSchedule:
+        # Kahn's algorithm and a longest-path pass over the project's own tasks and edges: O(V + E)
+        members = self._project_tasks.get(project_id, set())
+        schedule = ProjectSchedule(project_id)
+        waiting = {task_id: sum(1 for blocker in self._blockers.get(task_id, ()) if blocker in members)
+                   for task_id in members}
+        ready = deque(sorted((task_id for task_id, count in waiting.items() if not count),
+                             key=lambda task_id: self._nodes[task_id].position))
+        finish: Dict[int, int] = {}
+        previous: Dict[int, Optional[int]] = {}
+        while ready:
+            task_id = ready.popleft()
+            schedule.order.append(task_id)
+            start, before = 0, None
+            for blocker in self._blockers.get(task_id, ()):
+                if blocker in members and finish[blocker] > start:
+                    start, before = finish[blocker], blocker
+            schedule.earliest_start[task_id] = start
+            finish[task_id] = start + (1 if self._nodes[task_id].open else 0)
+            previous[task_id] = before
+            for dependent in self._dependents.get(task_id, ()):
+                if dependent in members:
+                    waiting[dependent] -= 1
+                    if not waiting[dependent]:
+                        ready.append(dependent)
+        if finish:
+            last = max(finish, key=finish.get)
+            schedule.length = finish[last]
+            if schedule.length:
+                while last is not None:
+                    schedule.critical_path.append(last)
+                    last = previous[last]
+                schedule.critical_path.reverse()
+        schedule.blocked = [task_id for task_id in schedule.order if self.is_blocked(task_id)]
+        return schedule
+
+    # Edges
+
+    def check(self, task_id: int, blocker_id: int):
+        """Raise unless ``task_id`` can wait on ``blocker_id``: both exist and no cycle results."""
+        with self._lock:
+            for checked in (task_id, blocker_id):
+                if checked not in self._nodes:
+                    raise ValueError(f"No task #{checked}")
+            if task_id == blocker_id:
+                raise DependencyCycleError([task_id, task_id])
+            path = self._path(task_id, blocker_id)
+            if path is not None:
+                raise DependencyCycleError([blocker_id, *path])
+
+    def _path(self, start: int, goal: int) -> Optional[List[int]]:
+        """A dependents-path from ``start`` to ``goal``, searching only positions up to the goal's."""
+        limit = self._nodes[goal].position
+        if self._nodes[start].position > limit:
+            return None
+        parents: Dict[int, Optional[int]] = {start: None}
+        stack = [start]
+        while stack:
+            task_id = stack.pop()
+            if task_id == goal:
+                path = []
+                while task_id is not None:
+                    path.append(task_id)
+                    task_id = parents[task_id]
+                return path[::-1]
+            for dependent in self._dependents.get(task_id, ()):
+                if dependent not in parents and self._nodes[dependent].position <= limit:
+                    parents[dependent] = task_id
+                    stack.append(dependent)
+        return None
+
+    def _reorder(self, blocker_id: int, task_id: int):
+        # Pearce-Kelly: the tasks that must now follow task_id and those that must precede
+        # blocker_id swap into the positions they occupied between them
+        lower, upper = self._nodes[task_id].position, self._nodes[blocker_id].position
+        forward = self._reach(task_id, self._dependents, lambda position: position <= upper)
+        backward = self._reach(blocker_id, self._blockers, lambda position: position >= lower)
+        ordered = sorted(backward, key=lambda node: self._nodes[node].position) + \
+            sorted(forward, key=lambda node: self._nodes[node].position)
+        positions = sorted(self._nodes[node].position for node in ordered)
+        for node, position in zip(ordered, positions):
+            self._nodes[node].position = position
+
+    def _reach(self, start: int, edges: Dict[int, Set[int]], within) -> Set[int]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for neighbour in edges.get(stack.pop(), ()):
+                if neighbour not in seen and within(self._nodes[neighbour].position):
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        return seen
+
+    def _link(self, blocker_id: int, task_id: int):
+        self._blockers.setdefault(task_id, set()).add(blocker_id)
+        self._dependents.setdefault(blocker_id, set()).add(task_id)
+        if self._nodes[blocker_id].open:
+            self._open_blockers[task_id] = self._open_blockers.get(task_id, 0) + 1
+
+    def _unlink(self, blocker_id: int, task_id: int):
+        self._blockers[task_id].discard(blocker_id)
+        self._dependents[blocker_id].discard(task_id)
+        if self._nodes[blocker_id].open:
+            self._open_blockers[task_id] -= 1
+
+    def _invalidate(self, *task_ids: int):
+        for task_id in task_ids:
+            node = self._nodes.get(task_id)
+            if node is not None:
+                self._schedules.pop(node.project_id, None)
+        self.version += 1
+
+    # Nodes
+
+    def _add_node(self, task: Dict):
+        self._nodes[task['id']] = _Node(task.get('project_id'), _is_open(task), self._next_position)
+        self._next_position += 1
+        self._project_tasks.setdefault(task.get('project_id'), set()).add(task['id'])
+
+    def _remove_node(self, task_id: int):
+        for blocker in list(self._blockers.get(task_id, ())):
+            self._unlink(blocker, task_id)
+        for dependent in list(self._dependents.get(task_id, ())):
+            self._unlink(task_id, dependent)
+        self._blockers.pop(task_id, None)
+        self._dependents.pop(task_id, None)
+        self._open_blockers.pop(task_id, None)
+        node = self._nodes.pop(task_id)
+        self._project_tasks[node.project_id].discard(task_id)
+
+    # Write hooks
+
+    def dependency_added(self, dependency: Dict):
+        with self._lock:
+            task_id, blocker_id = dependency['task_id'], dependency['depends_on']
+            if blocker_id in self._blockers.get(task_id, ()):
+                return
+            if self._nodes[blocker_id].position > self._nodes[task_id].position:
+                self._reorder(blocker_id, task_id)
+            self._link(blocker_id, task_id)
+            self._invalidate(task_id, blocker_id)
+
+    def dependency_removed(self, dependency: Dict):
+        # Dropping an edge never breaks the order, so positions stay as they are
+        with self._lock:
+            task_id, blocker_id = dependency['task_id'], dependency['depends_on']
+            if blocker_id not in self._blockers.get(task_id, ()):
+                return
+            self._unlink(blocker_id, task_id)
+            self._invalidate(task_id, blocker_id)
+
+    def task_added(self, task: Dict):
+        with self._lock:
+            self._add_node(task)
+            self._invalidate(task['id'])
+
+    def task_updated(self, old: Dict, new: Dict):
+        was_open, is_open = _is_open(old), _is_open(new)
+        if was_open == is_open and old.get('project_id') == new.get('project_id'):
+            return
+        with self._lock:
+            task_id = new['id']
+            node = self._nodes[task_id]
+            # The task's own project and the projects of the tasks waiting on it
+            self._invalidate(task_id, *self._dependents.get(task_id, ()))
+            if was_open != is_open:
+                for dependent in self._dependents.get(task_id, ()):
+                    self._open_blockers[dependent] = self._open_blockers.get(dependent, 0) + (1 if is_open else -1)
+                node.open = is_open
+            if old.get('project_id') != new.get('project_id'):
+                self._project_tasks[node.project_id].discard(task_id)
+                node.project_id = new.get('project_id')
+                self._project_tasks.setdefault(node.project_id, set()).add(task_id)
+                self._invalidate(task_id)
+
+    def task_removed(self, task: Dict):
+        # The database deletes the task's dependency rows along with it
+        with self._lock:
+            if task['id'] not in self._nodes:
+                return
+            self._invalidate(task['id'], *self._dependents.get(task['id'], ()), *self._blockers.get(task['id'], ()))
+            self._remove_node(task['id'])
+
+    def project_removed(self, project: Dict):
+        # Its tasks' project_id becomes NULL
+        with self._lock:
+            moved = self._project_tasks.pop(project['id'], set())
+            for task_id in moved:
+                self._nodes[task_id].project_id = None
+            self._project_tasks.setdefault(None, set()).update(moved)
+            self._schedules.pop(project['id'], None)
+            self._schedules.pop(None, None)
+            self.version += 1
@@ -0,0 +1,192 @@
+"""Change feed of project, task and team member writes, with an optional local socket fan-out."""
+
+import json
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from tasksphere.listeners import StoreListener
+
+EVENT_KINDS = ['project', 'task', 'member']
+DEFAULT_CAPACITY = 1000
+DEFAULT_HOST = "127.0.0.1"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    seq: int
+    kind: str
+    action: str
+    record_id: int
+    label: str
+    fields: Tuple[str, ...] = ()
+    timestamp: float = 0.0
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, line: str) -> "ChangeEvent":
+        data = json.loads(line)
+        return cls(**{**data, 'fields': tuple(data.get('fields', ()))})
+
+
+Subscriber = Callable[[ChangeEvent], None]
+
+
+def _label(record: Dict) -> str:
+    return record.get('name') or record.get('title') or f"#{record['id']}"
+
+
+class EventBus(StoreListener):
+    """Numbers every committed write and keeps the most recent ones in a ring buffer.
+
+    Readers poll with ``since(seq)`` or ``version(kind)``; subscribers are called
+    synchronously on the writing thread, so they must be quick.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._events: "deque[ChangeEvent]" = deque(maxlen=capacity)
+        self._changed = threading.Condition()
+        self._subscribers: List[Subscriber] = []
+        self._versions: Dict[str, int] = dict.fromkeys(EVENT_KINDS, 0)
+        self.last_seq = 0
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        with self._changed:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe():
+            with self._changed:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+        return unsubscribe
+
+    def publish(self, kind: str, action: str, record: Dict, fields: Tuple[str, ...] = ()) -> ChangeEvent:
+        with self._changed:
+            self.last_seq += 1
+            event = ChangeEvent(self.last_seq, kind, action, record['id'], _label(record), fields, time.time())
+            self._events.append(event)
+            self._versions[kind] = event.seq
+            subscribers = list(self._subscribers)
+            self._changed.notify_all()
+        for subscriber in subscribers:
+            # A broken subscriber must not fail the write that triggered it
+            try:
+                subscriber(event)
+            except Exception:
+                logger.exception("Change feed subscriber %r failed", subscriber)
+        return event
+
+    # Polling
+
+    def version(self, kind: str) -> int:
+        """Sequence number of the latest event of ``kind``; it moves whenever that data changes."""
+        return self._versions[kind]
+
+    def since(self, seq: int) -> List[ChangeEvent]:
+        """Events after ``seq`` that are still in the buffer, oldest first."""
+        with self._changed:
+            newer = []
+            for event in reversed(self._events):
+                if event.seq <= seq:
+                    break
+                newer.append(event)
+        newer.reverse()
+        return newer
+
+    def recent(self, limit: int) -> List[ChangeEvent]:
+        with self._changed:
+            return list(self._events)[-limit:][::-1]
+
+    def wait(self, seq: int, timeout: float) -> List[ChangeEvent]:
+        """Block until something newer than ``seq`` is published or ``timeout`` passes."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.last_seq > seq, timeout)
+        return self.since(seq)
+
+    # Store hooks
+
+    @staticmethod
+    def _changed_fields(old: Dict, new: Dict) -> Tuple[str, ...]:
+        return tuple(key for key, value in new.items() if key != 'version' and old.get(key) != value)
+
+    def project_added(self, project: Dict):
+        self.publish('project', 'added', project)
+
+    def project_updated(self, old: Dict, new: Dict):
+        self.publish('project', 'updated', new, self._changed_fields(old, new))
+
+    def project_removed(self, project: Dict):
+        self.publish('project', 'removed', project)
+
+    def task_added(self, task: Dict):
+        self.publish('task', 'added', task)
+
+    def task_updated(self, old: Dict, new: Dict):
+        self.publish('task', 'updated', new, self._changed_fields(old, new))
+
+    def task_removed(self, task: Dict):
+        self.publish('task', 'removed', task)
+
+    def member_added(self, member: Dict):
+        self.publish('member', 'added', member)
+
+    def member_removed(self, member: Dict):
+        self.publish('member', 'removed', member)
+
+
+class SocketFanout:
+    """Streams every event on ``bus`` as a JSON line to clients of a localhost TCP port.
+
+    Sends never block the writer: a client that cannot keep up is disconnected.
+    """
+
+    def __init__(self, bus: EventBus, port: int, host: str = DEFAULT_HOST):
+        self._server = socket.create_server((host, port))
+        self.address = self._server.getsockname()
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept_loop, name="tasksphere-events", daemon=True).start()
+        self._unsubscribe = bus.subscribe(self._send)
+
+    def _accept_loop(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            client.setblocking(False)
+            with self._lock:
+                self._clients.append(client)
+
+    def _send(self, event: ChangeEvent):
+        data = (event.to_json() + "\n").encode('utf-8')
+        with self._lock:
+            for client in list(self._clients):
+                try:
+                    client.sendall(data)
+                except OSError:
+                    self._clients.remove(client)
+                    client.close()
+
+    def close(self):
+        self._unsubscribe()
+        self._server.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+
+def read_events(port: int, host: str = DEFAULT_HOST) -> Iterator[ChangeEvent]:
+    """Follow a ``SocketFanout`` from another process."""
+    with socket.create_connection((host, port)) as conn, conn.makefile('r', encoding='utf-8') as lines:
+        for line in lines:
+            yield ChangeEvent.from_json(line)
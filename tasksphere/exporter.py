@@ -0,0 +1,112 @@
+"""Chunked export of projects, tasks and team members to CSV, JSON Lines or Parquet."""
+
+import csv
+import importlib.util
+import io
+import json
+from typing import BinaryIO, Dict, Iterator, List
+
+from tasksphere.atomic import atomic_writer
+from tasksphere.store import MEMBER_COLUMNS, PROJECT_COLUMNS, TASK_COLUMNS, WorkspaceStore
+
+EXPORT_COLUMNS: Dict[str, List[str]] = {
+    'projects': ['id', *PROJECT_COLUMNS],
+    'tasks': ['id', *TASK_COLUMNS],
+    'team_members': ['id', *MEMBER_COLUMNS],
+}
+EXPORT_KINDS = list(EXPORT_COLUMNS)
+EXPORT_FORMATS = ['csv', 'jsonl', 'parquet']
+FILE_EXTENSIONS = {'csv': 'csv', 'jsonl': 'jsonl', 'parquet': 'parquet'}
+MIME_TYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson', 'parquet': 'application/vnd.apache.parquet'}
+DEFAULT_CHUNK_SIZE = 5000
+
+# Parquet column types; everything not listed is a string
+PARQUET_NUMERIC_COLUMNS = {
+    'id': 'int64', 'project_id': 'int64', 'assignee_id': 'int64',
+    'progress': 'int64', 'team_size': 'int64', 'budget': 'float64',
+}
+
+
+def available_formats() -> List[str]:
+    # Parquet support is optional; look for pyarrow without paying for its import until an export runs
+    if importlib.util.find_spec('pyarrow') is not None:
+        return EXPORT_FORMATS
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet']
+
+
+def _columns(kind: str) -> List[str]:
+    if kind not in EXPORT_COLUMNS:
+        raise ValueError(f"Unknown export kind {kind!r}")
+    return EXPORT_COLUMNS[kind]
+
+
+def iter_csv(store: WorkspaceStore, kind: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    columns = _columns(kind)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in store.iter_rows(kind, columns, chunk_size):
+        writer.writerows(rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_jsonl(store: WorkspaceStore, kind: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    columns = _columns(kind)
+    for rows in store.iter_rows(kind, columns, chunk_size):
+        yield "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+
+def write_parquet(store: WorkspaceStore, kind: str, target: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Write one row group per chunk so only a chunk is ever held in memory."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:  # Parquet export is optional
+        raise RuntimeError("Parquet export needs the optional 'pyarrow' package") from None
+    columns = _columns(kind)
+    schema = pa.schema([(column, PARQUET_NUMERIC_COLUMNS.get(column, 'string')) for column in columns])
+    with pq.ParquetWriter(target, schema) as writer:
+        for rows in store.iter_rows(kind, columns, chunk_size):
+            data = {column: list(values) for column, values in zip(columns, zip(*rows))}
+            writer.write_table(pa.Table.from_pydict(data, schema=schema))
+
+
+def export_to(store: WorkspaceStore, kind: str, fmt: str, target: BinaryIO,
+              chunk_size: int = DEFAULT_CHUNK_SIZE):
+    if fmt == 'parquet':
+        write_parquet(store, kind, target, chunk_size)
+        return
+    if fmt == 'csv':
+        chunks = iter_csv(store, kind, chunk_size)
+    elif fmt == 'jsonl':
+        chunks = iter_jsonl(store, kind, chunk_size)
+    else:
+        raise ValueError(f"Unknown export format {fmt!r}")
+    for chunk in chunks:
+        target.write(chunk.encode('utf-8'))
+
+
+def export_bytes(store: WorkspaceStore, kind: str, fmt: str) -> io.BytesIO:
+    """The whole export in memory, for a download button.
+
+    Streamlit keeps downloads in memory anyway; ``export_file`` is the bounded-memory path.
+    """
+    buffer = io.BytesIO()
+    export_to(store, kind, fmt, buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def export_file(store: WorkspaceStore, kind: str, fmt: str, path: str,
+                chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Write an export next to ``path`` and move it into place only once it is complete."""
+    with atomic_writer(path) as target:
+        export_to(store, kind, fmt, target, chunk_size)
+
+
+def export_file_name(kind: str, fmt: str) -> str:
+    return f"tasksphere-{kind}.{FILE_EXTENSIONS[fmt]}"
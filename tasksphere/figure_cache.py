@@ -0,0 +1,45 @@
+"""Process-wide LRU cache of built chart figures, keyed on the data version they were built from."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from tasksphere.profiling import span
+
+DEFAULT_MAX_FIGURES = 32
+
+
+class FigureCache:
+    """Keeps the most recently used figures; a figure is rebuilt only when its data version moves."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_FIGURES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, name: Hashable, version: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return entry[1]
+        # Build outside the lock; two sessions racing on the same miss just both build it
+        with span(f"figure.build.{name}"):
+            figure = build()
+        with self._lock:
+            self.misses += 1
+            self._entries[name] = (version, figure)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,85 @@
+"""Filter and sort options for the task list, compiled to indexed SQL."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from tasksphere.search import match_query, task_match_subquery
+
+PRIORITY_RANK_SQL = "CASE priority WHEN 'High' THEN 0 WHEN 'Medium' THEN 1 WHEN 'Low' THEN 2 ELSE 3 END"
+STATUS_RANK_SQL = "CASE status WHEN 'Pending' THEN 0 WHEN 'In Progress' THEN 1 WHEN 'Completed' THEN 2 ELSE 3 END"
+
+# Sort label -> ORDER BY expression; id keeps the order stable between pages
+TASK_SORT_KEYS = {
+    'Relevance': 'match_rank, id',
+    'Oldest': 'id',
+    'Newest': 'id DESC',
+    'Due Date': 'due_date IS NULL, due_date, id',
+    'Priority': f'{PRIORITY_RANK_SQL}, id',
+    'Status': f'{STATUS_RANK_SQL}, id',
+    'Title': 'title COLLATE NOCASE, id',
+}
+
+# Filter field -> indexed tasks column
+TASK_FILTER_COLUMNS = {
+    'projects': 'project',
+    'assignees': 'assignee',
+    'statuses': 'status',
+    'priorities': 'priority',
+}
+
+
+@dataclass
+class TaskFilter:
+    projects: List[str] = field(default_factory=list)
+    assignees: List[str] = field(default_factory=list)
+    statuses: List[str] = field(default_factory=list)
+    priorities: List[str] = field(default_factory=list)
+    due_from: Optional[str] = None
+    due_to: Optional[str] = None
+    sort_by: str = 'Oldest'
+    search: str = ''
+
+    def match(self) -> Optional[str]:
+        return match_query(self.search) if self.search else None
+
+    def is_empty(self) -> bool:
+        return (not any(getattr(self, name) for name in TASK_FILTER_COLUMNS)
+                and not (self.due_from or self.due_to) and self.match() is None)
+
+    def single_field(self) -> Optional[Tuple[str, List[str]]]:
+        """The (column, values) pair when only one categorical field is filtered, else None."""
+        active = [(column, getattr(self, name)) for name, column in TASK_FILTER_COLUMNS.items() if getattr(self, name)]
+        if len(active) == 1 and not (self.due_from or self.due_to) and self.match() is None:
+            return active[0]
+        return None
+
+    def from_clause(self) -> Tuple[str, list]:
+        # Search hits are joined in through the FTS index, carrying their bm25 rank
+        query = self.match()
+        if query is None:
+            return "tasks", []
+        return f"tasks JOIN ({task_match_subquery()}) ON match_id = tasks.id", [query]
+
+    def where_clause(self) -> Tuple[str, list]:
+        conditions, params = [], []
+        for name, column in TASK_FILTER_COLUMNS.items():
+            values = getattr(self, name)
+            if values:
+                conditions.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+        if self.due_from:
+            conditions.append("due_date >= ?")
+            params.append(self.due_from)
+        if self.due_to:
+            conditions.append("due_date <= ?")
+            params.append(self.due_to)
+        if not conditions:
+            return "", params
+        return "WHERE " + " AND ".join(conditions), params
+
+    def order_clause(self) -> str:
+        if self.sort_by not in TASK_SORT_KEYS:
+            raise ValueError(f"Unknown sort key {self.sort_by!r}")
+        if self.sort_by == 'Relevance' and self.match() is None:
+            return "ORDER BY id"
+        return "ORDER BY " + TASK_SORT_KEYS[self.sort_by]
@@ -0,0 +1,64 @@
+"""Burndown, cumulative flow and velocity series read from the daily status rollup."""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import pandas as pd
+
+from tasksphere.rollups import COMPLETED_STATUS
+from tasksphere.store import WorkspaceStore
+
+EPOCH = date(1970, 1, 1)
+HISTORY_RANGES = {'Last 30 days': 30, 'Last 90 days': 90, 'Last year': 365}
+
+
+def day_number(day: date) -> int:
+    return (day - EPOCH).days
+
+
+def utc_today() -> date:
+    """Today in UTC, the calendar the history triggers stamp events with."""
+    return datetime.now(timezone.utc).date()
+
+
+def cumulative_flow(store: WorkspaceStore, days: int, today: Optional[date] = None) -> pd.DataFrame:
+    """Tasks in each status at the end of each of the last ``days`` days, one column per status.
+
+    Reads only the rollup: one aggregate for everything before the window and one row per
+    day and status inside it, however many events the history holds.
+    """
+    last = day_number(today or utc_today())
+    first = last - days + 1
+    baseline = store.status_totals_before(first)
+    changes = store.status_flow(first, last)
+    index = pd.date_range(EPOCH + timedelta(days=first), periods=days, freq='D')
+    statuses = sorted(set(baseline) | {row['status'] for row in changes})
+    frame = pd.DataFrame(0, index=index, columns=statuses)
+    for row in changes:
+        frame.at[pd.Timestamp(EPOCH + timedelta(days=row['day'])), row['status']] += row['entered'] - row['exited']
+    frame = frame.cumsum()
+    for status, count in baseline.items():
+        frame[status] += count
+    frame.index.name = 'Date'
+    return frame
+
+
+def burndown(flow: pd.DataFrame) -> pd.Series:
+    """Open (not completed) tasks at the end of each day."""
+    return flow.drop(columns=[COMPLETED_STATUS], errors='ignore').sum(axis=1).rename('Open Tasks')
+
+
+def velocity(store: WorkspaceStore, days: int, today: Optional[date] = None) -> pd.Series:
+    """Tasks moved to Completed per week, weeks starting on Monday."""
+    last = day_number(today or utc_today())
+    rows = [row for row in store.status_flow(last - days + 1, last) if row['status'] == COMPLETED_STATUS]
+    daily = pd.Series(
+        [row['entered'] for row in rows],
+        index=pd.DatetimeIndex([EPOCH + timedelta(days=row['day']) for row in rows]),
+        dtype='int64',
+    )
+    index = pd.date_range(EPOCH + timedelta(days=last - days + 1), periods=days, freq='D')
+    weekly = daily.reindex(index, fill_value=0).resample('W-MON', label='left', closed='left').sum()
+    weekly.index.name = 'Week'
+    return weekly.rename('Completed')
+
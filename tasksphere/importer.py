@@ -0,0 +1,269 @@
+"""Streaming bulk import of projects, tasks and team members from CSV, JSON Lines or a JSON array."""
+
+import csv
+import io
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from tasksphere.schemas import ValidationError, validate_member, validate_project, validate_task
+from tasksphere.store import DuplicateNameError, WorkspaceStore
+
+IMPORT_KINDS = ['projects', 'tasks', 'team_members']
+IMPORT_FORMATS = ['csv', 'jsonl', 'json']
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+JSON_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'\s*')
+
+ProgressCallback = Callable[["ImportResult"], None]
+
+
+@dataclass
+class ImportResult:
+    inserted: int = 0
+    rejected: int = 0
+    bytes_read: int = 0
+    total_bytes: Optional[int] = None
+    errors: List[str] = field(default_factory=list)
+    # Why the file could not be read to the end; records before that point are imported
+    failure: Optional[str] = None
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.total_bytes:
+            return None
+        return min(1.0, self.bytes_read / self.total_bytes)
+
+
+class ImportFormatError(Exception):
+    """The file is malformed in a way that stops it being read any further."""
+
+
+class _CountingReader(io.RawIOBase):
+    """Wraps a binary stream and counts the bytes handed to the parser."""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self.bytes_read += size
+        return size
+
+
+def detect_format(file_name: str) -> str:
+    lowered = file_name.lower()
+    if lowered.endswith('.csv'):
+        return 'csv'
+    if lowered.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if lowered.endswith('.json'):
+        return 'json'
+    raise ValueError(f"Cannot tell the format of {file_name!r}; use .csv, .jsonl or .json")
+
+
+def iter_records(text: io.TextIOBase, fmt: str) -> Iterator[Union[Dict, ValidationError]]:
+    """Yield one raw record at a time without reading the whole file.
+
+    Lines that cannot be parsed are yielded as ``ValidationError`` instances so one bad
+    line does not end the import; damage the parser cannot step past raises ``ImportFormatError``.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        try:
+            yield from reader
+        except csv.Error as error:
+            raise ImportFormatError(f"after line {reader.line_num}: {error}") from None
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(text, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as error:
+                yield ValidationError(f"line {line_number}: invalid JSON ({error.msg})")
+                continue
+            if not isinstance(record, dict):
+                yield ValidationError(f"line {line_number}: expected a JSON object")
+                continue
+            yield record
+    elif fmt == 'json':
+        for record in _iter_json_array(text):
+            if not isinstance(record, dict):
+                yield ValidationError("expected a JSON object")
+                continue
+            yield record
+    else:
+        raise ValueError(f"Unknown import format {fmt!r}")
+
+
+def _iter_json_array(text: io.TextIOBase) -> Iterator:
+    """Yield the elements of a top-level JSON array, holding about one chunk of text at a time."""
+    decoder = json.JSONDecoder()
+    buffer, position, at_end = '', 0, False
+
+    def read_more():
+        nonlocal buffer, position, at_end
+        chunk = text.read(JSON_CHUNK_SIZE)
+        buffer, position, at_end = buffer[position:] + chunk, 0, not chunk
+
+    def next_char() -> str:
+        # The next non-whitespace character, or '' at the end of the file
+        nonlocal position
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer) or at_end:
+                return buffer[position:position + 1]
+            read_more()
+
+    if next_char() != '[':
+        raise ImportFormatError("expected a JSON array of objects")
+    position += 1
+    if next_char() == ']':
+        return
+    number = 1
+    while True:
+        next_char()
+        # An element may run past the buffer, and a number may go on in the next chunk, so
+        # read on until it decodes short of the buffer's end or the file ends
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if at_end:
+                    raise ImportFormatError(f"element {number}: invalid JSON ({error.msg})") from None
+            else:
+                if end < len(buffer) or at_end:
+                    break
+            read_more()
+        position = end
+        yield element
+        separator = next_char()
+        if separator == ']':
+            break
+        if separator != ',':
+            raise ImportFormatError(f"element {number}: expected ',' or ']' after it")
+        position += 1
+        number += 1
+    position += 1
+    if next_char():
+        raise ImportFormatError("unexpected content after the JSON array")
+
+
+class _Importer:
+    """Validates records for one kind and tracks names that must stay unique."""
+
+    def __init__(self, store: WorkspaceStore, kind: str):
+        if kind not in IMPORT_KINDS:
+            raise ValueError(f"Unknown import kind {kind!r}")
+        self.store = store
+        self.kind = kind
+        self._batch_names = set()
+
+    def validate(self, record: Dict) -> Dict:
+        keys = self.store.keys
+        if self.kind == 'projects':
+            project = validate_project(record)
+            self._claim_name(project['name'], keys.project_id(project['name']) is not None)
+            return project
+        if self.kind == 'team_members':
+            member = validate_member(record)
+            self._claim_name(member['name'], keys.member_id(member['name']) is not None)
+            return member
+        task = validate_task(record)
+        if keys.project_id(task['project']) is None:
+            raise ValidationError(f"unknown project {task['project']!r}")
+        if keys.member_id(task['assignee']) is None:
+            raise ValidationError(f"unknown assignee {task['assignee']!r}")
+        return task
+
+    def _claim_name(self, name: str, exists: bool):
+        if exists or name in self._batch_names:
+            raise ValidationError(f"duplicate name {name!r}")
+        self._batch_names.add(name)
+
+    def insert(self, batch: List[Dict]):
+        if self.kind == 'projects':
+            self.store.add_projects(batch)
+        elif self.kind == 'team_members':
+            self.store.add_team_members(batch)
+        else:
+            self.store.add_tasks(batch)
+        self._batch_names.clear()
+
+
+def import_stream(store: WorkspaceStore, kind: str, stream: BinaryIO, fmt: str,
+                  batch_size: int = DEFAULT_BATCH_SIZE, total_bytes: Optional[int] = None,
+                  on_progress: Optional[ProgressCallback] = None) -> ImportResult:
+    """Parse ``stream`` incrementally and insert valid records ``batch_size`` at a time.
+
+    Invalid records are counted and skipped; at most ``MAX_REPORTED_ERRORS`` messages are kept.
+    A file that is not UTF-8 or cannot be parsed any further ends the import early with
+    ``failure`` set; the batches before that point stay imported.
+    """
+    importer = _Importer(store, kind)
+    counter = _CountingReader(stream)
+    text = io.TextIOWrapper(io.BufferedReader(counter), encoding='utf-8-sig', newline='')
+    result = ImportResult(total_bytes=total_bytes)
+    batch: List[Tuple[int, Dict]] = []
+
+    def reject(number: int, error: Exception):
+        result.rejected += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(f"record {number}: {error}")
+
+    def flush():
+        while batch:
+            try:
+                importer.insert([record for _, record in batch])
+            except DuplicateNameError as error:
+                # Someone else added the name after the batch was validated; the batch rolled
+                # back, so insert it again without the records that use it
+                duplicates = [number for number, record in batch if record.get('name') == error.name]
+                if not duplicates:
+                    raise
+                for number in duplicates:
+                    reject(number, ValidationError(f"duplicate name {error.name!r}"))
+                batch[:] = [(number, record) for number, record in batch if record.get('name') != error.name]
+            else:
+                result.inserted += len(batch)
+                batch.clear()
+        result.bytes_read = counter.bytes_read
+        if on_progress is not None:
+            on_progress(result)
+
+    try:
+        for number, record in enumerate(iter_records(text, fmt), start=1):
+            try:
+                if isinstance(record, ValidationError):
+                    raise record
+                batch.append((number, importer.validate(record)))
+            except ValidationError as error:
+                reject(number, error)
+            if len(batch) >= batch_size:
+                flush()
+    except UnicodeDecodeError:
+        result.failure = "the file is not UTF-8 text; save it as UTF-8 and import it again"
+    except ImportFormatError as error:
+        result.failure = str(error)
+    flush()
+    return result
+
+
+def import_file(store: WorkspaceStore, kind: str, path: str, fmt: Optional[str] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE,
+                on_progress: Optional[ProgressCallback] = None) -> ImportResult:
+    with open(path, 'rb') as stream:
+        return import_stream(store, kind, stream, fmt or detect_format(path), batch_size,
+                             total_bytes=os.path.getsize(path), on_progress=on_progress)
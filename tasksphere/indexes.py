@@ -0,0 +1,81 @@
+"""In-memory primary-key and name indexes for projects and team members."""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from tasksphere.listeners import StoreListener
+
+
+class KeyIndex(StoreListener):
+    """id -> record and name -> id maps for the two small reference tables.
+
+    Tasks point at projects and assignees through these, so resolving a form's
+    display name to a foreign key, or a key back to its record, is a dict lookup.
+    Tasks themselves are looked up through SQLite's integer primary key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.projects: Dict[int, Dict] = {}
+        self.members: Dict[int, Dict] = {}
+        self._project_ids: Dict[str, int] = {}
+        self._member_ids: Dict[str, int] = {}
+
+    def load(self, projects: Iterable[Dict], members: Iterable[Dict]):
+        with self._lock:
+            self.projects = {project['id']: project for project in projects}
+            self.members = {member['id']: member for member in members}
+            self._project_ids = self._names(self.projects)
+            self._member_ids = self._names(self.members)
+
+    @staticmethod
+    def _names(records: Dict[int, Dict]) -> Dict[str, int]:
+        # The first record with a given name owns it, matching the order the selectboxes show
+        names = {}
+        for record_id, record in records.items():
+            names.setdefault(record['name'], record_id)
+        return names
+
+    # Lookups
+
+    def project_id(self, name: Optional[str]) -> Optional[int]:
+        return self._project_ids.get(name)
+
+    def member_id(self, name: Optional[str]) -> Optional[int]:
+        return self._member_ids.get(name)
+
+    def project_names(self) -> List[str]:
+        return list(self._project_ids)
+
+    def member_names(self) -> List[str]:
+        return list(self._member_ids)
+
+    # Write hooks
+
+    def project_added(self, project: Dict):
+        with self._lock:
+            self.projects[project['id']] = project
+            self._project_ids.setdefault(project['name'], project['id'])
+
+    def project_updated(self, old: Dict, new: Dict):
+        with self._lock:
+            self.projects[new['id']] = new
+            if old['name'] != new['name']:
+                self._project_ids = self._names(self.projects)
+
+    def project_removed(self, project: Dict):
+        with self._lock:
+            del self.projects[project['id']]
+            if self._project_ids.get(project['name']) == project['id']:
+                self._project_ids = self._names(self.projects)
+
+    def member_added(self, member: Dict):
+        with self._lock:
+            self.members[member['id']] = member
+            self._member_ids.setdefault(member['name'], member['id'])
+
+    def member_removed(self, member: Dict):
+        with self._lock:
+            del self.members[member['id']]
+            if self._member_ids.get(member['name']) == member['id']:
+                self._member_ids = self._names(self.members)
@@ -0,0 +1,40 @@
+"""Hooks the store calls after each committed write."""
+
+from typing import Dict
+
+
+class StoreListener:
+    """Base class for in-memory structures that follow the store's writes.
+
+    Every record passed in includes its ``id``. Subclasses override only the hooks they need.
+    """
+
+    def project_added(self, project: Dict):
+        pass
+
+    def project_updated(self, old: Dict, new: Dict):
+        pass
+
+    def project_removed(self, project: Dict):
+        pass
+
+    def task_added(self, task: Dict):
+        pass
+
+    def task_updated(self, old: Dict, new: Dict):
+        pass
+
+    def task_removed(self, task: Dict):
+        pass
+
+    def member_added(self, member: Dict):
+        pass
+
+    def member_removed(self, member: Dict):
+        pass
+
+    def dependency_added(self, dependency: Dict):
+        pass
+
+    def dependency_removed(self, dependency: Dict):
+        pass
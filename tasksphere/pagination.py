@@ -0,0 +1,36 @@
+"""Page arithmetic for the server-side paginated lists."""
+
+from dataclasses import dataclass
+
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
+DEFAULT_PAGE_SIZE = 25
+
+
+@dataclass(frozen=True)
+class Page:
+    number: int
+    size: int
+    total: int
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.size))
+
+    @property
+    def offset(self) -> int:
+        return (self.number - 1) * self.size
+
+    @property
+    def first_item(self) -> int:
+        return self.offset + 1 if self.total else 0
+
+    @property
+    def last_item(self) -> int:
+        return min(self.offset + self.size, self.total)
+
+
+def paginate(total: int, number: int, size: int = DEFAULT_PAGE_SIZE) -> Page:
+    """Clamp the requested page number into range for the given total."""
+    size = max(1, size)
+    page_count = max(1, -(-total // size))
+    return Page(number=min(max(1, number), page_count), size=size, total=total)
@@ -0,0 +1,164 @@
+"""Timing spans with rolling percentiles, exportable as Prometheus text or JSON lines."""
+
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional
+
+from tasksphere.atomic import write_atomic
+
+DEFAULT_WINDOW = 1024
+DEFAULT_EXPORT_INTERVAL = 60.0
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass(frozen=True)
+class SpanStats:
+    name: str
+    count: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    # Nearest rank, which is exact for the small windows kept here
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+class _Span:
+    def __init__(self, window: int):
+        self.recent: "deque[float]" = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+
+class Profiler:
+    """Collects durations per span name; percentiles cover the last ``window`` samples of each."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._spans: Dict[str, _Span] = {}
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            span = self._spans.get(name)
+            if span is None:
+                span = self._spans[name] = _Span(self.window)
+            span.recent.append(seconds)
+            span.count += 1
+            span.total += seconds
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def timed(self, name: str) -> Callable:
+        def decorate(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def snapshot(self) -> List[SpanStats]:
+        with self._lock:
+            spans = [(name, span.count, span.total, sorted(span.recent)) for name, span in self._spans.items()]
+        return [
+            SpanStats(name, count, total, *(_percentile(ordered, q) for q in QUANTILES), ordered[-1])
+            for name, count, total, ordered in sorted(spans)
+        ]
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+
+# Process-wide profiler used by the store, the figure cache and the app
+profiler = Profiler()
+span = profiler.span
+timed = profiler.timed
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import ``name`` on first use, recording the cold import as an ``import.<name>`` span."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with span(f"import.{name}"):
+        return importlib.import_module(name)
+
+
+def prometheus_text(stats: List[SpanStats]) -> str:
+    lines = [
+        "# HELP tasksphere_span_seconds Time spent in instrumented TaskSphere spans.",
+        "# TYPE tasksphere_span_seconds summary",
+    ]
+    for entry in stats:
+        label = entry.name.replace('\\', '\\\\').replace('"', '\\"')
+        for quantile, value in zip(QUANTILES, (entry.p50, entry.p95, entry.p99)):
+            lines.append(f'tasksphere_span_seconds{{span="{label}",quantile="{quantile}"}} {value:.6f}')
+        lines.append(f'tasksphere_span_seconds_sum{{span="{label}"}} {entry.total:.6f}')
+        lines.append(f'tasksphere_span_seconds_count{{span="{label}"}} {entry.count}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(stats: List[SpanStats], path: str):
+    """Replace ``path`` atomically so a node_exporter textfile collector never reads half a file."""
+    write_atomic(path, prometheus_text(stats).encode('utf-8'))
+
+
+def append_json_log(stats: List[SpanStats], path: str):
+    record = {'timestamp': time.time(), 'spans': [asdict(entry) for entry in stats]}
+    with open(path, 'a', encoding='utf-8') as log:
+        log.write(json.dumps(record) + "\n")
+
+
+def export_stats(stats: List[SpanStats], path: str):
+    """Prometheus text for ``.prom`` files, a JSON line per call for anything else."""
+    if path.endswith('.prom'):
+        write_prometheus(stats, path)
+    else:
+        append_json_log(stats, path)
+
+
+class PeriodicExporter:
+    """Exports a profiler's snapshot to ``path`` every ``interval`` seconds on a daemon thread."""
+
+    def __init__(self, source: Profiler, path: str, interval: float = DEFAULT_EXPORT_INTERVAL):
+        self.source = source
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PeriodicExporter":
+        self._thread = threading.Thread(target=self._run, name="tasksphere-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            export_stats(self.source.snapshot(), self.path)
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,94 @@
+"""Per-project task rollups that derive project progress from task completion."""
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from tasksphere.listeners import StoreListener
+
+COMPLETED_STATUS = 'Completed'
+PRIORITY_WEIGHTS = {'High': 3, 'Medium': 2, 'Low': 1}
+DEFAULT_WEIGHT = 1
+
+
+class _Totals:
+    __slots__ = ('tasks', 'completed', 'weight', 'completed_weight')
+
+    def __init__(self):
+        self.tasks = 0
+        self.completed = 0
+        self.weight = 0
+        self.completed_weight = 0
+
+
+class ProjectRollup(StoreListener):
+    """Task and completed-task totals per project id, plain and weighted by priority.
+
+    Each task write adjusts at most two projects' totals, so progress never needs a scan
+    of the task table.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[int, _Totals] = {}
+        self.version = 0
+
+    def load(self, groups: Iterable[Tuple[int, str, str, int]]):
+        """``groups`` are ``(project_id, priority, status, count)`` rows from one grouped scan."""
+        with self._lock:
+            self._totals = {}
+            for project_id, priority, status, count in groups:
+                self._adjust(project_id, priority, status, count)
+            self.version += 1
+
+    def progress(self, project_id: int, weighted: bool = False) -> Optional[int]:
+        """Percentage of the project's tasks that are completed, or None if it has no tasks."""
+        totals = self._totals.get(project_id)
+        if totals is None or not totals.tasks:
+            return None
+        if weighted:
+            return round(totals.completed_weight * 100 / totals.weight)
+        return round(totals.completed * 100 / totals.tasks)
+
+    def task_count(self, project_id: int) -> int:
+        totals = self._totals.get(project_id)
+        return totals.tasks if totals is not None else 0
+
+    def _adjust(self, project_id: Optional[int], priority: str, status: str, delta: int):
+        if project_id is None:
+            return
+        totals = self._totals.get(project_id)
+        if totals is None:
+            totals = self._totals[project_id] = _Totals()
+        weight = PRIORITY_WEIGHTS.get(priority, DEFAULT_WEIGHT) * delta
+        totals.tasks += delta
+        totals.weight += weight
+        if status == COMPLETED_STATUS:
+            totals.completed += delta
+            totals.completed_weight += weight
+
+    def _apply(self, task: Dict, delta: int):
+        self._adjust(task.get('project_id'), task.get('priority'), task.get('status'), delta)
+
+    # Write hooks
+
+    def task_added(self, task: Dict):
+        with self._lock:
+            self._apply(task, 1)
+            self.version += 1
+
+    def task_removed(self, task: Dict):
+        with self._lock:
+            self._apply(task, -1)
+            self.version += 1
+
+    def task_updated(self, old: Dict, new: Dict):
+        with self._lock:
+            self._apply(old, -1)
+            self._apply(new, 1)
+            self.version += 1
+
+    def project_removed(self, project: Dict):
+        # The database sets the tasks' project_id to NULL, so they no longer count anywhere
+        with self._lock:
+            self._totals.pop(project['id'], None)
+            self.version += 1
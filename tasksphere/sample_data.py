@@ -0,0 +1,81 @@
+# Sample data for demonstration, seeded into a fresh workspace
+
+SAMPLE_PROJECTS = [
+    {
+        'name': 'E-Commerce Platform',
+        'description': 'Build a modern e-commerce platform with React and Node.js',
+        'status': 'Active',
+        'progress': 75,
+        'start_date': '2024-01-15',
+        'end_date': '2024-03-15',
+        'team_size': 5,
+        'budget': 50000
+    },
+    {
+        'name': 'Mobile App Development',
+        'description': 'Create a cross-platform mobile app using React Native',
+        'status': 'Active',
+        'progress': 45,
+        'start_date': '2024-02-01',
+        'end_date': '2024-04-30',
+        'team_size': 3,
+        'budget': 35000
+    },
+    {
+        'name': 'Data Analytics Dashboard',
+        'description': 'Develop a comprehensive analytics dashboard with real-time data',
+        'status': 'Completed',
+        'progress': 100,
+        'start_date': '2023-11-01',
+        'end_date': '2024-01-31',
+        'team_size': 4,
+        'budget': 25000
+    }
+]
+
+SAMPLE_TASKS = [
+    {
+        'title': 'Design User Interface',
+        'project': 'E-Commerce Platform',
+        'assignee': 'John Doe',
+        'priority': 'High',
+        'status': 'In Progress',
+        'due_date': '2024-02-15',
+        'description': 'Create wireframes and mockups for the e-commerce platform'
+    },
+    {
+        'title': 'Setup Database Schema',
+        'project': 'E-Commerce Platform',
+        'assignee': 'Jane Smith',
+        'priority': 'High',
+        'status': 'Completed',
+        'due_date': '2024-01-30',
+        'description': 'Design and implement the database structure'
+    },
+    {
+        'title': 'Implement Authentication',
+        'project': 'Mobile App Development',
+        'assignee': 'Mike Johnson',
+        'priority': 'Medium',
+        'status': 'Pending',
+        'due_date': '2024-02-20',
+        'description': 'Add user authentication and authorization'
+    },
+    {
+        'title': 'API Integration',
+        'project': 'Data Analytics Dashboard',
+        'assignee': 'Sarah Wilson',
+        'priority': 'Low',
+        'status': 'Completed',
+        'due_date': '2024-01-15',
+        'description': 'Connect dashboard to various data sources'
+    }
+]
+
+SAMPLE_TEAM_MEMBERS = [
+    {'name': 'John Doe', 'role': 'Frontend Developer', 'avatar': 'JD'},
+    {'name': 'Jane Smith', 'role': 'Backend Developer', 'avatar': 'JS'},
+    {'name': 'Mike Johnson', 'role': 'Mobile Developer', 'avatar': 'MJ'},
+    {'name': 'Sarah Wilson', 'role': 'Data Analyst', 'avatar': 'SW'},
+    {'name': 'David Brown', 'role': 'Project Manager', 'avatar': 'DB'}
+]
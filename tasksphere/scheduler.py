@@ -0,0 +1,243 @@
+"""Due-date reminders and overdue tracking driven by a min-heap and one sleeping worker thread."""
+
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from tasksphere.listeners import StoreListener
+from tasksphere.rollups import COMPLETED_STATUS
+
+REMINDER_LEAD_DAYS = 1
+MAX_NOTICES = 200
+REMINDER = 'reminder'
+OVERDUE = 'overdue'
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DueNotice:
+    kind: str
+    task_id: int
+    title: str
+    assignee: Optional[str]
+    due_date: date
+    fired_at: float
+
+
+@dataclass
+class _Deadline:
+    due_date: date
+    title: str
+    assignee: Optional[str]
+    generation: int = 0
+
+
+NoticeCallback = Callable[[DueNotice], None]
+
+
+def _parse_due(value) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _start_of(day: date) -> float:
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+class DueDateScheduler(StoreListener):
+    """Keeps every open task with a due date in a heap of (fire time, task id, kind) entries.
+
+    Each task has a reminder entry at the start of the day ``REMINDER_LEAD_DAYS`` before it
+    is due and an overdue entry at the start of the day after. A write pushes new entries in
+    O(log n); entries for tasks that were completed, moved or deleted are skipped when
+    they reach the top of the heap.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, lead_days: int = REMINDER_LEAD_DAYS):
+        self.clock = clock
+        self.lead_days = lead_days
+        self._changed = threading.Condition()
+        # (fire time, task id, kind, generation); an entry is live while its task's deadline
+        # still carries the same generation
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._generation = 0
+        self._deadlines: Dict[int, _Deadline] = {}
+        self._overdue: Set[int] = set()
+        self._notices: "deque[DueNotice]" = deque(maxlen=MAX_NOTICES)
+        self._callbacks: List[NoticeCallback] = []
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_store(cls, store, **kwargs) -> "DueDateScheduler":
+        scheduler = cls(**kwargs)
+        store.add_listener(scheduler, lambda: scheduler.load(store._fetch_all(
+            "SELECT id, title, assignee, status, due_date FROM tasks "
+            "WHERE status != 'Completed' AND due_date IS NOT NULL"
+        )))
+        return scheduler
+
+    def load(self, tasks: Iterable[Dict]):
+        with self._changed:
+            self._heap = []
+            self._deadlines = {}
+            self._overdue = set()
+            # Tasks already overdue at start-up are marked directly rather than replayed as notices
+            overdue_before = date.fromtimestamp(self.clock())
+            for task in tasks:
+                deadline = self._deadline(task)
+                if deadline is None:
+                    continue
+                self._deadlines[task['id']] = deadline
+                if deadline.due_date < overdue_before:
+                    self._overdue.add(task['id'])
+                else:
+                    self._heap.extend(self._entries(task['id'], deadline))
+            heapq.heapify(self._heap)
+        self.run_pending()
+
+    # Reads
+
+    def is_overdue(self, task_id: int) -> bool:
+        return task_id in self._overdue
+
+    def overdue_count(self) -> int:
+        return len(self._overdue)
+
+    def notices(self, limit: int = 20) -> List[DueNotice]:
+        """Most recent notices first, leaving out tasks that have since been completed or rescheduled."""
+        with self._changed:
+            current = [notice for notice in reversed(self._notices)
+                       if self._deadlines.get(notice.task_id) is not None
+                       and self._deadlines[notice.task_id].due_date == notice.due_date]
+        return current[:limit]
+
+    def next_fire_time(self) -> Optional[float]:
+        with self._changed:
+            self._discard_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def subscribe(self, callback: NoticeCallback):
+        with self._changed:
+            self._callbacks.append(callback)
+
+    # Firing
+
+    def _deadline(self, task: Dict) -> Optional[_Deadline]:
+        if task.get('status') == COMPLETED_STATUS:
+            return None
+        due_date = _parse_due(task.get('due_date'))
+        if due_date is None:
+            return None
+        self._generation += 1
+        return _Deadline(due_date, task.get('title', ''), task.get('assignee'), self._generation)
+
+    def _entries(self, task_id: int, deadline: _Deadline) -> List[Tuple[float, int, str, int]]:
+        return [
+            (_start_of(deadline.due_date - timedelta(days=self.lead_days)), task_id, REMINDER, deadline.generation),
+            (_start_of(deadline.due_date + timedelta(days=1)), task_id, OVERDUE, deadline.generation),
+        ]
+
+    def _is_current(self, entry: Tuple[float, int, str, int]) -> bool:
+        deadline = self._deadlines.get(entry[1])
+        return deadline is not None and deadline.generation == entry[3]
+
+    def _discard_stale(self):
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def run_pending(self) -> List[DueNotice]:
+        """Fire every entry whose time has come; returns the notices raised."""
+        fired = []
+        with self._changed:
+            now = self.clock()
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if not self._is_current(entry):
+                    continue
+                _, task_id, kind, _ = entry
+                deadline = self._deadlines[task_id]
+                if kind == REMINDER and now >= _start_of(deadline.due_date + timedelta(days=1)):
+                    continue  # already past due; the overdue notice says more
+                if kind == OVERDUE:
+                    self._overdue.add(task_id)
+                notice = DueNotice(kind, task_id, deadline.title, deadline.assignee, deadline.due_date, now)
+                self._notices.append(notice)
+                fired.append(notice)
+            callbacks = list(self._callbacks)
+        for notice in fired:
+            for callback in callbacks:
+                try:
+                    callback(notice)
+                except Exception:
+                    logger.exception("Due-date callback %r failed", callback)
+        return fired
+
+    # Worker
+
+    def start(self) -> "DueDateScheduler":
+        self._thread = threading.Thread(target=self._run, name="tasksphere-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            with self._changed:
+                if self._stopped:
+                    return
+                self._discard_stale()
+                timeout = self._heap[0][0] - self.clock() if self._heap else None
+                if timeout is None or timeout > 0:
+                    # Woken early only when a write changes the head of the heap
+                    self._changed.wait(timeout)
+                    continue
+            self.run_pending()
+
+    def stop(self):
+        with self._changed:
+            self._stopped = True
+            self._changed.notify_all()
+
+    # Write hooks
+
+    def _schedule(self, task_id: int, deadline: Optional[_Deadline]):
+        self._overdue.discard(task_id)
+        if deadline is None:
+            self._deadlines.pop(task_id, None)
+            return
+        self._deadlines[task_id] = deadline
+        head = self._heap[0][0] if self._heap else None
+        for entry in self._entries(task_id, deadline):
+            heapq.heappush(self._heap, entry)
+        if head is None or self._heap[0][0] < head:
+            self._changed.notify_all()
+
+    def task_added(self, task: Dict):
+        with self._changed:
+            self._schedule(task['id'], self._deadline(task))
+        self.run_pending()
+
+    def task_updated(self, old: Dict, new: Dict):
+        with self._changed:
+            deadline = self._deadline(new)
+            current = self._deadlines.get(new['id'])
+            if deadline is not None and current is not None and deadline.due_date == current.due_date:
+                # Same deadline: keep the queued entries and any overdue mark, refresh the labels
+                current.title, current.assignee = deadline.title, deadline.assignee
+                return
+            self._schedule(new['id'], deadline)
+        self.run_pending()
+
+    def task_removed(self, task: Dict):
+        with self._changed:
+            self._schedule(task['id'], None)
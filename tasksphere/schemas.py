@@ -0,0 +1,86 @@
+"""Field rules for projects, tasks and team members coming from outside the forms."""
+
+from datetime import date
+from typing import Dict, Optional
+
+PROJECT_STATUSES = ["Active", "Pending", "Completed"]
+TASK_STATUSES = ["Pending", "In Progress", "Completed"]
+TASK_PRIORITIES = ["High", "Medium", "Low"]
+
+
+class ValidationError(ValueError):
+    """A record that does not fit its schema."""
+
+
+def _text(record: Dict, field: str, required: bool = False, default: str = '') -> str:
+    value = record.get(field)
+    value = '' if value is None else str(value).strip()
+    if required and not value:
+        raise ValidationError(f"'{field}' is required")
+    return value or default
+
+
+def _choice(record: Dict, field: str, choices, default: str) -> str:
+    value = _text(record, field, default=default)
+    if value not in choices:
+        raise ValidationError(f"'{field}' must be one of {', '.join(choices)} (got {value!r})")
+    return value
+
+
+def _date(record: Dict, field: str) -> Optional[str]:
+    value = _text(record, field)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValidationError(f"'{field}' must be an ISO date like 2024-01-31 (got {value!r})") from None
+
+
+def _number(record: Dict, field: str, cast, default, minimum=None, maximum=None):
+    value = _text(record, field)
+    if not value:
+        return default
+    try:
+        number = cast(float(value))
+    except (ValueError, OverflowError):
+        raise ValidationError(f"'{field}' must be a number (got {value!r})") from None
+    if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+        raise ValidationError(f"'{field}' is out of range (got {number})")
+    return number
+
+
+def validate_project(record: Dict) -> Dict:
+    return {
+        'name': _text(record, 'name', required=True),
+        'description': _text(record, 'description'),
+        'status': _choice(record, 'status', PROJECT_STATUSES, 'Active'),
+        'progress': _number(record, 'progress', int, 0, 0, 100),
+        'start_date': _date(record, 'start_date'),
+        'end_date': _date(record, 'end_date'),
+        'team_size': _number(record, 'team_size', int, 1, 1),
+        'budget': _number(record, 'budget', float, 0.0, 0),
+    }
+
+
+def validate_task(record: Dict) -> Dict:
+    return {
+        'title': _text(record, 'title', required=True),
+        'project': _text(record, 'project', required=True),
+        'assignee': _text(record, 'assignee', required=True),
+        'priority': _choice(record, 'priority', TASK_PRIORITIES, 'Medium'),
+        'status': _choice(record, 'status', TASK_STATUSES, 'Pending'),
+        'due_date': _date(record, 'due_date'),
+        'description': _text(record, 'description'),
+    }
+
+
+def validate_member(record: Dict) -> Dict:
+    name = _text(record, 'name', required=True)
+    return {
+        'name': name,
+        'role': _text(record, 'role', required=True),
+        'email': _text(record, 'email'),
+        'phone': _text(record, 'phone'),
+        'avatar': _text(record, 'avatar') or ''.join(word[0] for word in name.split()),
+    }
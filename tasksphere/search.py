@@ -0,0 +1,32 @@
+"""Full-text search over tasks and projects using SQLite FTS5 indexes."""
+
+import re
+from typing import Optional
+
+# bm25 column weights, in the column order of the FTS tables
+TASK_SEARCH_WEIGHTS = "10.0, 2.0, 4.0, 4.0"      # title, description, project, assignee
+PROJECT_SEARCH_WEIGHTS = "10.0, 3.0"             # name, description
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def match_query(text: str) -> Optional[str]:
+    """Turn free text into an FTS5 query where every word must match as a prefix."""
+    tokens = _TOKEN.findall(text.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def task_match_subquery() -> str:
+    return (
+        "SELECT rowid AS match_id, bm25(tasks_fts, " + TASK_SEARCH_WEIGHTS + ") AS match_rank "
+        "FROM tasks_fts WHERE tasks_fts MATCH ?"
+    )
+
+
+def project_match_subquery() -> str:
+    return (
+        "SELECT rowid AS match_id, bm25(projects_fts, " + PROJECT_SEARCH_WEIGHTS + ") AS match_rank "
+        "FROM projects_fts WHERE projects_fts MATCH ?"
+    )
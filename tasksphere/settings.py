@@ -0,0 +1,92 @@
+"""Workspace settings: loaded once per process, read without locks, saved atomically as JSON."""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional
+
+from tasksphere.atomic import write_atomic
+from tasksphere.backup import RETENTION_PERIODS
+from tasksphere.theme import DEFAULT_THEME, THEMES
+
+SESSION_TIMEOUTS = ['15 minutes', '30 minutes', '1 hour', '2 hours']
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Settings:
+    theme: str = DEFAULT_THEME
+    email_notifications: bool = True
+    push_notifications: bool = True
+    task_reminders: bool = True
+    two_factor_auth: bool = False
+    session_timeout: str = SESSION_TIMEOUTS[0]
+    auto_backup: bool = True
+    data_retention: str = '30 days'
+
+    @property
+    def retention_days(self) -> Optional[int]:
+        return RETENTION_PERIODS[self.data_retention]
+
+
+def default_settings_path(db_path: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), 'tasksphere-settings.json')
+
+
+# Allowed values for the settings that are picked from a list
+SETTING_CHOICES: Dict[str, List[str]] = {
+    'theme': list(THEMES),
+    'session_timeout': SESSION_TIMEOUTS,
+    'data_retention': list(RETENTION_PERIODS),
+}
+
+
+def validate(values: Dict) -> Settings:
+    """Settings from ``values``; unknown keys are ignored, missing or invalid ones get their default."""
+    defaults = Settings()
+    checked = {}
+    for setting in fields(Settings):
+        if setting.name not in values:
+            continue
+        value = values[setting.name]
+        default = getattr(defaults, setting.name)
+        choices = SETTING_CHOICES.get(setting.name)
+        if type(value) is not type(default) or (choices is not None and value not in choices):
+            logger.warning("Ignoring invalid setting %s=%r", setting.name, value)
+            continue
+        checked[setting.name] = value
+    return Settings(**checked)
+
+
+class SettingsStore:
+    """Holds the current settings as one immutable object.
+
+    Readers take ``current`` without locking; ``save`` writes the file first and then swaps
+    in the new object, so a reader sees either the old settings or the new ones in full.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._save_lock = threading.Lock()
+        self.current = self._load()
+
+    def _load(self) -> Settings:
+        try:
+            with open(self.path, encoding='utf-8') as settings_file:
+                values = json.load(settings_file)
+        except FileNotFoundError:
+            return Settings()
+        except (OSError, ValueError):
+            logger.exception("Could not read settings from %s; using defaults", self.path)
+            return Settings()
+        return validate(values if isinstance(values, dict) else {})
+
+    def save(self, settings: Settings) -> Settings:
+        settings = validate(asdict(settings))
+        with self._save_lock:
+            write_atomic(self.path, json.dumps(asdict(settings), indent=2).encode('utf-8'))
+            self.current = settings
+        return settings
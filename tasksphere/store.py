@@ -0,0 +1,699 @@
+"""SQLite-backed workspace store shared by every Streamlit session."""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from tasksphere.aggregates import PROJECT_GROUP_FIELDS, TASK_GROUP_FIELDS, WorkspaceStats
+from tasksphere.dependencies import DependencyGraph
+from tasksphere.filters import TaskFilter
+from tasksphere.indexes import KeyIndex
+from tasksphere.listeners import StoreListener
+from tasksphere.profiling import timed
+from tasksphere.rollups import ProjectRollup
+from tasksphere.sample_data import SAMPLE_PROJECTS, SAMPLE_TASKS, SAMPLE_TEAM_MEMBERS
+from tasksphere.search import match_query, project_match_subquery
+from tasksphere.workload import WorkloadIndex
+
+DEFAULT_DB_PATH = os.environ.get("TASKSPHERE_DB", "tasksphere.db")
+DEFAULT_POOL_SIZE = 4
+
+PROJECT_COLUMNS = ['name', 'description', 'status', 'progress', 'start_date', 'end_date', 'team_size', 'budget']
+TASK_COLUMNS = ['title', 'project', 'assignee', 'priority', 'status', 'due_date', 'description',
+                'project_id', 'assignee_id']
+MEMBER_COLUMNS = ['name', 'role', 'email', 'phone', 'avatar']
+# The schema's DEFAULTs, filled in for columns a new record leaves out so listeners see the
+# values the row actually gets
+COLUMN_DEFAULTS: Dict[str, Dict] = {
+    'projects': {'description': '', 'progress': 0, 'team_size': 1, 'budget': 0},
+    'tasks': {'description': ''},
+    'team_members': {'email': '', 'phone': '', 'avatar': ''},
+}
+
+logger = logging.getLogger(__name__)
+
+# Each entry upgrades the schema by one step; PRAGMA user_version records how many have run
+MIGRATIONS = [
+    """
+    CREATE TABLE projects (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL DEFAULT '',
+        status TEXT NOT NULL,
+        progress INTEGER NOT NULL DEFAULT 0,
+        start_date TEXT,
+        end_date TEXT,
+        team_size INTEGER NOT NULL DEFAULT 1,
+        budget REAL NOT NULL DEFAULT 0
+    );
+    CREATE INDEX idx_projects_status ON projects(status);
+    CREATE INDEX idx_projects_name ON projects(name);
+
+    CREATE TABLE tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        project TEXT,
+        assignee TEXT,
+        priority TEXT NOT NULL,
+        status TEXT NOT NULL,
+        due_date TEXT,
+        description TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX idx_tasks_project ON tasks(project);
+    CREATE INDEX idx_tasks_assignee ON tasks(assignee);
+    CREATE INDEX idx_tasks_status ON tasks(status);
+    CREATE INDEX idx_tasks_priority ON tasks(priority);
+
+    CREATE TABLE team_members (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        role TEXT NOT NULL,
+        email TEXT NOT NULL DEFAULT '',
+        phone TEXT NOT NULL DEFAULT '',
+        avatar TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX idx_team_members_name ON team_members(name);
+    """,
+    # Filtered task views: each categorical index also orders by due date
+    """
+    DROP INDEX idx_tasks_project;
+    DROP INDEX idx_tasks_assignee;
+    DROP INDEX idx_tasks_status;
+    DROP INDEX idx_tasks_priority;
+    CREATE INDEX idx_tasks_project_due ON tasks(project, due_date);
+    CREATE INDEX idx_tasks_assignee_due ON tasks(assignee, due_date);
+    CREATE INDEX idx_tasks_status_due ON tasks(status, due_date);
+    CREATE INDEX idx_tasks_priority_due ON tasks(priority, due_date);
+    CREATE INDEX idx_tasks_due_date ON tasks(due_date);
+    ANALYZE;
+    """,
+    # Full-text indexes over tasks and projects, kept in step by triggers
+    """
+    CREATE VIRTUAL TABLE tasks_fts USING fts5(
+        title, description, project, assignee,
+        content='tasks', content_rowid='id', prefix='2 3'
+    );
+    CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description, project, assignee)
+        VALUES (new.id, new.title, new.description, new.project, new.assignee);
+    END;
+    CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description, project, assignee)
+        VALUES ('delete', old.id, old.title, old.description, old.project, old.assignee);
+    END;
+    CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description, project, assignee ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description, project, assignee)
+        VALUES ('delete', old.id, old.title, old.description, old.project, old.assignee);
+        INSERT INTO tasks_fts(rowid, title, description, project, assignee)
+        VALUES (new.id, new.title, new.description, new.project, new.assignee);
+    END;
+    INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild');
+
+    CREATE VIRTUAL TABLE projects_fts USING fts5(
+        name, description,
+        content='projects', content_rowid='id', prefix='2 3'
+    );
+    CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO projects_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END;
+    CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END;
+    CREATE TRIGGER projects_fts_update AFTER UPDATE OF name, description ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO projects_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+    END;
+    INSERT INTO projects_fts(projects_fts) VALUES ('rebuild');
+    """,
+    # Tasks reference projects and assignees by key; the names stay as the display copy
+    """
+    ALTER TABLE tasks ADD COLUMN project_id INTEGER REFERENCES projects(id) ON DELETE SET NULL;
+    ALTER TABLE tasks ADD COLUMN assignee_id INTEGER REFERENCES team_members(id) ON DELETE SET NULL;
+    UPDATE tasks SET
+        project_id = (SELECT MIN(id) FROM projects WHERE projects.name = tasks.project),
+        assignee_id = (SELECT MIN(id) FROM team_members WHERE team_members.name = tasks.assignee);
+    CREATE INDEX idx_tasks_project_id ON tasks(project_id);
+    CREATE INDEX idx_tasks_assignee_id ON tasks(assignee_id);
+    """,
+    # Per-record versions for optimistic concurrency; names become unique keys
+    """
+    ALTER TABLE projects ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+    ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+    ALTER TABLE team_members ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+    UPDATE projects SET name = name || ' (' || id || ')'
+        WHERE id NOT IN (SELECT MIN(id) FROM projects GROUP BY name);
+    UPDATE team_members SET name = name || ' (' || id || ')'
+        WHERE id NOT IN (SELECT MIN(id) FROM team_members GROUP BY name);
+    DROP INDEX idx_projects_name;
+    DROP INDEX idx_team_members_name;
+    CREATE UNIQUE INDEX idx_projects_name ON projects(name);
+    CREATE UNIQUE INDEX idx_team_members_name ON team_members(name);
+    """,
+    # Append-only task status history plus a per-day rollup of it, both written by triggers.
+    # Days count from 1970-01-01 UTC; events are appended in time order and indexed by day,
+    # so old days can be pruned while the rollup keeps the charts' full history
+    """
+    CREATE TABLE task_status_codes (
+        code INTEGER PRIMARY KEY,
+        status TEXT NOT NULL UNIQUE
+    );
+    CREATE TABLE task_events (
+        id INTEGER PRIMARY KEY,
+        day INTEGER NOT NULL,
+        at REAL NOT NULL,
+        task_id INTEGER NOT NULL,
+        from_code INTEGER,
+        to_code INTEGER
+    );
+    CREATE INDEX idx_task_events_day ON task_events(day);
+    CREATE TABLE task_daily_flow (
+        day INTEGER NOT NULL,
+        code INTEGER NOT NULL,
+        entered INTEGER NOT NULL DEFAULT 0,
+        exited INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, code)
+    ) WITHOUT ROWID;
+
+    CREATE TRIGGER task_history_insert AFTER INSERT ON tasks BEGIN
+        INSERT OR IGNORE INTO task_status_codes(status) VALUES (new.status);
+        INSERT INTO task_events(day, at, task_id, from_code, to_code)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (julianday('now') - 2440587.5) * 86400, new.id,
+                NULL, (SELECT code FROM task_status_codes WHERE status = new.status));
+        INSERT INTO task_daily_flow(day, code, entered)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (SELECT code FROM task_status_codes WHERE status = new.status), 1)
+        ON CONFLICT(day, code) DO UPDATE SET entered = entered + 1;
+    END;
+    CREATE TRIGGER task_history_update AFTER UPDATE OF status ON tasks WHEN old.status IS NOT new.status BEGIN
+        INSERT OR IGNORE INTO task_status_codes(status) VALUES (new.status);
+        INSERT INTO task_events(day, at, task_id, from_code, to_code)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (julianday('now') - 2440587.5) * 86400, new.id,
+                (SELECT code FROM task_status_codes WHERE status = old.status),
+                (SELECT code FROM task_status_codes WHERE status = new.status));
+        INSERT INTO task_daily_flow(day, code, exited)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (SELECT code FROM task_status_codes WHERE status = old.status), 1)
+        ON CONFLICT(day, code) DO UPDATE SET exited = exited + 1;
+        INSERT INTO task_daily_flow(day, code, entered)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (SELECT code FROM task_status_codes WHERE status = new.status), 1)
+        ON CONFLICT(day, code) DO UPDATE SET entered = entered + 1;
+    END;
+    CREATE TRIGGER task_history_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_events(day, at, task_id, from_code, to_code)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (julianday('now') - 2440587.5) * 86400, old.id,
+                (SELECT code FROM task_status_codes WHERE status = old.status), NULL);
+        INSERT INTO task_daily_flow(day, code, exited)
+        VALUES (CAST(julianday('now') - 2440587.5 AS INTEGER), (SELECT code FROM task_status_codes WHERE status = old.status), 1)
+        ON CONFLICT(day, code) DO UPDATE SET exited = exited + 1;
+    END;
+
+    -- Tasks that predate the history count as created on the day it started
+    INSERT OR IGNORE INTO task_status_codes(status) SELECT DISTINCT status FROM tasks;
+    INSERT INTO task_events(day, at, task_id, from_code, to_code)
+    SELECT CAST(julianday('now') - 2440587.5 AS INTEGER), (julianday('now') - 2440587.5) * 86400, tasks.id,
+           NULL, task_status_codes.code
+    FROM tasks JOIN task_status_codes ON task_status_codes.status = tasks.status ORDER BY tasks.id;
+    INSERT INTO task_daily_flow(day, code, entered)
+    SELECT CAST(julianday('now') - 2440587.5 AS INTEGER), to_code, COUNT(*) FROM task_events GROUP BY to_code;
+    """,
+    """
+    CREATE TABLE task_dependencies (
+        task_id INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+        depends_on INTEGER NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+        PRIMARY KEY (task_id, depends_on)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_task_dependencies_depends_on ON task_dependencies(depends_on);
+    """,
+]
+
+
+class ConflictError(Exception):
+    """A write lost a race with another session's write to the same record."""
+
+
+class StaleRecordError(ConflictError):
+    def __init__(self, table: str, record_id: int, expected_version: int, current_version: int):
+        super().__init__(f"{table} #{record_id} was changed by someone else "
+                         f"(you have version {expected_version}, current is {current_version})")
+        self.table = table
+        self.record_id = record_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+class DuplicateNameError(ConflictError):
+    def __init__(self, table: str, name: str):
+        super().__init__(f"{table} already has an entry named {name!r}")
+        self.table = table
+        self.name = name
+
+
+class ConnectionPool:
+    """A fixed-size pool of SQLite connections that can be shared across threads."""
+
+    def __init__(self, path: str, size: int = DEFAULT_POOL_SIZE):
+        # Every connection to ":memory:" opens its own private database
+        if path == ":memory:":
+            size = 1
+        self.path = path
+        self._connections = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._connections.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+    def close(self):
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+
+
+class WorkspaceStore:
+    """Repository for projects, tasks and team members."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, pool_size: int = DEFAULT_POOL_SIZE):
+        self.pool = ConnectionPool(path, pool_size)
+        self._migrate()
+        self.stats = WorkspaceStats()
+        self._load_stats()
+        self.keys = KeyIndex()
+        self.keys.load(self._fetch_all("SELECT * FROM projects ORDER BY id"),
+                       self._fetch_all("SELECT * FROM team_members ORDER BY id"))
+        self.rollup = ProjectRollup()
+        with self.pool.connection() as conn:
+            self.rollup.load(conn.execute(
+                "SELECT project_id, priority, status, COUNT(*) FROM tasks GROUP BY project_id, priority, status"
+            ))
+        self.workload = WorkloadIndex()
+        self.workload.load(self.keys.members.values(), self._fetch_all(
+            "SELECT id, assignee_id, priority, status, due_date FROM tasks "
+            "WHERE status != 'Completed' AND assignee_id IS NOT NULL"
+        ))
+        self.dependencies = DependencyGraph()
+        with self.pool.connection() as conn:
+            self.dependencies.load(map(dict, conn.execute("SELECT id, project_id, status FROM tasks ORDER BY id")),
+                                   conn.execute("SELECT task_id, depends_on FROM task_dependencies"))
+        self.listeners: List[StoreListener] = [self.stats, self.keys, self.rollup, self.workload,
+                                               self.dependencies]
+        # Held from commit until listeners are notified so in-memory views apply writes in
+        # commit order; reads never take it
+        self._write_lock = threading.Lock()
+
+    def add_listener(self, listener: StoreListener, load: Optional[Callable[[], None]] = None):
+        """Register ``listener``; ``load`` fills it from the database first.
+
+        Both happen under the write lock, so no write can commit after the load has read past
+        it and before the listener hears about it.
+        """
+        with self._write_lock:
+            if load is not None:
+                load()
+            self.listeners.append(listener)
+
+    def _notify(self, hook: str, *records: Dict):
+        for listener in self.listeners:
+            # The write has already committed; a broken listener must not fail it or starve the rest
+            try:
+                getattr(listener, hook)(*records)
+            except Exception:
+                logger.exception("Store listener %r failed in %s", listener, hook)
+
+    def _migrate(self):
+        with self.pool.connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for step, script in enumerate(MIGRATIONS[version:], start=version + 1):
+                conn.executescript(f"BEGIN; {script}; PRAGMA user_version = {step}; COMMIT;")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes SQLite's write lock up front, so a version read inside the
+        # transaction cannot go stale before the write that depends on it
+        with self.pool.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def _load_stats(self):
+        # One grouped scan at startup; afterwards the write paths keep the counts current
+        self.stats.load(
+            {field: self._counts_by("projects", field) for field in PROJECT_GROUP_FIELDS},
+            {field: self._counts_by("tasks", field) for field in TASK_GROUP_FIELDS},
+            self._scalar("SELECT COUNT(*) FROM team_members"),
+        )
+
+    def seed_sample_data(self):
+        # Only a brand-new workspace gets the demo records
+        if self.stats.project_total or self.stats.task_total or self.stats.member_total:
+            return
+        for project in SAMPLE_PROJECTS:
+            self.add_project(project)
+        for member in SAMPLE_TEAM_MEMBERS:
+            self.add_team_member(member)
+        for task in SAMPLE_TASKS:
+            self.add_task(task)
+
+    # Reads
+
+    def _fetch_all(self, sql: str, params: tuple = ()) -> List[Dict]:
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def _scalar(self, sql: str, params: tuple = ()):
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    @timed("store.list_projects")
+    def list_projects(self, limit: Optional[int] = None, offset: int = 0, search: str = '') -> List[Dict]:
+        query = match_query(search)
+        if query is None:
+            return self._fetch_page("projects", limit, offset)
+        return self._fetch_all(
+            f"SELECT projects.* FROM projects JOIN ({project_match_subquery()}) ON match_id = projects.id "
+            "ORDER BY match_rank, id LIMIT ? OFFSET ?",
+            (query, -1 if limit is None else limit, offset),
+        )
+
+    @timed("store.count_projects")
+    def count_projects(self, search: str = '') -> int:
+        query = match_query(search)
+        if query is None:
+            return self.stats.project_total
+        return self._scalar("SELECT COUNT(*) FROM projects_fts WHERE projects_fts MATCH ?", (query,))
+
+    @timed("store.list_tasks")
+    def list_tasks(self, limit: Optional[int] = None, offset: int = 0,
+                   task_filter: Optional[TaskFilter] = None) -> List[Dict]:
+        if task_filter is None:
+            return self._fetch_page("tasks", limit, offset)
+        source, source_params = task_filter.from_clause()
+        where, params = task_filter.where_clause()
+        return self._fetch_all(
+            f"SELECT tasks.* FROM {source} {where} {task_filter.order_clause()} LIMIT ? OFFSET ?",
+            (*source_params, *params, -1 if limit is None else limit, offset),
+        )
+
+    @timed("store.count_tasks")
+    def count_tasks(self, task_filter: Optional[TaskFilter] = None) -> int:
+        # Unfiltered and single-field counts come straight from the running aggregates
+        if task_filter is None or task_filter.is_empty():
+            return self.stats.task_total
+        single = task_filter.single_field()
+        if single is not None:
+            column, values = single
+            return sum(self.stats.task_count(column, value) for value in set(values))
+        source, source_params = task_filter.from_clause()
+        where, params = task_filter.where_clause()
+        return self._scalar(f"SELECT COUNT(*) FROM {source} {where}", (*source_params, *params))
+
+    def _fetch_page(self, table: str, limit: Optional[int], offset: int) -> List[Dict]:
+        # SQLite treats a negative LIMIT as "no limit"
+        return self._fetch_all(
+            f"SELECT * FROM {table} ORDER BY id LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+
+    def iter_rows(self, table: str, columns: List[str], chunk_size: int = 5000) -> Iterator[List[tuple]]:
+        """Stream ``columns`` of ``table`` in id order, ``chunk_size`` rows at a time."""
+        if table not in ('projects', 'tasks', 'team_members'):
+            raise ValueError(f"Unknown table {table!r}")
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield [tuple(row) for row in rows]
+
+    def list_team_members(self) -> List[Dict]:
+        return list(self.keys.members.values())
+
+    def project_names(self) -> List[str]:
+        return self.keys.project_names()
+
+    def team_member_names(self) -> List[str]:
+        return self.keys.member_names()
+
+    def get_project(self, project_id: int) -> Optional[Dict]:
+        return self.keys.projects.get(project_id)
+
+    def get_team_member(self, member_id: int) -> Optional[Dict]:
+        return self.keys.members.get(member_id)
+
+    def project_progress(self, project: Dict, weighted: bool = False) -> int:
+        """Progress derived from the project's tasks; a project without tasks keeps its stored value."""
+        progress = self.rollup.progress(project['id'], weighted)
+        return project['progress'] if progress is None else progress
+
+    def project_progress_rows(self, weighted: bool = False) -> List[tuple]:
+        """(name, progress, status) for every project, for the progress chart."""
+        return [(project['name'], self.project_progress(project, weighted), project['status'])
+                for project in list(self.keys.projects.values())]
+
+    @timed("store.get_task")
+    def get_task(self, task_id: int) -> Optional[Dict]:
+        return self._fetch_one("SELECT * FROM tasks WHERE id = ?", (task_id,))
+
+    def _fetch_one(self, sql: str, params: tuple = ()) -> Optional[Dict]:
+        with self.pool.connection() as conn:
+            row = conn.execute(sql, params).fetchone()
+        return dict(row) if row is not None else None
+
+    def _counts_by(self, table: str, column: str) -> Dict[str, int]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(f"SELECT {column}, COUNT(*) FROM {table} GROUP BY {column} ORDER BY MIN(id)")
+            return {value: count for value, count in rows}
+
+    # Status history. Days are counted from 1970-01-01 in UTC, the clock the history triggers use.
+
+    def status_totals_before(self, day: int) -> Dict[str, int]:
+        """Tasks in each status at the start of ``day``, from the daily rollup."""
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT status, SUM(entered) - SUM(exited) FROM task_daily_flow "
+                "JOIN task_status_codes USING (code) WHERE day < ? GROUP BY status",
+                (day,),
+            )
+            return {status: count for status, count in rows}
+
+    def status_flow(self, first_day: int, last_day: int) -> List[Dict]:
+        """Tasks entering and leaving each status per day, as ``day``/``status``/``entered``/``exited`` rows."""
+        return self._fetch_all(
+            "SELECT day, status, SUM(entered) AS entered, SUM(exited) AS exited FROM task_daily_flow "
+            "JOIN task_status_codes USING (code) WHERE day BETWEEN ? AND ? GROUP BY day, status",
+            (first_day, last_day),
+        )
+
+    @timed("store.prune_task_events")
+    def prune_task_events(self, keep_days: int) -> int:
+        """Drop raw status events older than ``keep_days``; the daily rollup, and so every chart, is kept."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "DELETE FROM task_events WHERE day < CAST(julianday('now') - 2440587.5 AS INTEGER) - ?",
+                (keep_days,),
+            ).rowcount
+
+    # Writes
+
+    def _insert(self, table: str, columns: List[str], record: Dict) -> Dict:
+        return self._insert_many(table, columns, [record])[0]
+
+    def _insert_many(self, table: str, columns: List[str], records: List[Dict]) -> List[Dict]:
+        # One transaction per batch keeps bulk loads from paying a commit per row
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+        inserted = []
+        defaults = COLUMN_DEFAULTS.get(table, {})
+        with self._transaction() as conn:
+            for record in records:
+                record = {**defaults, **record}
+                values = [record.get(column) for column in columns]
+                try:
+                    cursor = conn.execute(sql, values)
+                except sqlite3.IntegrityError:
+                    if 'name' in record:
+                        raise DuplicateNameError(table, record['name']) from None
+                    raise
+                inserted.append({'id': cursor.lastrowid, **dict(zip(columns, values)), 'version': 1})
+        return inserted
+
+    def _current_row(self, conn: sqlite3.Connection, table: str, record_id: int,
+                     expected_version: Optional[int]) -> Optional[sqlite3.Row]:
+        row = conn.execute(f"SELECT * FROM {table} WHERE id = ?", (record_id,)).fetchone()
+        if row is not None and expected_version is not None and row['version'] != expected_version:
+            raise StaleRecordError(table, record_id, expected_version, row['version'])
+        return row
+
+    def _update(self, table: str, columns: List[str], record_id: int, changes: Dict,
+                expected_version: Optional[int] = None) -> Optional[tuple]:
+        """Apply ``changes`` and bump the record's version.
+
+        With ``expected_version`` the write only goes ahead if nobody has changed the record
+        since that version was read; otherwise ``StaleRecordError`` is raised.
+        """
+        unknown = set(changes) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown {table} fields: {', '.join(sorted(unknown))}")
+        assignments = "".join(f"{column} = ?, " for column in changes)
+        with self._transaction() as conn:
+            row = self._current_row(conn, table, record_id, expected_version)
+            if row is None:
+                return None
+            try:
+                conn.execute(f"UPDATE {table} SET {assignments}version = version + 1 WHERE id = ?",
+                             [*changes.values(), record_id])
+            except sqlite3.IntegrityError:
+                if 'name' in changes:
+                    raise DuplicateNameError(table, changes['name']) from None
+                raise
+        old = dict(row)
+        return old, {**old, **changes, 'version': old['version'] + 1}
+
+    def _delete(self, table: str, record_id: int, expected_version: Optional[int] = None) -> Optional[Dict]:
+        with self._transaction() as conn:
+            row = self._current_row(conn, table, record_id, expected_version)
+            if row is None:
+                return None
+            conn.execute(f"DELETE FROM {table} WHERE id = ?", (record_id,))
+        return dict(row)
+
+    @timed("store.add_project")
+    def add_project(self, project: Dict) -> int:
+        with self._write_lock:
+            record = self._insert("projects", PROJECT_COLUMNS, project)
+            self._notify('project_added', record)
+        return record['id']
+
+    @timed("store.update_project")
+    def update_project(self, project_id: int, changes: Dict, expected_version: Optional[int] = None) -> bool:
+        with self._write_lock:
+            result = self._update("projects", PROJECT_COLUMNS, project_id, changes, expected_version)
+            if result is None:
+                return False
+            self._notify('project_updated', *result)
+        return True
+
+    @timed("store.delete_project")
+    def delete_project(self, project_id: int, expected_version: Optional[int] = None) -> bool:
+        with self._write_lock:
+            project = self._delete("projects", project_id, expected_version)
+            if project is None:
+                return False
+            self._notify('project_removed', project)
+        return True
+
+    def _resolve_task_keys(self, task: Dict) -> Dict:
+        resolved = dict(task)
+        if 'project' in task:
+            resolved['project_id'] = self.keys.project_id(task['project'])
+        if 'assignee' in task:
+            resolved['assignee_id'] = self.keys.member_id(task['assignee'])
+        return resolved
+
+    @timed("store.add_task")
+    def add_task(self, task: Dict) -> int:
+        with self._write_lock:
+            record = self._insert("tasks", TASK_COLUMNS, self._resolve_task_keys(task))
+            self._notify('task_added', record)
+        return record['id']
+
+    @timed("store.update_task")
+    def update_task(self, task_id: int, changes: Dict, expected_version: Optional[int] = None) -> bool:
+        with self._write_lock:
+            result = self._update("tasks", TASK_COLUMNS, task_id, self._resolve_task_keys(changes),
+                                  expected_version)
+            if result is None:
+                return False
+            self._notify('task_updated', *result)
+        return True
+
+    @timed("store.delete_task")
+    def delete_task(self, task_id: int, expected_version: Optional[int] = None) -> bool:
+        with self._write_lock:
+            task = self._delete("tasks", task_id, expected_version)
+            if task is None:
+                return False
+            self._notify('task_removed', task)
+        return True
+
+    @timed("store.add_task_dependency")
+    def add_task_dependency(self, task_id: int, depends_on: int) -> bool:
+        """Make ``task_id`` wait on ``depends_on``.
+
+        Raises ``DependencyCycleError`` if ``depends_on`` already waits on ``task_id``, directly or
+        through other tasks, and ``ValueError`` if either task does not exist.
+        """
+        with self._write_lock:
+            self.dependencies.check(task_id, depends_on)
+            with self._transaction() as conn:
+                added = conn.execute("INSERT OR IGNORE INTO task_dependencies (task_id, depends_on) VALUES (?, ?)",
+                                     (task_id, depends_on)).rowcount
+            if added:
+                self._notify('dependency_added', {'task_id': task_id, 'depends_on': depends_on})
+        return bool(added)
+
+    @timed("store.remove_task_dependency")
+    def remove_task_dependency(self, task_id: int, depends_on: int) -> bool:
+        with self._write_lock:
+            with self._transaction() as conn:
+                removed = conn.execute("DELETE FROM task_dependencies WHERE task_id = ? AND depends_on = ?",
+                                       (task_id, depends_on)).rowcount
+            if removed:
+                self._notify('dependency_removed', {'task_id': task_id, 'depends_on': depends_on})
+        return bool(removed)
+
+    @timed("store.add_team_member")
+    def add_team_member(self, member: Dict) -> int:
+        with self._write_lock:
+            record = self._insert("team_members", MEMBER_COLUMNS, member)
+            self._notify('member_added', record)
+        return record['id']
+
+    @timed("store.delete_team_member")
+    def delete_team_member(self, member_id: int, expected_version: Optional[int] = None) -> bool:
+        with self._write_lock:
+            member = self._delete("team_members", member_id, expected_version)
+            if member is None:
+                return False
+            self._notify('member_removed', member)
+        return True
+
+    def add_projects(self, projects: List[Dict]) -> List[int]:
+        return self._add_many("projects", PROJECT_COLUMNS, projects, 'project_added')
+
+    def add_tasks(self, tasks: List[Dict]) -> List[int]:
+        resolved = [self._resolve_task_keys(task) for task in tasks]
+        return self._add_many("tasks", TASK_COLUMNS, resolved, 'task_added')
+
+    def add_team_members(self, members: List[Dict]) -> List[int]:
+        return self._add_many("team_members", MEMBER_COLUMNS, members, 'member_added')
+
+    @timed("store.add_many")
+    def _add_many(self, table: str, columns: List[str], records: List[Dict], hook: str) -> List[int]:
+        with self._write_lock:
+            inserted = self._insert_many(table, columns, records)
+            for record in inserted:
+                self._notify(hook, record)
+        return [record['id'] for record in inserted]
+
+    def close(self):
+        self.pool.close()
@@ -0,0 +1,101 @@
+"""Reproducible synthetic workspaces with the sample data's schema, for benchmarks and load tests."""
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, List
+
+from tasksphere.schemas import PROJECT_STATUSES, TASK_PRIORITIES, TASK_STATUSES
+from tasksphere.store import WorkspaceStore
+
+ROLES = ["Project Manager", "Frontend Developer", "Backend Developer", "Mobile Developer",
+         "Data Analyst", "UI/UX Designer", "DevOps Engineer"]
+WORDS = ["design", "build", "review", "test", "deploy", "refactor", "document", "migrate",
+         "api", "dashboard", "login", "payments", "search", "reports", "mobile", "database"]
+BATCH_SIZE = 10000
+START_DATE = date(2024, 1, 1)
+
+
+@dataclass
+class WorkspaceSpec:
+    """Shape of a generated workspace.
+
+    ``skew`` is the Zipf exponent used to pick a task's project and assignee: 0 spreads
+    tasks evenly, 1 gives the first project and member the largest share, and higher
+    values concentrate work further.
+    """
+    tasks: int
+    projects: int = 0
+    members: int = 0
+    skew: float = 1.0
+    seed: int = 0
+
+    def __post_init__(self):
+        # Defaults grow with the workspace, the way real teams add projects and people
+        self.projects = self.projects or max(3, self.tasks // 250)
+        self.members = self.members or max(5, min(2000, self.tasks // 100))
+
+
+def _zipf_weights(count: int, skew: float) -> List[float]:
+    return list(accumulate(1 / rank ** skew for rank in range(1, count + 1)))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _projects(spec: WorkspaceSpec, rng: random.Random) -> List[Dict]:
+    projects = []
+    for number in range(1, spec.projects + 1):
+        start = START_DATE + timedelta(days=rng.randrange(365))
+        projects.append({
+            'name': f"Project {number:05d}",
+            'description': _sentence(rng, 8),
+            'status': rng.choice(PROJECT_STATUSES),
+            'progress': rng.randrange(0, 101, 5),
+            'start_date': str(start),
+            'end_date': str(start + timedelta(days=rng.randrange(30, 240))),
+            'team_size': rng.randrange(1, 21),
+            'budget': rng.randrange(5, 200) * 1000,
+        })
+    return projects
+
+
+def _members(spec: WorkspaceSpec, rng: random.Random) -> List[Dict]:
+    return [
+        {'name': f"Member {number:05d}", 'role': rng.choice(ROLES), 'email': f"member{number}@example.com",
+         'phone': '', 'avatar': f"M{number % 100:02d}"}
+        for number in range(1, spec.members + 1)
+    ]
+
+
+def generate_workspace(store: WorkspaceStore, spec: WorkspaceSpec) -> WorkspaceSpec:
+    """Fill an empty ``store``; the same spec always produces the same records."""
+    rng = random.Random(spec.seed)
+    projects = _projects(spec, rng)
+    members = _members(spec, rng)
+    store.add_projects(projects)
+    store.add_team_members(members)
+
+    project_names = [project['name'] for project in projects]
+    member_names = [member['name'] for member in members]
+    project_weights = _zipf_weights(len(project_names), spec.skew)
+    member_weights = _zipf_weights(len(member_names), spec.skew)
+    for start in range(0, spec.tasks, BATCH_SIZE):
+        count = min(BATCH_SIZE, spec.tasks - start)
+        batch_projects = rng.choices(project_names, cum_weights=project_weights, k=count)
+        batch_members = rng.choices(member_names, cum_weights=member_weights, k=count)
+        store.add_tasks([
+            {
+                'title': _sentence(rng, 3),
+                'project': project,
+                'assignee': assignee,
+                'priority': rng.choice(TASK_PRIORITIES),
+                'status': rng.choice(TASK_STATUSES),
+                'due_date': str(START_DATE + timedelta(days=rng.randrange(730))),
+                'description': _sentence(rng, 10),
+            }
+            for project, assignee in zip(batch_projects, batch_members)
+        ])
+    return spec
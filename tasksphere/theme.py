@@ -0,0 +1,95 @@
+"""Theme stylesheets, minified and content-hashed once per process, then inlined or served as static files."""
+
+import glob
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from tasksphere.atomic import write_atomic
+
+STYLES_DIR = os.path.join(os.path.dirname(__file__), 'styles')
+# Theme -> stylesheets applied in order on top of base.css
+THEMES: Dict[str, Tuple[str, ...]] = {
+    'Professional Blue': (),
+    'Dark Mode': ('dark.css',),
+    'Light Mode': ('light.css',),
+}
+DEFAULT_THEME = 'Professional Blue'
+# Where Streamlit serves ./static when server.enableStaticServing is on
+STATIC_URL = 'app/static'
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{}:;,>])\s*")
+
+logger = logging.getLogger(__name__)
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace CSS does not need; descendant-selector spaces are kept."""
+    css = _COMMENTS.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@dataclass(frozen=True)
+class ThemeAsset:
+    theme: str
+    css: str
+    digest: str
+
+    @property
+    def file_name(self) -> str:
+        return f"theme-{self.theme.lower().replace(' ', '-')}.{self.digest}.css"
+
+    def inline(self) -> str:
+        return f"<style>{self.css}</style>"
+
+    def link(self) -> str:
+        # The name changes with the content, so browsers can keep the file for as long as they like
+        return f'<link rel="stylesheet" href="{STATIC_URL}/{self.file_name}">'
+
+
+_assets: Dict[str, ThemeAsset] = {}
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(STYLES_DIR, name), encoding='utf-8') as stylesheet:
+        return stylesheet.read()
+
+
+def theme_asset(theme: str) -> ThemeAsset:
+    """The minified stylesheet for ``theme``, built on first use; unknown themes get the default."""
+    if theme not in THEMES:
+        theme = DEFAULT_THEME
+    asset = _assets.get(theme)
+    if asset is None:
+        css = minify_css("\n".join(_read(name) for name in ('base.css', *THEMES[theme])))
+        asset = _assets[theme] = ThemeAsset(theme, css, hashlib.sha256(css.encode('utf-8')).hexdigest()[:12])
+    return asset
+
+
+def publish_theme_assets(static_dir: str) -> bool:
+    """Write every theme's stylesheet into ``static_dir`` under its hashed name, removing outdated ones.
+
+    Returns False when the directory cannot be written, in which case stylesheets should be inlined.
+    """
+    try:
+        current = set()
+        for theme in THEMES:
+            asset = theme_asset(theme)
+            current.add(asset.file_name)
+            path = os.path.join(static_dir, asset.file_name)
+            if not os.path.exists(path):
+                write_atomic(path, asset.css.encode('utf-8'))
+        for path in glob.glob(os.path.join(static_dir, 'theme-*.css')):
+            if os.path.basename(path) not in current:
+                os.remove(path)
+    except OSError:
+        logger.warning("Could not publish theme stylesheets to %s; inlining them instead", static_dir, exc_info=True)
+        return False
+    return True
@@ -0,0 +1,195 @@
+"""Per-member index of open tasks, due dates and capacity, kept current by store hooks."""
+
+import bisect
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tasksphere.listeners import StoreListener
+from tasksphere.rollups import COMPLETED_STATUS, DEFAULT_WEIGHT, PRIORITY_WEIGHTS
+
+# Weighted open-task points (High 3, Medium 2, Low 1) a member can carry at 100% utilisation
+DEFAULT_CAPACITY = 20
+ROLE_CAPACITY = {'Project Manager': 10}
+DUE_SOON_DAYS = 7
+
+
+@dataclass
+class MemberLoad:
+    member_id: int
+    name: str
+    role: str
+    open_tasks: int
+    load: int
+    capacity: int
+    by_status: Dict[str, int] = field(default_factory=dict)
+    by_priority: Dict[str, int] = field(default_factory=dict)
+    overdue: int = 0
+    due_soon: int = 0
+    next_due: Optional[str] = None
+
+    @property
+    def utilization(self) -> float:
+        return self.load / self.capacity * 100 if self.capacity else 0.0
+
+
+class _Member:
+    __slots__ = ('record', 'load', 'by_status', 'by_priority', 'due')
+
+    def __init__(self, record: Dict):
+        self.record = record
+        self.load = 0
+        self.by_status: Counter = Counter()
+        self.by_priority: Counter = Counter()
+        # Sorted (due_date, task_id) pairs of the member's open tasks that have a due date
+        self.due: List[Tuple[str, int]] = []
+
+
+def capacity_for(role: str) -> int:
+    return ROLE_CAPACITY.get(role, DEFAULT_CAPACITY)
+
+
+class WorkloadIndex(StoreListener):
+    """Open-task counts, weighted load and due dates per team member.
+
+    Members are also bucketed by role and load, so the least-loaded member is found
+    without looking at every member.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._members: Dict[int, _Member] = {}
+        # role -> load -> member ids, plus the lowest non-empty load per role
+        self._buckets: Dict[str, Dict[int, Set[int]]] = {}
+        self._min_load: Dict[str, int] = {}
+        self.version = 0
+
+    def load(self, members: Iterable[Dict], open_tasks: Iterable[Dict]):
+        with self._lock:
+            self._members = {}
+            self._buckets = {}
+            self._min_load = {}
+            for member in members:
+                self._add_member(member)
+            for task in open_tasks:
+                self._apply(task, 1)
+            self.version += 1
+
+    # Reads
+
+    def member_load(self, member_id: int, today: Optional[date] = None) -> Optional[MemberLoad]:
+        with self._lock:
+            member = self._members.get(member_id)
+            return self._snapshot(member, today or date.today()) if member is not None else None
+
+    def member_loads(self, today: Optional[date] = None) -> List[MemberLoad]:
+        today = today or date.today()
+        with self._lock:
+            return [self._snapshot(member, today) for member in self._members.values()]
+
+    def least_loaded(self, role: Optional[str] = None) -> Optional[int]:
+        """Id of the member with the lowest utilisation, optionally within one role."""
+        with self._lock:
+            roles = [role] if role is not None else list(self._min_load)
+            best = None
+            for candidate in roles:
+                load = self._min_load.get(candidate)
+                if load is None:
+                    continue
+                utilization = load / capacity_for(candidate)
+                if best is None or utilization < best[0]:
+                    best = (utilization, next(iter(self._buckets[candidate][load])))
+            return best[1] if best is not None else None
+
+    def _snapshot(self, member: _Member, today: date) -> MemberLoad:
+        record = member.record
+        today_text = str(today)
+        soon_text = str(today + timedelta(days=DUE_SOON_DAYS))
+        overdue = bisect.bisect_left(member.due, (today_text,))
+        due_soon = bisect.bisect_right(member.due, (soon_text, float('inf'))) - overdue
+        return MemberLoad(
+            record['id'], record['name'], record['role'],
+            sum(member.by_status.values()), member.load, capacity_for(record['role']),
+            {key: count for key, count in member.by_status.items() if count},
+            {key: count for key, count in member.by_priority.items() if count},
+            overdue, due_soon,
+            member.due[overdue][0] if overdue < len(member.due) else None,
+        )
+
+    # Buckets
+
+    def _bucket_add(self, role: str, load: int, member_id: int):
+        self._buckets.setdefault(role, {}).setdefault(load, set()).add(member_id)
+        if load < self._min_load.get(role, load + 1):
+            self._min_load[role] = load
+
+    def _bucket_remove(self, role: str, load: int, member_id: int):
+        loads = self._buckets[role]
+        members = loads[load]
+        members.discard(member_id)
+        if members:
+            return
+        del loads[load]
+        if not loads:
+            del self._buckets[role]
+            del self._min_load[role]
+        elif self._min_load[role] == load:
+            self._min_load[role] = min(loads)
+
+    def _add_member(self, record: Dict):
+        self._members[record['id']] = _Member(record)
+        self._bucket_add(record['role'], 0, record['id'])
+
+    def _apply(self, task: Dict, delta: int):
+        if task.get('status') == COMPLETED_STATUS:
+            return
+        member = self._members.get(task.get('assignee_id'))
+        if member is None:
+            return
+        role, member_id = member.record['role'], member.record['id']
+        self._bucket_remove(role, member.load, member_id)
+        member.load += PRIORITY_WEIGHTS.get(task.get('priority'), DEFAULT_WEIGHT) * delta
+        self._bucket_add(role, member.load, member_id)
+        member.by_status[task['status']] += delta
+        member.by_priority[task['priority']] += delta
+        if task.get('due_date'):
+            entry = (task['due_date'], task['id'])
+            if delta > 0:
+                bisect.insort(member.due, entry)
+            else:
+                position = bisect.bisect_left(member.due, entry)
+                if position < len(member.due) and member.due[position] == entry:
+                    del member.due[position]
+
+    # Write hooks
+
+    def task_added(self, task: Dict):
+        with self._lock:
+            self._apply(task, 1)
+            self.version += 1
+
+    def task_removed(self, task: Dict):
+        with self._lock:
+            self._apply(task, -1)
+            self.version += 1
+
+    def task_updated(self, old: Dict, new: Dict):
+        with self._lock:
+            self._apply(old, -1)
+            self._apply(new, 1)
+            self.version += 1
+
+    def member_added(self, member: Dict):
+        with self._lock:
+            self._add_member(member)
+            self.version += 1
+
+    def member_removed(self, member: Dict):
+        # The database nulls the member's tasks' assignee_id, so their load goes with them
+        with self._lock:
+            removed = self._members.pop(member['id'], None)
+            if removed is not None:
+                self._bucket_remove(member['role'], removed.load, member['id'])
+            self.version += 1
@@ -0,0 +1,139 @@
+import gzip
+import os
+import sqlite3
+import time
+
+import pytest
+
+from tasksphere.backup import (BACKUP_TABLES, CHUNK_GRACE_SECONDS, BackupError, BackupJob, create_snapshot,
+                               list_snapshots, prune_snapshots, restore_snapshot)
+from tasksphere.store import WorkspaceStore
+
+DAY = 24 * 60 * 60
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    store.seed_sample_data()
+    first, second = (task['id'] for task in store.list_tasks(limit=2))
+    store.add_task_dependency(second, first)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return str(tmp_path / "backups")
+
+
+def table_rows(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return sorted(conn.execute(f"SELECT * FROM {table}").fetchall())
+    finally:
+        conn.close()
+
+
+def chunk_files(backup_dir):
+    return {name for _, _, names in os.walk(os.path.join(backup_dir, 'chunks')) for name in names}
+
+
+def test_unchanged_tables_reuse_their_chunks(workspace, backup_dir):
+    first = create_snapshot(workspace.pool.path, backup_dir)
+    assert first.reused_chunks == 0
+    assert first.rows > 0
+
+    workspace.update_task(workspace.list_tasks(limit=1)[0]['id'], {'priority': 'Low'})
+    second = create_snapshot(workspace.pool.path, backup_dir)
+    assert second.reused_chunks > 0
+    assert second.new_chunks < first.new_chunks
+    for table in ('projects', 'team_members', 'task_dependencies'):
+        assert second.tables[table]['chunks'] == first.tables[table]['chunks']
+    assert second.tables['tasks']['chunks'] != first.tables['tasks']['chunks']
+    assert [snapshot.snapshot_id for snapshot in list_snapshots(backup_dir)] == [first.snapshot_id,
+                                                                                 second.snapshot_id]
+
+
+def test_restore_round_trips_every_table(workspace, backup_dir, tmp_path):
+    snapshot = create_snapshot(workspace.pool.path, backup_dir)
+    target = str(tmp_path / "restored.db")
+    restored = restore_snapshot(backup_dir, 'latest', target, batch_size=2)
+    assert restored.snapshot_id == snapshot.snapshot_id
+    for table in BACKUP_TABLES:
+        assert table_rows(target, table) == table_rows(workspace.pool.path, table), table
+
+    second = workspace.list_tasks(limit=2)[1]['id']
+    reopened = WorkspaceStore(target)
+    try:
+        assert reopened.stats.task_total == workspace.stats.task_total
+        assert reopened.dependencies.blockers(second) == workspace.dependencies.blockers(second) != set()
+    finally:
+        reopened.close()
+
+
+def test_restore_refuses_an_existing_target(workspace, backup_dir):
+    create_snapshot(workspace.pool.path, backup_dir)
+    with pytest.raises(BackupError):
+        restore_snapshot(backup_dir, 'latest', workspace.pool.path)
+    with pytest.raises(BackupError):
+        restore_snapshot(backup_dir, 'no-such-snapshot', workspace.pool.path + ".new")
+
+
+def test_corrupt_chunk_fails_the_restore_and_removes_the_target(workspace, backup_dir, tmp_path):
+    snapshot = create_snapshot(workspace.pool.path, backup_dir)
+    digest = snapshot.tables['tasks']['chunks'][0]
+    path = os.path.join(backup_dir, 'chunks', digest[:2], f"{digest}.jsonl.gz")
+    # Still valid gzip and JSON, but no longer the content the chunk is named after
+    with gzip.open(path, 'rb') as chunk:
+        content = chunk.read()
+    with gzip.open(path, 'wb') as chunk:
+        chunk.write(content.replace(b'"High"', b'"Low"'))
+
+    target = str(tmp_path / "restored.db")
+    with pytest.raises(BackupError):
+        restore_snapshot(backup_dir, snapshot.snapshot_id, target)
+    assert not os.path.exists(target)
+
+
+def test_prune_keeps_the_newest_snapshot_and_referenced_chunks(workspace, backup_dir, tmp_path):
+    old = create_snapshot(workspace.pool.path, backup_dir)
+    workspace.update_task(workspace.list_tasks(limit=1)[0]['id'], {'status': 'Completed'})
+    new = create_snapshot(workspace.pool.path, backup_dir)
+    only_old = ({chunk for table in old.tables.values() for chunk in table['chunks']} -
+                {chunk for table in new.tables.values() for chunk in table['chunks']})
+    assert only_old
+
+    # Within the retention period nothing goes
+    assert prune_snapshots(backup_dir, 30, now=new.created_at + DAY) == 0
+    # Past it the old snapshot goes, but its chunks stay for the grace period
+    now = time.time()
+    assert prune_snapshots(backup_dir, 0, now=now) == 1
+    assert [snapshot.snapshot_id for snapshot in list_snapshots(backup_dir)] == [new.snapshot_id]
+    assert only_old <= {name.split('.')[0] for name in chunk_files(backup_dir)}
+    # The newest snapshot is kept however old it is; chunks only the old one used are now deleted
+    assert prune_snapshots(backup_dir, 0, now=now + CHUNK_GRACE_SECONDS + 1) == 0
+    assert [snapshot.snapshot_id for snapshot in list_snapshots(backup_dir)] == [new.snapshot_id]
+    remaining = {name.split('.')[0] for name in chunk_files(backup_dir)}
+    assert remaining == {chunk for table in new.tables.values() for chunk in table['chunks']}
+
+    restore_snapshot(backup_dir, 'latest', str(tmp_path / "restored.db"))
+
+
+def test_prune_forever_only_collects_unreferenced_chunks(workspace, backup_dir):
+    create_snapshot(workspace.pool.path, backup_dir)
+    create_snapshot(workspace.pool.path, backup_dir)
+    assert prune_snapshots(backup_dir, None, now=time.time() + 365 * DAY) == 0
+    assert len(list_snapshots(backup_dir)) == 2
+
+
+def test_backup_job_records_results_and_errors(workspace, backup_dir, tmp_path):
+    job = BackupJob(workspace.pool.path, backup_dir, enabled=False, store=workspace)
+    assert job.next_run() is None
+    snapshot = job.run_once(30)
+    assert job.last_snapshot == snapshot and job.last_error is None
+
+    broken = BackupJob(str(tmp_path / "missing" / "workspace.db"), backup_dir, enabled=False)
+    assert broken.run_once(30) is None
+    assert broken.last_error
+    assert not broken.running
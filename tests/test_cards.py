@@ -0,0 +1,47 @@
+from tasksphere.cards import MISSING, CardCache, join_cards, member_card, project_card, task_card
+
+TASK = {'id': 7, 'version': 1, 'title': "Fix </div> layout", 'description': "First paragraph.\n\nSecond & last.",
+        'priority': 'High', 'status': 'Pending', 'due_date': None, 'project': "Web <App>", 'assignee': None}
+
+
+def test_record_text_is_escaped():
+    card = task_card(TASK, overdue=False)
+    assert "Fix &lt;/div&gt; layout" in card
+    assert "Web &lt;App&gt;" in card
+    assert "</div> layout" not in card
+    assert card.count("<div") == card.count("</div>")
+
+
+def test_line_breaks_cannot_end_the_html_block():
+    card = task_card(TASK, overdue=True, blocked=True)
+    assert "First paragraph.<br><br>Second &amp; last." in card
+    page = join_cards([card, task_card({**TASK, 'id': 8}, overdue=False)])
+    # Markdown ends an HTML block at the first blank line
+    assert "\n\n" not in page and len(page.splitlines()) == 2
+
+
+def test_missing_values_render_as_a_dash():
+    card = task_card(TASK, overdue=False)
+    assert "None" not in card
+    # The due date and the assignee
+    assert card.count(MISSING) == 2
+
+    project = {'id': 1, 'name': "Alpha", 'description': "", 'status': 'Active', 'team_size': 3,
+               'start_date': "2024-01-01", 'end_date': None}
+    assert f"2024-01-01 - {MISSING}" in project_card(project, 40)
+    assert "None" not in project_card(project, 40, details=False)
+
+
+def test_member_cards_escape_the_workload_line():
+    member = {'id': 1, 'name': "Ana & Co", 'role': "Developer", 'avatar': "A&"}
+    card = member_card(member, "3 open · <b>50%</b>")
+    assert "Ana &amp; Co" in card and "A&amp;" in card
+    assert "&lt;b&gt;50%&lt;/b&gt;" in card
+
+
+def test_cache_renders_escaped_cards_once_per_version():
+    cache = CardCache()
+    first = cache.render('task', TASK, False, False)
+    assert cache.render('task', TASK, False, False) == first
+    assert cache.render('task', {**TASK, 'version': 2, 'title': "<b>"}, False, False) != first
+    assert (cache.hits, cache.misses) == (1, 2)
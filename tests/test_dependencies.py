@@ -0,0 +1,181 @@
+import random
+
+import pytest
+
+from tasksphere.dependencies import DependencyCycleError, DependencyGraph
+from tasksphere.store import WorkspaceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    for name in ("Alpha", "Beta"):
+        store.add_project({'name': name, 'description': '', 'status': 'Active', 'progress': 0,
+                           'team_size': 1, 'budget': 0})
+    yield store
+    store.close()
+
+
+def add_task(store, title, project="Alpha", status="Pending"):
+    return store.add_task({'title': title, 'project': project, 'priority': 'Medium', 'status': status,
+                           'description': ''})
+
+
+def stored_edges(store):
+    with store.pool.connection() as conn:
+        return {tuple(row) for row in conn.execute("SELECT task_id, depends_on FROM task_dependencies")}
+
+
+def assert_order_respects_edges(graph):
+    for task_id, blockers in graph._blockers.items():
+        for blocker in blockers:
+            assert graph._nodes[blocker].position < graph._nodes[task_id].position
+
+
+def test_rejects_cycles_without_storing_them(store):
+    a, b, c = (add_task(store, title) for title in "abc")
+    store.add_task_dependency(b, a)
+    store.add_task_dependency(c, b)
+
+    with pytest.raises(DependencyCycleError) as raised:
+        store.add_task_dependency(a, c)
+    assert raised.value.cycle == [c, a, b, c]
+    with pytest.raises(DependencyCycleError):
+        store.add_task_dependency(a, a)
+    assert stored_edges(store) == {(b, a), (c, b)}
+    assert store.dependencies.blockers(a) == set()
+
+
+def test_rejects_unknown_tasks(store):
+    a = add_task(store, "a")
+    with pytest.raises(ValueError):
+        store.add_task_dependency(a, 999)
+
+
+def test_duplicate_and_missing_edges_report_false(store):
+    a, b = add_task(store, "a"), add_task(store, "b")
+    assert store.add_task_dependency(b, a)
+    assert not store.add_task_dependency(b, a)
+    assert store.remove_task_dependency(b, a)
+    assert not store.remove_task_dependency(b, a)
+    assert stored_edges(store) == set()
+
+
+def test_edge_against_the_order_reorders_only_what_it_must(store):
+    # Created in order a, b, c, d, so "a waits on d" runs against the current positions
+    a, b, c, d = (add_task(store, title) for title in "abcd")
+    store.add_task_dependency(b, a)
+    store.add_task_dependency(a, d)
+    graph = store.dependencies
+    assert_order_respects_edges(graph)
+    assert graph._nodes[d].position < graph._nodes[a].position < graph._nodes[b].position
+    # c is unrelated to the new edge and keeps its slot
+    assert graph._nodes[c].position == 2
+
+
+def test_random_edges_match_brute_force_reachability():
+    rng = random.Random(7)
+    size = 60
+    graph = DependencyGraph()
+    graph.load(({'id': task_id, 'project_id': 1, 'status': 'Pending'} for task_id in range(size)), [])
+    dependents = {task_id: set() for task_id in range(size)}
+
+    def reaches(start, goal):
+        seen, stack = {start}, [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                return True
+            for dependent in dependents[node] - seen:
+                seen.add(dependent)
+                stack.append(dependent)
+        return False
+
+    for _ in range(600):
+        task_id, blocker_id = rng.randrange(size), rng.randrange(size)
+        creates_cycle = task_id == blocker_id or reaches(task_id, blocker_id)
+        try:
+            graph.check(task_id, blocker_id)
+        except DependencyCycleError as error:
+            assert creates_cycle
+            assert error.cycle[0] == blocker_id and error.cycle[-1] == blocker_id
+            continue
+        assert not creates_cycle
+        graph.dependency_added({'task_id': task_id, 'depends_on': blocker_id})
+        dependents[blocker_id].add(task_id)
+        assert_order_respects_edges(graph)
+
+
+def test_schedule_critical_path_and_blocked_tasks(store):
+    design = add_task(store, "design")
+    build = add_task(store, "build")
+    test = add_task(store, "test")
+    docs = add_task(store, "docs")
+    store.add_task_dependency(build, design)
+    store.add_task_dependency(test, build)
+    store.add_task_dependency(docs, design)
+
+    schedule = store.dependencies.schedule(store.keys.project_id("Alpha"))
+    assert schedule.critical_path == [design, build, test]
+    assert schedule.length == 3
+    assert schedule.earliest_start == {design: 0, build: 1, test: 2, docs: 1}
+    assert set(schedule.blocked) == {build, test, docs}
+
+    store.update_task(design, {'status': 'Completed'})
+    schedule = store.dependencies.schedule(store.keys.project_id("Alpha"))
+    assert schedule.length == 2
+    assert set(schedule.blocked) == {test}
+    assert not store.dependencies.is_blocked(build)
+
+
+def test_writes_invalidate_only_the_projects_they_touch(store):
+    alpha, beta = store.keys.project_id("Alpha"), store.keys.project_id("Beta")
+    a1, a2 = add_task(store, "a1"), add_task(store, "a2")
+    b1 = add_task(store, "b1", project="Beta")
+    store.add_task_dependency(a2, a1)
+    graph = store.dependencies
+
+    alpha_schedule, beta_schedule = graph.schedule(alpha), graph.schedule(beta)
+    store.update_task(a1, {'status': 'In Progress'})  # still open: nothing to recompute
+    assert graph.schedule(alpha) is alpha_schedule
+    store.update_task(a1, {'status': 'Completed'})
+    assert graph.schedule(alpha) is not alpha_schedule
+    assert graph.schedule(beta) is beta_schedule
+
+    # A blocker in another project invalidates the project of the task waiting on it
+    store.add_task_dependency(b1, a2)
+    beta_schedule = graph.schedule(beta)
+    assert beta_schedule.blocked == [b1]
+    store.update_task(a2, {'status': 'Completed'})
+    assert graph.schedule(beta) is not beta_schedule
+    assert graph.schedule(beta).blocked == []
+
+
+def test_deleting_tasks_and_projects_updates_the_graph(store):
+    a, b, c = (add_task(store, title) for title in "abc")
+    store.add_task_dependency(b, a)
+    store.add_task_dependency(c, b)
+
+    store.delete_task(b)
+    assert stored_edges(store) == set()
+    assert store.dependencies.blockers(c) == set()
+    assert not store.dependencies.is_blocked(c)
+
+    store.delete_project(store.keys.project_id("Alpha"))
+    assert set(store.dependencies.schedule(None).order) == {a, c}
+
+
+def test_reopening_the_store_restores_the_graph(store, tmp_path):
+    a, b, c = (add_task(store, title) for title in "abc")
+    store.add_task_dependency(a, c)
+    store.add_task_dependency(b, a)
+    expected = store.dependencies.schedule(store.keys.project_id("Alpha"))
+
+    reopened = WorkspaceStore(store.pool.path)
+    try:
+        schedule = reopened.dependencies.schedule(reopened.keys.project_id("Alpha"))
+        assert schedule.order == expected.order
+        assert schedule.critical_path == expected.critical_path == [c, a, b]
+        assert_order_respects_edges(reopened.dependencies)
+    finally:
+        reopened.close()
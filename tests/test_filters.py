@@ -0,0 +1,97 @@
+import itertools
+import random
+
+import pytest
+
+from tasksphere.filters import TASK_SORT_KEYS, TaskFilter
+from tasksphere.store import WorkspaceStore
+
+PROJECTS = ["Alpha", "Beta", "Gamma"]
+MEMBERS = ["Ana", "Ben"]
+STATUSES = ["Pending", "In Progress", "Completed"]
+PRIORITIES = ["High", "Medium", "Low"]
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    store = WorkspaceStore(str(tmp_path_factory.mktemp("filters") / "workspace.db"))
+    store.add_projects([{'name': name, 'status': 'Active'} for name in PROJECTS])
+    store.add_team_members([{'name': name, 'role': "Developer"} for name in MEMBERS])
+    rng = random.Random(3)
+    store.add_tasks([{
+        'title': f"Task {index}",
+        'project': rng.choice(PROJECTS),
+        'assignee': rng.choice(MEMBERS + [None]),
+        'status': rng.choice(STATUSES),
+        'priority': rng.choice(PRIORITIES),
+        'due_date': rng.choice([None, f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}"]),
+    } for index in range(120)])
+    yield store
+    store.close()
+
+
+def expected(store, task_filter):
+    def keep(task):
+        return ((not task_filter.projects or task['project'] in task_filter.projects)
+                and (not task_filter.assignees or task['assignee'] in task_filter.assignees)
+                and (not task_filter.statuses or task['status'] in task_filter.statuses)
+                and (not task_filter.priorities or task['priority'] in task_filter.priorities)
+                and (not task_filter.due_from or (task['due_date'] or '') >= task_filter.due_from)
+                and (not task_filter.due_to or (task['due_date'] is not None and task['due_date'] <= task_filter.due_to)))
+    return [task['id'] for task in store.list_tasks() if keep(task)]
+
+
+def test_where_clause_binds_every_value():
+    where, params = TaskFilter(projects=["Alpha", "Beta"], priorities=["High"], due_to="2024-05-01").where_clause()
+    assert where == "WHERE project IN (?, ?) AND priority IN (?) AND due_date <= ?"
+    assert params == ["Alpha", "Beta", "High", "2024-05-01"]
+    assert TaskFilter().where_clause() == ("", [])
+
+
+@pytest.mark.parametrize("projects, statuses, priorities, due_from", list(itertools.product(
+    [[], ["Alpha"], ["Alpha", "Gamma"]], [[], ["Completed"]], [[], ["High", "Low"]], [None, "2024-05-01"])))
+def test_lists_and_counts_match_a_brute_force_filter(store, projects, statuses, priorities, due_from):
+    task_filter = TaskFilter(projects=projects, statuses=statuses, priorities=priorities, due_from=due_from)
+    ids = expected(store, task_filter)
+    assert [task['id'] for task in store.list_tasks(task_filter=task_filter)] == ids
+    # Single-field filters are counted from the running aggregates, the rest in SQL
+    assert store.count_tasks(task_filter) == len(ids)
+
+
+def test_pages_slice_the_filtered_order(store):
+    task_filter = TaskFilter(assignees=["Ana"], sort_by='Title')
+    everything = [task['id'] for task in store.list_tasks(task_filter=task_filter)]
+    pages = [task['id'] for offset in range(0, len(everything), 7)
+             for task in store.list_tasks(limit=7, offset=offset, task_filter=task_filter)]
+    assert pages == everything
+
+
+def test_sort_keys(store):
+    by_due = store.list_tasks(task_filter=TaskFilter(sort_by='Due Date'))
+    dated = [task['due_date'] for task in by_due if task['due_date'] is not None]
+    assert dated == sorted(dated)
+    assert all(task['due_date'] is None for task in by_due[len(dated):])
+
+    by_priority = [task['priority'] for task in store.list_tasks(task_filter=TaskFilter(sort_by='Priority'))]
+    assert by_priority == sorted(by_priority, key=PRIORITIES.index)
+
+    newest = [task['id'] for task in store.list_tasks(task_filter=TaskFilter(sort_by='Newest'))]
+    assert newest == sorted(newest, reverse=True)
+    # Relevance without a search falls back to creation order
+    assert TaskFilter(sort_by='Relevance').order_clause() == "ORDER BY id"
+    assert set(TASK_SORT_KEYS) >= {'Oldest', 'Title', 'Status'}
+
+
+def test_unknown_sort_key_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.list_tasks(task_filter=TaskFilter(sort_by='id; DROP TABLE tasks'))
+
+
+def test_filtered_views_follow_writes(store):
+    task_id = store.add_task({'title': "Late addition", 'project': "Beta", 'status': 'Pending', 'priority': 'High'})
+    beta_high = TaskFilter(projects=["Beta"], priorities=["High"])
+    assert task_id in [task['id'] for task in store.list_tasks(task_filter=beta_high)]
+    store.update_task(task_id, {'priority': 'Low'})
+    assert task_id not in [task['id'] for task in store.list_tasks(task_filter=beta_high)]
+    assert store.count_tasks(beta_high) == len(expected(store, beta_high))
+    store.delete_task(task_id)
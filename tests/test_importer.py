@@ -0,0 +1,127 @@
+import io
+import json
+
+import pytest
+
+from tasksphere.importer import MAX_REPORTED_ERRORS, detect_format, import_file, import_stream
+from tasksphere.store import WorkspaceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    store.add_project({'name': "Alpha", 'status': 'Active'})
+    store.add_team_member({'name': "Ana", 'role': "Developer"})
+    yield store
+    store.close()
+
+
+def run(store, kind, text, fmt, **options):
+    data = text.encode() if isinstance(text, str) else text
+    return import_stream(store, kind, io.BytesIO(data), fmt, total_bytes=len(data), **options)
+
+
+def test_formats_follow_the_extension():
+    assert [detect_format(name) for name in ("a.CSV", "a.jsonl", "a.ndjson", "a.json")] == \
+        ['csv', 'jsonl', 'jsonl', 'json']
+    with pytest.raises(ValueError):
+        detect_format("a.xlsx")
+
+
+def test_records_are_validated_against_the_schema(store):
+    text = ("title,project,assignee,priority,due_date\n"
+            "Plan,Alpha,Ana,High,2024-03-01\n"
+            ",Alpha,Ana,High,\n"
+            "Build,Beta,Ana,Low,\n"
+            "Ship,Alpha,Ana,Urgent,\n"
+            "Test,Alpha,Ana,Low,31/03/2024\n")
+    result = run(store, 'tasks', text, 'csv')
+    assert (result.inserted, result.rejected, result.failure) == (1, 4, None)
+    assert result.errors == [
+        "record 2: 'title' is required",
+        "record 3: unknown project 'Beta'",
+        "record 4: 'priority' must be one of High, Medium, Low (got 'Urgent')",
+        "record 5: 'due_date' must be an ISO date like 2024-01-31 (got '31/03/2024')",
+    ]
+    task = store.list_tasks()[0]
+    assert (task['title'], task['status'], task['due_date']) == ("Plan", 'Pending', "2024-03-01")
+
+
+def test_records_are_inserted_in_batches(store):
+    lines = [json.dumps({'name': f"Member {index}", 'role': "Developer"}) for index in range(7)]
+    progress = []
+    result = run(store, 'team_members', "\n".join(lines) + "\n", 'jsonl', batch_size=3,
+                 on_progress=lambda current: progress.append(current.inserted))
+    assert progress == [3, 6, 7]
+    assert result.inserted == 7 and result.fraction == 1.0
+    assert store.stats.member_total == 8
+
+
+def test_bad_lines_and_duplicates_are_reported_and_skipped(store):
+    lines = ['{"name": "Beta"}', '{"name": ', '[1]', '{"name": "Alpha"}', '{"name": "Beta"}']
+    result = run(store, 'projects', "\n".join(lines), 'jsonl')
+    assert result.inserted == 1 and result.rejected == 4
+    assert result.errors == ["record 2: line 2: invalid JSON (Expecting value)",
+                             "record 3: line 3: expected a JSON object",
+                             "record 4: duplicate name 'Alpha'",
+                             "record 5: duplicate name 'Beta'"]
+
+    many = "\n".join(json.dumps({'name': ""}) for _ in range(MAX_REPORTED_ERRORS + 5))
+    result = run(store, 'projects', many, 'jsonl')
+    assert result.rejected == MAX_REPORTED_ERRORS + 5
+    assert len(result.errors) == MAX_REPORTED_ERRORS
+
+
+def test_names_taken_while_a_batch_is_inserted_are_rejected(store, monkeypatch):
+    add_projects = store.add_projects
+
+    def add_after_someone_else(projects):
+        # Another session creates "Gamma" between validation and insert
+        if store.keys.project_id("Gamma") is None:
+            store.add_project({'name': "Gamma", 'status': 'Active'})
+        return add_projects(projects)
+
+    monkeypatch.setattr(store, 'add_projects', add_after_someone_else)
+    result = run(store, 'projects', "name\nBeta\nGamma\nDelta\n", 'csv')
+    assert (result.inserted, result.rejected) == (2, 1)
+    assert result.errors == ["record 2: duplicate name 'Gamma'"]
+    assert sorted(store.project_names()) == ["Alpha", "Beta", "Delta", "Gamma"]
+
+
+def test_json_arrays_are_read_element_by_element(store, monkeypatch):
+    monkeypatch.setattr('tasksphere.importer.JSON_CHUNK_SIZE', 4)
+    records = [{'name': "Beta", 'budget': 1250.5}, 7, {'name': "Gamma", 'description': "Line one\nline two"}]
+    result = run(store, 'projects', json.dumps(records, indent=2), 'json', batch_size=1)
+    assert (result.inserted, result.rejected) == (2, 1)
+    assert result.errors == ["record 2: expected a JSON object"]
+    assert store.count_projects(search="line two") == 1
+
+
+@pytest.mark.parametrize("text, failure", [
+    ('{"name": "Beta"}', "expected a JSON array of objects"),
+    ('[{"name": "Beta"}, {"name": ', "element 2: invalid JSON (Expecting value)"),
+    ('[{"name": "Beta"} {"name": "Gamma"}]', "element 1: expected ',' or ']' after it"),
+])
+def test_malformed_json_arrays_stop_the_import(store, text, failure):
+    result = run(store, 'projects', text, 'json')
+    assert result.failure == failure
+    # Elements before the damage are still imported
+    assert result.inserted == (0 if text.startswith('{') else 1)
+
+
+def test_undecodable_files_stop_the_import_after_earlier_batches(store):
+    names = [f"Project {index}" for index in range(2000)]
+    data = "\n".join(["name", *names, "Café", "Omega"]).encode('cp1252')
+    result = run(store, 'projects', data, 'csv', batch_size=100)
+    assert result.failure.startswith("the file is not UTF-8 text")
+    # Text is decoded a block at a time, so the import stops at the block holding the bad byte
+    assert 0 < result.inserted < len(names) and result.rejected == 0
+    assert sorted(store.project_names()) == sorted(["Alpha", *names[:result.inserted]])
+
+
+def test_unparseable_csv_stops_the_import(store, tmp_path):
+    path = tmp_path / "projects.csv"
+    path.write_text("name,description\nBeta,short\nGamma," + "x" * 200_000 + "\n")
+    result = import_file(store, 'projects', str(path))
+    assert result.failure == "after line 2: field larger than field limit (131072)"
+    assert result.inserted == 1
@@ -0,0 +1,79 @@
+import pytest
+
+from tasksphere.rollups import ProjectRollup
+from tasksphere.store import WorkspaceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    store.add_projects([{'name': "Alpha", 'status': 'Active', 'progress': 40},
+                        {'name': "Beta", 'status': 'Active'}])
+    yield store
+    store.close()
+
+
+def project(store, name):
+    return next(project for project in store.list_projects() if project['name'] == name)
+
+
+def add_task(store, project_name, priority, status='Pending'):
+    return store.add_task({'title': f"{priority} task", 'project': project_name, 'priority': priority,
+                           'status': status})
+
+
+def test_progress_plain_and_weighted():
+    rollup = ProjectRollup()
+    rollup.load([(1, 'High', 'Completed', 1), (1, 'Low', 'Pending', 2), (2, 'Medium', 'Pending', 1),
+                 (None, 'High', 'Completed', 5)])
+    assert rollup.progress(1) == 33
+    assert rollup.progress(1, weighted=True) == 60
+    assert rollup.progress(2) == 0
+    assert rollup.progress(3) is None
+    assert rollup.task_count(1) == 3
+
+
+def test_a_project_without_tasks_keeps_its_stored_progress(store):
+    assert store.project_progress(project(store, "Alpha")) == 40
+    task_id = add_task(store, "Alpha", 'High')
+    assert store.project_progress(project(store, "Alpha")) == 0
+    store.delete_task(task_id)
+    assert store.project_progress(project(store, "Alpha")) == 40
+
+
+def test_writes_move_totals_between_projects(store):
+    high = add_task(store, "Alpha", 'High')
+    low = add_task(store, "Alpha", 'Low')
+    store.update_task(low, {'status': 'Completed'})
+    alpha = project(store, "Alpha")
+    assert store.project_progress(alpha) == 50
+    assert store.project_progress(alpha, weighted=True) == 25
+
+    store.update_task(high, {'project': "Beta"})
+    assert store.project_progress(project(store, "Alpha")) == 100
+    assert store.project_progress(project(store, "Beta")) == 0
+    assert store.rollup.task_count(alpha['id']) == 1
+
+
+def test_deleting_a_project_drops_its_totals(store):
+    add_task(store, "Beta", 'Medium', 'Completed')
+    beta = project(store, "Beta")
+    assert store.rollup.task_count(beta['id']) == 1
+    store.delete_project(beta['id'])
+    assert store.rollup.task_count(beta['id']) == 0
+    assert store.rollup.progress(beta['id']) is None
+
+
+def test_incremental_totals_match_a_fresh_load(store):
+    ids = [add_task(store, name, priority) for name in ("Alpha", "Beta") for priority in ('High', 'Medium', 'Low')]
+    store.update_task(ids[0], {'status': 'Completed'})
+    store.update_task(ids[4], {'status': 'Completed', 'priority': 'High'})
+    store.delete_task(ids[2])
+    reopened = WorkspaceStore(store.pool.path)
+    try:
+        for name in ("Alpha", "Beta"):
+            record = project(store, name)
+            for weighted in (False, True):
+                assert store.project_progress(record, weighted) == reopened.project_progress(record, weighted)
+    finally:
+        reopened.close()
@@ -0,0 +1,147 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from tasksphere.scheduler import OVERDUE, REMINDER, DueDateScheduler
+from tasksphere.store import WorkspaceStore
+
+DUE = date(2024, 3, 15)
+
+
+def start_of(day: date) -> float:
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+class Clock:
+    def __init__(self, day: date):
+        self.now = start_of(day) + 12 * 3600
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance_to(self, day: date, hour: int = 0):
+        self.now = start_of(day) + hour * 3600
+
+
+@pytest.fixture
+def clock():
+    return Clock(DUE - timedelta(days=5))
+
+
+@pytest.fixture
+def scheduler(clock):
+    return DueDateScheduler(clock=clock)
+
+
+def task(task_id, due=DUE, status="Pending", title="Write report"):
+    return {'id': task_id, 'title': title, 'assignee': "Ana", 'status': status, 'due_date': due.isoformat()}
+
+
+def kinds(notices):
+    return [(notice.kind, notice.task_id) for notice in notices]
+
+
+def test_reminder_then_overdue(scheduler, clock):
+    scheduler.task_added(task(1))
+    assert scheduler.next_fire_time() == start_of(DUE - timedelta(days=1))
+    assert scheduler.run_pending() == []
+
+    clock.advance_to(DUE - timedelta(days=1), hour=9)
+    assert kinds(scheduler.run_pending()) == [(REMINDER, 1)]
+    assert not scheduler.is_overdue(1)
+
+    clock.advance_to(DUE + timedelta(days=1))
+    assert kinds(scheduler.run_pending()) == [(OVERDUE, 1)]
+    assert scheduler.is_overdue(1)
+    assert scheduler.next_fire_time() is None
+
+
+def test_reminder_is_skipped_once_past_due(scheduler, clock):
+    scheduler.task_added(task(1))
+    clock.advance_to(DUE + timedelta(days=3))
+    assert kinds(scheduler.run_pending()) == [(OVERDUE, 1)]
+
+
+def test_load_marks_overdue_tasks_without_notices(clock):
+    scheduler = DueDateScheduler(clock=clock)
+    scheduler.load([task(1, due=DUE - timedelta(days=10)), task(2), task(3, status="Completed"),
+                    {**task(4), 'due_date': None}])
+    assert scheduler.is_overdue(1)
+    assert scheduler.overdue_count() == 1
+    assert scheduler.notices() == []
+    assert scheduler.next_fire_time() == start_of(DUE - timedelta(days=1))
+
+
+def test_rescheduling_makes_old_entries_stale(scheduler, clock):
+    scheduler.task_added(task(1))
+    later = DUE + timedelta(days=7)
+    scheduler.task_updated(task(1), task(1, due=later))
+    assert scheduler.next_fire_time() == start_of(later - timedelta(days=1))
+
+    # The old deadline's reminder and overdue entries pass without firing
+    clock.advance_to(DUE + timedelta(days=2))
+    assert scheduler.run_pending() == []
+    assert not scheduler.is_overdue(1)
+
+    clock.advance_to(later + timedelta(days=1))
+    assert kinds(scheduler.run_pending()) == [(OVERDUE, 1)]
+    assert scheduler.is_overdue(1)
+
+
+def test_completing_a_task_clears_it(scheduler, clock):
+    scheduler.task_added(task(1))
+    clock.advance_to(DUE + timedelta(days=1))
+    scheduler.run_pending()
+    assert scheduler.is_overdue(1)
+
+    scheduler.task_updated(task(1), task(1, status="Completed"))
+    assert not scheduler.is_overdue(1)
+    assert scheduler.notices() == []
+
+
+def test_same_deadline_keeps_overdue_mark_and_refreshes_labels(scheduler, clock):
+    scheduler.task_added(task(1))
+    clock.advance_to(DUE + timedelta(days=1))
+    scheduler.run_pending()
+
+    scheduler.task_updated(task(1), task(1, title="Write final report"))
+    assert scheduler.is_overdue(1)
+    assert scheduler.notices()[0].task_id == 1
+
+    scheduler.task_removed(task(1))
+    assert not scheduler.is_overdue(1)
+    assert scheduler.notices() == []
+
+
+def test_a_failing_callback_does_not_stop_the_others(scheduler, clock):
+    received = []
+
+    def broken(notice):
+        raise RuntimeError("boom")
+
+    scheduler.subscribe(broken)
+    scheduler.subscribe(received.append)
+    scheduler.task_added(task(1))
+    clock.advance_to(DUE - timedelta(days=1))
+    scheduler.run_pending()
+    assert kinds(received) == [(REMINDER, 1)]
+
+
+def test_from_store_follows_writes(tmp_path, clock):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    try:
+        overdue_id = store.add_task({'title': "Old", 'priority': 'Low', 'status': 'Pending', 'description': '',
+                                     'due_date': (DUE - timedelta(days=30)).isoformat()})
+        scheduler = DueDateScheduler.from_store(store, clock=clock)
+        assert scheduler.is_overdue(overdue_id)
+
+        task_id = store.add_task({'title': "New", 'priority': 'Low', 'status': 'Pending', 'description': '',
+                                  'due_date': DUE.isoformat()})
+        assert scheduler.next_fire_time() == start_of(DUE - timedelta(days=1))
+        store.update_task(overdue_id, {'status': 'Completed'})
+        assert not scheduler.is_overdue(overdue_id)
+
+        clock.advance_to(DUE + timedelta(days=1))
+        assert kinds(scheduler.run_pending()) == [(OVERDUE, task_id)]
+    finally:
+        store.close()
@@ -0,0 +1,70 @@
+import pytest
+
+from tasksphere.filters import TaskFilter
+from tasksphere.search import match_query
+from tasksphere.store import WorkspaceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    store.add_projects([
+        {'name': "Website Redesign", 'status': 'Active', 'description': "New landing pages"},
+        {'name': "Mobile App", 'status': 'Active', 'description': "Redesign of the onboarding"},
+    ])
+    yield store
+    store.close()
+
+
+def add_task(store, title, description='', **fields):
+    return store.add_task({'title': title, 'description': description, 'status': 'Pending',
+                           'priority': 'Medium', **fields})
+
+
+def search(store, text, **fields):
+    return [task['id'] for task in store.list_tasks(task_filter=TaskFilter(search=text, sort_by='Relevance', **fields))]
+
+
+def test_match_query_quotes_every_word_as_a_prefix():
+    assert match_query("Fix  login-BUG") == '"fix"* "login"* "bug"*'
+    assert match_query('say "hi" OR NEAR(x)') == '"say"* "hi"* "or"* "near"* "x"*'
+    assert match_query(" -- ") is None
+
+
+def test_every_word_must_match_as_a_prefix(store):
+    dashboard = add_task(store, "Build dashboard widgets")
+    add_task(store, "Build login page")
+    assert search(store, "dash") == [dashboard]
+    assert search(store, "build dash") == [dashboard]
+    assert search(store, "dash login") == []
+
+
+def test_title_hits_rank_above_description_hits(store):
+    in_description = add_task(store, "Write copy", "Needs the invoice template")
+    in_title = add_task(store, "Invoice template", "Write copy")
+    assert search(store, "invoice") == [in_title, in_description]
+    assert store.count_tasks(TaskFilter(search="invoice")) == 2
+
+
+def test_search_combines_with_filters(store):
+    add_task(store, "Release notes", project="Website Redesign")
+    mobile = add_task(store, "Release checklist", project="Mobile App")
+    assert search(store, "release", projects=["Mobile App"]) == [mobile]
+    assert store.count_tasks(TaskFilter(search="release", projects=["Mobile App"])) == 1
+
+
+def test_index_follows_updates_and_deletes(store):
+    task_id = add_task(store, "Migrate database")
+    store.update_task(task_id, {'title': "Archive logs"})
+    assert search(store, "migrate") == []
+    assert search(store, "archive") == [task_id]
+    store.delete_task(task_id)
+    assert search(store, "archive") == []
+
+
+def test_project_search_ranks_names_first(store):
+    names = [project['name'] for project in store.list_projects(search="redesign")]
+    assert names == ["Website Redesign", "Mobile App"]
+    assert store.count_projects(search="redesign") == 2
+    assert store.count_projects(search="landing") == 1
+    assert store.count_projects(search="") == store.count_projects() == 2
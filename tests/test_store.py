@@ -0,0 +1,122 @@
+import logging
+import random
+import threading
+
+import pytest
+
+from tasksphere.aggregates import TASK_GROUP_FIELDS
+from tasksphere.store import DuplicateNameError, StaleRecordError, WorkspaceStore
+
+PROJECTS = ["Alpha", "Beta", "Gamma"]
+MEMBERS = ["Ana", "Ben", "Cy"]
+STATUSES = ["Pending", "In Progress", "Completed"]
+PRIORITIES = ["High", "Medium", "Low"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    yield store
+    store.close()
+
+
+def test_inserts_leave_schema_defaults_to_missing_columns(store):
+    project_id = store.add_project({'name': "Alpha", 'status': 'Active'})
+    task_id = store.add_task({'title': "Plan", 'priority': 'Low', 'status': 'Pending'})
+    member_id = store.add_team_member({'name': "Ana", 'role': "Developer"})
+
+    project = store.get_project(project_id)
+    assert (project['description'], project['progress'], project['team_size'], project['budget']) == ('', 0, 1, 0)
+    assert store.get_task(task_id)['description'] == ''
+    member = store.get_team_member(member_id)
+    assert (member['email'], member['phone'], member['avatar']) == ('', '', '')
+    # The in-memory copies listeners received match the stored rows
+    with store.pool.connection() as conn:
+        stored = dict(conn.execute("SELECT * FROM projects WHERE id = ?", (project_id,)).fetchone())
+    assert stored == project
+
+
+def test_stale_update_and_delete_are_refused_and_change_nothing(store):
+    task_id = store.add_task({'title': "Plan", 'priority': 'Low', 'status': 'Pending'})
+    assert store.update_task(task_id, {'priority': 'High'}, expected_version=1)
+    task_version = store.stats.task_version
+
+    with pytest.raises(StaleRecordError) as raised:
+        store.update_task(task_id, {'status': 'Completed'}, expected_version=1)
+    assert (raised.value.expected_version, raised.value.current_version) == (1, 2)
+    with pytest.raises(StaleRecordError):
+        store.delete_task(task_id, expected_version=1)
+
+    task = store.get_task(task_id)
+    assert (task['priority'], task['status'], task['version']) == ('High', 'Pending', 2)
+    assert store.stats.task_version == task_version
+    assert store.stats.task_counts('status') == {'Pending': 1}
+    assert store.delete_task(task_id, expected_version=2)
+    assert not store.update_task(task_id, {'priority': 'Low'})
+
+
+def test_duplicate_names_are_refused(store):
+    store.add_project({'name': "Alpha", 'status': 'Active'})
+    beta = store.add_project({'name': "Beta", 'status': 'Active'})
+    with pytest.raises(DuplicateNameError):
+        store.add_project({'name': "Alpha", 'status': 'Active'})
+    with pytest.raises(DuplicateNameError):
+        store.update_project(beta, {'name': "Alpha"})
+    # A batch is one transaction, so nothing before the duplicate is kept either
+    with pytest.raises(DuplicateNameError):
+        store.add_projects([{'name': "Gamma", 'status': 'Active'}, {'name': "Beta", 'status': 'Active'}])
+    assert sorted(store.project_names()) == ["Alpha", "Beta"]
+    assert store.stats.project_total == store.count_projects() == 2
+
+
+def test_listener_views_stay_consistent_under_concurrent_writers(store, caplog):
+    store.add_projects([{'name': name, 'status': 'Active'} for name in PROJECTS])
+    store.add_team_members([{'name': name, 'role': "Developer"} for name in MEMBERS])
+    task_ids = store.add_tasks([{'title': f"Task {index}", 'priority': 'Medium', 'status': 'Pending',
+                                 'project': PROJECTS[index % 2], 'assignee': MEMBERS[index % 2]}
+                                for index in range(8)])
+
+    def writer(seed):
+        rng = random.Random(seed)
+        for _ in range(60):
+            task_id = rng.choice(task_ids)
+            task = store.get_task(task_id)
+            action = rng.random()
+            try:
+                if task is None or action < 0.15:
+                    store.add_task({'title': "Extra", 'priority': rng.choice(PRIORITIES), 'status': 'Pending',
+                                    'project': rng.choice(PROJECTS), 'assignee': rng.choice(MEMBERS)})
+                elif action < 0.25:
+                    store.delete_task(task_id, expected_version=task['version'])
+                elif action < 0.35:
+                    store.add_task_dependency(task_id, rng.choice(task_ids))
+                else:
+                    store.update_task(task_id, {'status': rng.choice(STATUSES), 'priority': rng.choice(PRIORITIES),
+                                                'project': rng.choice(PROJECTS), 'assignee': rng.choice(MEMBERS)},
+                                      expected_version=task['version'])
+            except (StaleRecordError, ValueError):
+                pass
+
+    threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Hooks applied out of commit order show up as listener failures, e.g. an update after a delete
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+
+    fresh = WorkspaceStore(store.pool.path)
+    try:
+        for field in TASK_GROUP_FIELDS:
+            assert store.stats.task_counts(field) == fresh.stats.task_counts(field), field
+        assert store.stats.task_total == fresh.stats.task_total
+        for project in store.list_projects():
+            assert store.project_progress(project, True) == fresh.project_progress(project, True)
+            assert store.dependencies.schedule(project['id']).length == \
+                fresh.dependencies.schedule(project['id']).length
+        assert store.workload.member_loads() == fresh.workload.member_loads()
+        for task in store.list_tasks():
+            assert store.dependencies.blockers(task['id']) == fresh.dependencies.blockers(task['id'])
+            assert store.dependencies.is_blocked(task['id']) == fresh.dependencies.is_blocked(task['id'])
+    finally:
+        fresh.close()
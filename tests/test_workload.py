@@ -0,0 +1,91 @@
+from datetime import date
+
+import pytest
+
+from tasksphere.store import WorkspaceStore
+from tasksphere.workload import DEFAULT_CAPACITY, ROLE_CAPACITY, WorkloadIndex
+
+TODAY = date(2024, 6, 10)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkspaceStore(str(tmp_path / "workspace.db"))
+    store.add_team_members([{'name': "Ana", 'role': "Developer"}, {'name': "Ben", 'role': "Developer"},
+                            {'name': "Cy", 'role': "Project Manager"}])
+    yield store
+    store.close()
+
+
+def member_id(store, name):
+    return next(member_id for member_id, member in store.keys.members.items() if member['name'] == name)
+
+
+def add_task(store, assignee, priority='Medium', status='Pending', due_date=None):
+    return store.add_task({'title': "Task", 'assignee': assignee, 'priority': priority, 'status': status,
+                           'due_date': due_date})
+
+
+def test_load_counts_open_tasks_and_due_dates(store):
+    ana = member_id(store, "Ana")
+    add_task(store, "Ana", 'High', due_date="2024-06-01")
+    add_task(store, "Ana", 'Low', 'In Progress', due_date="2024-06-12")
+    add_task(store, "Ana", 'Low', due_date="2024-07-30")
+    add_task(store, "Ana", 'High', 'Completed', due_date="2024-06-11")
+
+    load = store.workload.member_load(ana, TODAY)
+    assert (load.open_tasks, load.load, load.capacity) == (3, 5, DEFAULT_CAPACITY)
+    assert load.by_status == {'Pending': 2, 'In Progress': 1}
+    assert load.by_priority == {'High': 1, 'Low': 2}
+    assert (load.overdue, load.due_soon, load.next_due) == (1, 1, "2024-06-12")
+    assert load.utilization == 25.0
+
+
+def test_updates_move_load_between_members(store):
+    ana, ben = member_id(store, "Ana"), member_id(store, "Ben")
+    task_id = add_task(store, "Ana", 'High', due_date="2024-06-11")
+    store.update_task(task_id, {'assignee': "Ben"})
+    assert store.workload.member_load(ana, TODAY).open_tasks == 0
+    assert store.workload.member_load(ben, TODAY).due_soon == 1
+
+    store.update_task(task_id, {'status': 'Completed'})
+    ben_load = store.workload.member_load(ben, TODAY)
+    assert (ben_load.open_tasks, ben_load.load, ben_load.next_due) == (0, 0, None)
+
+
+def test_least_loaded_follows_utilisation_within_and_across_roles(store):
+    ana, ben, cy = member_id(store, "Ana"), member_id(store, "Ben"), member_id(store, "Cy")
+    add_task(store, "Ana", 'High')
+    assert store.workload.least_loaded("Developer") == ben
+    add_task(store, "Ben", 'High')
+    add_task(store, "Ben", 'Low')
+    assert store.workload.least_loaded("Developer") == ana
+    # Project managers carry half the capacity, so the same load weighs twice as much
+    add_task(store, "Cy", 'Medium')
+    assert ROLE_CAPACITY["Project Manager"] < DEFAULT_CAPACITY
+    assert store.workload.least_loaded() == ana
+    assert store.workload.member_load(cy).utilization == 20.0
+    assert store.workload.least_loaded("Designer") is None
+
+
+def test_removing_a_member_drops_their_load(store):
+    ana, ben = member_id(store, "Ana"), member_id(store, "Ben")
+    add_task(store, "Ben", 'High')
+    store.delete_team_member(ana)
+    assert store.workload.member_load(ana) is None
+    assert store.workload.least_loaded("Developer") == ben
+    store.delete_team_member(ben)
+    assert store.workload.least_loaded("Developer") is None
+
+
+def test_incremental_index_matches_a_fresh_load(store):
+    ids = [add_task(store, name, priority, due_date=f"2024-06-{day:02d}")
+           for day, (name, priority) in enumerate(
+               [(name, priority) for name in ("Ana", "Ben", "Cy") for priority in ('High', 'Low')], start=5)]
+    store.update_task(ids[0], {'status': 'Completed'})
+    store.update_task(ids[1], {'assignee': "Cy", 'due_date': "2024-06-30"})
+    store.delete_task(ids[3])
+
+    fresh = WorkloadIndex()
+    fresh.load(store.keys.members.values(), [task for task in store.list_tasks() if task['status'] != 'Completed'])
+    assert store.workload.member_loads(TODAY) == fresh.member_loads(TODAY)